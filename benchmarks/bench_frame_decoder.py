@@ -0,0 +1,104 @@
+"""Micro-benchmark: frame decoding, parse_frame + from_dict vs. the single-pass decoder.
+
+Run with:  python benchmarks/bench_frame_decoder.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import timeit
+import tracemalloc
+
+from civ6_bridge.decoder import decode_frame
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.log_parser import parse_frame
+
+
+def build_late_game_frame(players: int, cities: int, units: int, seed: int = 0) -> str:
+    """A frame as the mod writes it (sorted keys, compact) for a late game of the given size."""
+    rng = random.Random(seed)
+    data = {
+        "players": [
+            {
+                "civilization": f"CIVILIZATION_{pid}",
+                "cities": [
+                    {
+                        "buildings": rng.sample([f"BUILDING_{i}" for i in range(40)], 12),
+                        "districts": rng.sample([f"DISTRICT_{i}" for i in range(12)], 5),
+                        "id": pid * 65536 + c,
+                        "name": f"City {pid}-{c}",
+                        "owner_id": pid,
+                        "population": rng.randint(1, 30),
+                        "x": rng.randrange(100),
+                        "y": rng.randrange(60),
+                    }
+                    for c in range(cities)
+                ],
+                "culture": {"progressing_civic": "CIVIC_GLOBALIZATION"},
+                "id": pid,
+                "is_alive": True,
+                "is_human": pid == 0,
+                "leader": f"LEADER_{pid}",
+                "religion": {"faith_balance": rng.randint(0, 2000), "faith_yield": 14.5},
+                "science": {"progressing_tech": "TECH_ROBOTICS", "science_yield": 180.5},
+                "treasury": {"gold_balance": rng.randint(0, 5000), "gold_yield": 61.5, "total_maintenance": 40},
+                "units": [
+                    {
+                        "base_moves": 2,
+                        "combat": rng.choice([0, 65, 70, 85]),
+                        "id": pid * 65536 + u,
+                        "max_moves": 2,
+                        "moves_remaining": rng.randint(0, 2),
+                        "name": "Unit",
+                        "owner_id": pid,
+                        "range": 0,
+                        "ranged_combat": 0,
+                        "type": rng.choice(["UNIT_INFANTRY", "UNIT_ARTILLERY", "UNIT_TANK", "UNIT_BUILDER"]),
+                        "x": rng.randrange(100),
+                        "y": rng.randrange(60),
+                    }
+                    for u in range(units)
+                ],
+            }
+            for pid in range(players)
+        ],
+        "turn": 300,
+        "version": 1,
+    }
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _bench(label: str, fn, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<34} {seconds * 1e3:9.3f} ms")
+    return seconds
+
+
+def _peak(label: str, fn) -> int:
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"  {label:<34} {peak / 1024:9.0f} KiB peak")
+    return peak
+
+
+def main() -> None:
+    for players, cities, units in ((8, 10, 40), (12, 20, 80), (20, 30, 150)):
+        raw = build_late_game_frame(players, cities, units)
+        assert decode_frame(raw) == from_dict(parse_frame(raw))
+        print(f"{players} players x {cities} cities x {units} units, {len(raw) / 1024:.0f} KiB")
+        number = max(1, 200_000 // len(raw))
+        old = _bench("parse_frame + from_dict", lambda raw=raw: from_dict(parse_frame(raw)), number)
+        new = _bench("decode_frame", lambda raw=raw: decode_frame(raw), number)
+        _bench("json.loads only", lambda raw=raw: json.loads(raw), number)
+        print(f"  speed-up: {old / new:.2f}x")
+        old = _peak("parse_frame + from_dict", lambda raw=raw: from_dict(parse_frame(raw)))
+        new = _peak("decode_frame", lambda raw=raw: decode_frame(raw))
+        print(f"  peak memory: {new / old:.0%} of from_dict\n")
+
+
+if __name__ == "__main__":
+    main()
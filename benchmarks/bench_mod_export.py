@@ -0,0 +1,52 @@
+"""Benchmark: the mod's ExportGameState() per game size, run headless against the mock Civ6 API.
+
+Run with:  python benchmarks/bench_mod_export.py [--turns 10] [--keyframe-interval 1]
+
+Needs lupa (pip install 'civ6-bridge[test]'). Times are for the Lua runtime lupa
+ships, not the game's, so compare them with each other rather than with in-game
+export timings. Every frame is also checked to decode back to the mock's state.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# The harness lives with the tests, at the root of the checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.mod_harness import measure_export  # noqa: E402
+
+# name: (players, cities, units)
+SIZES = {
+    "early": (4, 3, 10),
+    "mid": (8, 8, 30),
+    "late": (8, 15, 60),
+    "huge": (12, 30, 150),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10, help="turns exported per size")
+    parser.add_argument("--keyframe-interval", type=int, default=1, help="CIV6BRIDGE_KEYFRAME_INTERVAL of the mod")
+    args = parser.parse_args()
+
+    print(f"{'size':<8} {'players x cities x units':>24} {'mean ms':>9} {'max ms':>9} {'frame KiB':>10}")
+    ok = True
+    for name, (players, cities, units) in SIZES.items():
+        m = measure_export(players, cities, units, turns=args.turns, keyframe_interval=args.keyframe_interval)
+        shape = f"{players} x {cities} x {units}"
+        print(
+            f"{name:<8} {shape:>24} {m.mean_seconds * 1e3:9.2f} {m.max_seconds * 1e3:9.2f} "
+            f"{m.mean_frame_bytes / 1024:10.1f}"
+        )
+        if m.mismatched:
+            ok = False
+            print(f"  frames of turns {', '.join(map(str, m.mismatched))} did not decode to the mock's state")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
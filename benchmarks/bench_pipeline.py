@@ -0,0 +1,198 @@
+"""Benchmark suite for the log parsing pipeline, on synthetic logs of increasing size.
+
+Run with:  python benchmarks/bench_pipeline.py [--quick] [--output results.json] [--compare baseline.json]
+
+Covers extract_frames, parse_frame, from_dict, read_latest, and the latency from
+appending a frame to the log until LogWatcher.watch() yields it. Results are written
+as JSON (by default to benchmarks/results/<version>-<timestamp>.json); --compare
+prints the ratio of every result to a previous run and exits with status 1 if any
+got slower than --threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.log_parser import extract_frames, parse_frame
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.synthetic import format_frame, generate_log, generate_states
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# name: (players, cities, units, turns)
+SCENARIOS = {
+    "early": (4, 3, 10, 100),
+    "late": (8, 15, 60, 100),
+    "huge": (12, 30, 150, 50),
+}
+
+
+def _timed(fn, repeat: int) -> dict:
+    """Seconds per call of ``fn``: best and median of ``repeat`` rounds."""
+    number = 1
+    while timeit.timeit(fn, number=number) < 0.05 and number < 10_000:
+        number *= 4
+    rounds = [t / number for t in timeit.repeat(fn, number=number, repeat=repeat)]
+    return {"best": min(rounds), "median": statistics.median(rounds)}
+
+
+def _watch_latency(log: Path, frames: list[str], backend: str) -> dict:
+    """Seconds from appending a frame to watch() yielding it."""
+    watcher = LogWatcher(log)
+    received = threading.Event()
+    stop = threading.Event()
+    yielded_at: list[float] = []
+
+    def run() -> None:
+        for _state in watcher.watch(poll_interval=1.0, backend=backend):
+            yielded_at.append(time.perf_counter())
+            received.set()
+            if stop.is_set():
+                return
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(0.2)  # let the watcher reach the end of the log
+    latencies = []
+    with open(log, "a", encoding="utf-8") as f:
+        for frame in frames:
+            received.clear()
+            # Idle long enough for the polling backend to back off, as between real turns
+            time.sleep(0.3)
+            start = time.perf_counter()
+            f.write(frame)
+            f.flush()
+            if not received.wait(5):
+                raise RuntimeError(f"watch() did not yield a frame within 5 s ({backend})")
+            latencies.append(yielded_at[-1] - start)
+        stop.set()
+        f.write(frames[-1])
+    thread.join(5)
+    return {"best": min(latencies), "median": statistics.median(latencies), "p95": _p95(latencies)}
+
+
+def _p95(values: list[float]) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * 0.95))]
+
+
+def run(quick: bool) -> list[dict]:
+    repeat = 3 if quick else 7
+    results: list[dict] = []
+
+    def record(name: str, scenario: str, timing: dict, **extra: object) -> None:
+        results.append({"name": name, "scenario": scenario, "unit": "s", **timing, **extra})
+        print(f"  {name:<28} {timing['median'] * 1e3:10.3f} ms  (best {timing['best'] * 1e3:.3f})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scenario, (players, cities, units, turns) in SCENARIOS.items():
+            if quick:
+                turns = max(5, turns // 5)
+            log = Path(tmp) / f"{scenario}.log"
+            size = generate_log(log, players, cities, units, turns, noise_lines=50)
+            text = log.read_text(encoding="utf-8")
+            raw = extract_frames(text)[-1]
+            data = parse_frame(raw)
+            print(
+                f"{scenario}: {players} players x {cities} cities x {units} units, {turns} turns, "
+                f"{size / 1e6:.1f} MB log, {len(raw) / 1024:.0f} KiB frame"
+            )
+
+            record("extract_frames", scenario, _timed(lambda text=text: extract_frames(text), repeat), bytes=size)
+            record("parse_frame", scenario, _timed(lambda raw=raw: parse_frame(raw), repeat), bytes=len(raw))
+            record("from_dict", scenario, _timed(lambda data=data: from_dict(data), repeat))
+            record("read_latest", scenario, _timed(lambda log=log: LogWatcher(log).read_latest(), repeat), bytes=size)
+
+        log = Path(tmp) / "watch.log"
+        generate_log(log, *SCENARIOS["late"][:3], turns=1)
+        frames = [format_frame(d) for d in generate_states(*SCENARIOS["late"][:3], turns=5 if quick else 15)]
+        for backend in ("poll", "auto"):
+            record(f"watch_latency[{backend}]", "late", _watch_latency(log, frames, backend))
+    return results
+
+
+def _version() -> str:
+    try:
+        return version("civ6-bridge")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> bool:
+    """Print each result against ``baseline``; return True if none is slower than ``threshold`` times.
+
+    Compares the best round of each benchmark, which varies least between runs.
+    """
+    old = {(r["name"], r["scenario"]): r["best"] for r in baseline["results"]}
+    ok = True
+    print(f"\nCompared with {baseline.get('version')} ({baseline.get('commit')}, {baseline.get('timestamp')}):")
+    if baseline.get("quick") != report["quick"]:
+        print("  warning: one run used --quick and the other did not; log sizes differ")
+    for r in report["results"]:
+        before = old.get((r["name"], r["scenario"]))
+        if before is None:
+            continue
+        ratio = r["best"] / before
+        flag = ""
+        if ratio > threshold:
+            flag, ok = "  REGRESSION", False
+        print(f"  {r['name']:<28} {r['scenario']:<6} {ratio:6.2f}x{flag}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller logs and fewer rounds")
+    parser.add_argument("--output", type=Path, help="where to write the JSON results")
+    parser.add_argument("--compare", type=Path, help="JSON results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    results = run(args.quick)
+    report = {
+        "version": _version(),
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f"{report['version']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if not compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
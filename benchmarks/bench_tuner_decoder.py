@@ -0,0 +1,80 @@
+"""Micro-benchmark: FireTuner response decoding, legacy vs. byte-level decoder.
+
+Run with:  python benchmarks/bench_tuner_decoder.py
+"""
+
+from __future__ import annotations
+
+import struct
+import timeit
+
+from civ6_bridge.constants import RESULT_BEGIN, RESULT_END
+from civ6_bridge.tuner_client import ResponseDecoder, parse_response, parse_results
+
+
+def legacy_parse_response(data: bytes) -> str:
+    """parse_response as it was before the byte-level decoder (first result only)."""
+    text = "".join(chr(b) for b in data if 32 <= b < 127)
+    begin_idx = text.find(RESULT_BEGIN)
+    end_idx = text.find(RESULT_END)
+    if begin_idx == -1 or end_idx == -1:
+        return text
+    return text[begin_idx + len(RESULT_BEGIN) : end_idx]
+
+
+def legacy_parse_results(data: bytes) -> list[str]:
+    """All results with the legacy approach: decode char by char, then repeated find."""
+    text = "".join(chr(b) for b in data if 32 <= b < 127)
+    results, start = [], 0
+    while (begin_idx := text.find(RESULT_BEGIN, start)) != -1:
+        end_idx = text.find(RESULT_END, begin_idx)
+        if end_idx == -1:
+            break
+        results.append(text[begin_idx + len(RESULT_BEGIN) : end_idx])
+        start = end_idx + len(RESULT_END)
+    return results
+
+
+def build_bulk_response(results: int, noise_per_result: int = 64) -> bytes:
+    """A framed reply carrying ``results`` batched results with log noise in between."""
+    out = bytearray()
+    for i in range(results):
+        payload = b"O:" + b"\x01noise " * (noise_per_result // 7)
+        payload += f"{RESULT_BEGIN}#{i}:OK:move_unit{RESULT_END}\n\x00".encode()
+        out += struct.pack("<II", len(payload), 1) + payload
+    return bytes(out)
+
+
+def _bench(label: str, fn, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<34} {seconds * 1e3:9.3f} ms")
+    return seconds
+
+
+def main() -> None:
+    single = b"\x00\x01some junk " + f"{RESULT_BEGIN}PONG{RESULT_END}".encode() + b" more junk"
+    print("single result (parse_response)")
+    old = _bench("legacy", lambda: legacy_parse_response(single), 20000)
+    new = _bench("translate", lambda: parse_response(single), 20000)
+    print(f"  speed-up: {old / new:.1f}x\n")
+
+    for count in (100, 1000, 10000):
+        data = build_bulk_response(count)
+        assert legacy_parse_results(data) == parse_results(data) == ResponseDecoder().feed(data)
+        print(f"bulk response: {count} results, {len(data) / 1024:.0f} KiB")
+        number = max(1, 2000 // count)
+        old = _bench("legacy (all results)", lambda data=data: legacy_parse_results(data), number)
+        _bench("parse_results (unframed)", lambda data=data: parse_results(data), number)
+        new = _bench("ResponseDecoder (framed, 4 KiB)", lambda data=data: _feed_in_chunks(data, 4096), number)
+        print(f"  speed-up: {old / new:.1f}x\n")
+
+
+def _feed_in_chunks(data: bytes, size: int) -> int:
+    decoder = ResponseDecoder()
+    for i in range(0, len(data), size):
+        decoder.feed(data[i : i + size])
+    return decoder.count
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,17 @@
 -- Each function is registered on the Game object so it can be invoked
 -- from Python as: GameCore.Game.AgentXxx(...)
 
+include("utils")
+
+-- Correlation id of the batched call currently running (see AgentCall), or nil.
+local current_call_id = nil
+
 --- Wrap a result string with sentinels for Python-side extraction.
+-- Inside a batch the result is tagged with the call's id: CIV6BRIDGE_RESULT:#<id>:...
 local function wrap_result(str)
+    if current_call_id ~= nil then
+        return "CIV6BRIDGE_RESULT:#" .. current_call_id .. ":" .. str .. ":CIV6BRIDGE_END"
+    end
     return "CIV6BRIDGE_RESULT:" .. str .. ":CIV6BRIDGE_END"
 end
 
@@ -87,13 +96,7 @@ function AgentResearchTech(playerID, techType)
     end
 
     local pTechs = pPlayer:GetTechs()
-    local techIndex = nil
-    for row in GameInfo.Technologies() do
-        if row.Type == techType then
-            techIndex = row.Index
-            break
-        end
-    end
+    local techIndex = utils.get_type_index(GameInfo.Technologies, techType, "TechnologyType")
 
     if techIndex == nil then
         print(wrap_result("ERR:unknown tech " .. tostring(techType)))
@@ -118,13 +121,7 @@ function AgentProduceUnit(cityID, playerID, unitType)
         return
     end
 
-    local unitIndex = nil
-    for row in GameInfo.Units() do
-        if row.UnitType == unitType then
-            unitIndex = row.Index
-            break
-        end
-    end
+    local unitIndex = utils.get_type_index(GameInfo.Units, unitType, "UnitType")
 
     if unitIndex == nil then
         print(wrap_result("ERR:unknown unit type " .. tostring(unitType)))
@@ -140,6 +137,17 @@ function AgentPing()
     print(wrap_result("PONG"))
 end
 
+--- Run one call of a batch under pcall, tagging its result with callID.
+-- A Lua error in fn is reported as that call's ERR result and does not stop the batch.
+function AgentCall(callID, fn, ...)
+    current_call_id = callID
+    local ok, err = pcall(fn, ...)
+    if not ok then
+        print(wrap_result("ERR:" .. tostring(err)))
+    end
+    current_call_id = nil
+end
+
 -- Register functions on the Game object for FireTuner access
 Game.AgentMoveUnit    = AgentMoveUnit
 Game.AgentEndTurn     = AgentEndTurn
@@ -148,5 +156,6 @@ Game.AgentAddGold     = AgentAddGold
 Game.AgentResearchTech = AgentResearchTech
 Game.AgentProduceUnit = AgentProduceUnit
 Game.AgentPing        = AgentPing
+Game.AgentCall        = AgentCall
 
 print("[civ6-bridge] Agent commands registered.")
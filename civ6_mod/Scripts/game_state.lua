@@ -8,7 +8,39 @@ include("utils")
 local SENTINEL_BEGIN = "[CIV6BRIDGE_BEGIN_v1]"
 local SENTINEL_END   = "[CIV6BRIDGE_END_v1]"
 
+-- Emit a full keyframe every N turns and, in between, delta frames holding only the
+-- players, cities and units that changed since that keyframe. 1 disables deltas.
+CIV6BRIDGE_KEYFRAME_INTERVAL = CIV6BRIDGE_KEYFRAME_INTERVAL or 1
+
+-- Full state table of the last keyframe printed, or nil
+local last_keyframe = nil
+
+-- Building indexes by the district type they need ("" for none), built on first use
+local buildings_by_district = nil
+-- Base district of each unique district (DISTRICT_ACROPOLIS -> DISTRICT_THEATER)
+local district_replaces = nil
+
+local function load_building_tables()
+    buildings_by_district, district_replaces = {}, {}
+    for row in GameInfo.Buildings() do
+        local district = row.PrereqDistrict or ""
+        local indexes = buildings_by_district[district]
+        if indexes == nil then
+            indexes = {}
+            buildings_by_district[district] = indexes
+        end
+        indexes[#indexes + 1] = row.Index
+    end
+    if GameInfo.DistrictReplaces then
+        for row in GameInfo.DistrictReplaces() do
+            district_replaces[row.CivUniqueDistrictType] = row.ReplacesDistrictType
+        end
+    end
+end
+
 --- Build a city data table from a pCity object.
+-- Only the buildings of the city's districts (and those needing no district) are
+-- checked, rather than the whole GameInfo.Buildings catalogue.
 local function export_city(pCity, owner_id)
     local city_data = {
         id         = pCity:GetID(),
@@ -20,62 +52,81 @@ local function export_city(pCity, owner_id)
         buildings  = {},
         districts  = {},
     }
-
-    -- Collect buildings
-    local pBuildings = pCity:GetBuildings()
-    if pBuildings then
-        for row in GameInfo.Buildings() do
-            if pBuildings:HasBuilding(row.Index) then
-                city_data.buildings[#city_data.buildings + 1] = row.BuildingType
-            end
-        end
+    if buildings_by_district == nil then
+        load_building_tables()
     end
 
-    -- Collect districts
+    -- Collect districts, and which district types' buildings the city can have
+    local building_districts = { [""] = true }
     local pDistricts = pCity:GetDistricts()
     if pDistricts then
         for _, pDistrict in pDistricts:Members() do
-            local district_type = utils.get_type_name(GameInfo.Districts, pDistrict:GetType())
+            local district_type = utils.get_type_name(GameInfo.Districts, pDistrict:GetType(), "DistrictType")
             city_data.districts[#city_data.districts + 1] = district_type
+            building_districts[district_replaces[district_type] or district_type] = true
+        end
+    end
+
+    -- Collect buildings, in GameInfo order
+    local pBuildings = pCity:GetBuildings()
+    if pBuildings then
+        local found = {}
+        for district in pairs(building_districts) do
+            for _, index in ipairs(buildings_by_district[district] or {}) do
+                if pBuildings:HasBuilding(index) then
+                    found[#found + 1] = index
+                end
+            end
+        end
+        table.sort(found)
+        local names = utils.type_lookup(GameInfo.Buildings, "BuildingType").names
+        for i, index in ipairs(found) do
+            city_data.buildings[i] = names[index]
         end
     end
 
     return city_data
 end
 
---- Build a unit data table from a pUnit object.
-local function export_unit(pUnit, owner_id)
-    local unit_type_id = pUnit:GetType()
-    local unit_info = GameInfo.Units[unit_type_id]
-    local unit_type = "UNKNOWN"
-    local unit_name = "Unknown"
-    local base_combat = 0
-    local ranged_combat = 0
-    local unit_range = 0
-    local base_moves = 2
-
-    if unit_info then
-        unit_type    = unit_info.UnitType or "UNKNOWN"
-        unit_name    = unit_info.Name or "Unknown"
-        base_combat  = unit_info.Combat or 0
-        ranged_combat = unit_info.RangedCombat or 0
-        unit_range   = unit_info.Range or 0
-        base_moves   = unit_info.BaseMoves or 2
+-- Static fields of each unit type, by type index, filled on first use
+local unit_types = {}
+
+local function unit_type_info(unit_type_id)
+    local info = unit_type_id ~= nil and unit_types[unit_type_id]
+    if info then
+        return info
+    end
+    local row = unit_type_id ~= nil and GameInfo.Units[unit_type_id] or nil
+    info = {
+        type          = row and row.UnitType or "UNKNOWN",
+        name          = row and row.Name or "Unknown",
+        combat        = row and row.Combat or 0,
+        ranged_combat = row and row.RangedCombat or 0,
+        range         = row and row.Range or 0,
+        base_moves    = row and row.BaseMoves or 2,
+    }
+    if unit_type_id ~= nil then
+        unit_types[unit_type_id] = info
     end
+    return info
+end
 
+--- Build a unit data table from a pUnit object.
+local function export_unit(pUnit, owner_id)
+    local info = unit_type_info(pUnit:GetType())
     return {
         id              = pUnit:GetID(),
-        type            = unit_type,
-        name            = unit_name,
+        type            = info.type,
+        name            = info.name,
         x               = pUnit:GetX(),
         y               = pUnit:GetY(),
         owner_id        = owner_id,
         moves_remaining = pUnit:GetMovesRemaining(),
         max_moves       = pUnit:GetMaxMoves(),
-        combat          = base_combat,
-        ranged_combat   = ranged_combat,
-        range           = unit_range,
-        base_moves      = base_moves,
+        combat          = info.combat,
+        ranged_combat   = info.ranged_combat,
+        range           = info.range,
+        base_moves      = info.base_moves,
     }
 end
 
@@ -120,7 +171,7 @@ local function export_player(player_id)
         local civic_id = utils.safe_get(pCulture, "GetProgressingCivic")
         local civic_name = ""
         if civic_id and civic_id >= 0 then
-            civic_name = utils.get_type_name(GameInfo.Civics, civic_id)
+            civic_name = utils.get_type_name(GameInfo.Civics, civic_id, "CivicType")
         end
         player_data.culture = { progressing_civic = civic_name }
     else
@@ -144,7 +195,7 @@ local function export_player(player_id)
         local tech_id = utils.safe_get(pTechs, "GetResearchingTech")
         local tech_name = ""
         if tech_id and tech_id >= 0 then
-            tech_name = utils.get_type_name(GameInfo.Technologies, tech_id)
+            tech_name = utils.get_type_name(GameInfo.Technologies, tech_id, "TechnologyType")
         end
         player_data.science = {
             progressing_tech = tech_name,
@@ -175,8 +226,110 @@ local function export_player(player_id)
     return player_data
 end
 
---- Export the full game state as sentinel-delimited JSON via print().
-function ExportGameState()
+--- Compare two JSON-like values structurally.
+local function deep_equal(a, b)
+    if a == b then
+        return true
+    end
+    if type(a) ~= "table" or type(b) ~= "table" then
+        return false
+    end
+    for k, v in pairs(a) do
+        if not deep_equal(v, b[k]) then
+            return false
+        end
+    end
+    for k, _ in pairs(b) do
+        if a[k] == nil then
+            return false
+        end
+    end
+    return true
+end
+
+local function whole(_, after)
+    return after
+end
+
+--- Delta between two id-keyed entity lists: { upsert = {...}, removed = {ids}, order = {ids} }.
+-- Keys are left out when empty; same format as civ6_bridge.delta on the Python side.
+local function diff_entities(old_list, new_list, diff_entity)
+    local old_by_id = {}
+    for _, entity in ipairs(old_list) do
+        old_by_id[entity.id] = entity
+    end
+    local new_ids, seen, upsert = {}, {}, {}
+    for i, entity in ipairs(new_list) do
+        new_ids[i] = entity.id
+        seen[entity.id] = true
+        local before = old_by_id[entity.id]
+        if before == nil then
+            upsert[#upsert + 1] = entity
+        elseif not deep_equal(before, entity) then
+            upsert[#upsert + 1] = diff_entity(before, entity)
+        end
+    end
+    local removed, default_order = {}, {}
+    for _, entity in ipairs(old_list) do
+        if seen[entity.id] then
+            default_order[#default_order + 1] = entity.id
+        else
+            removed[#removed + 1] = entity.id
+        end
+    end
+    for _, id in ipairs(new_ids) do
+        if old_by_id[id] == nil then
+            default_order[#default_order + 1] = id
+        end
+    end
+
+    local delta = {}
+    if #upsert > 0 then
+        delta.upsert = upsert
+    end
+    if #removed > 0 then
+        delta.removed = removed
+    end
+    for i = 1, #new_ids do
+        if new_ids[i] ~= default_order[i] then
+            delta.order = new_ids
+            break
+        end
+    end
+    return delta
+end
+
+local function diff_player(before, after)
+    local delta = { id = after.id }
+    for key, value in pairs(after) do
+        if key == "cities" or key == "units" then
+            local changes = diff_entities(before[key] or {}, value, whole)
+            if next(changes) ~= nil then
+                delta[key] = changes
+            end
+        elseif not deep_equal(before[key], value) then
+            delta[key] = value
+        end
+    end
+    return delta
+end
+
+--- Build a delta frame turning the keyframe `base` into `state`.
+local function make_delta_frame(base, state)
+    local players = diff_entities(base.players, state.players, diff_player)
+    -- An empty table would encode as [], which means "replace with nothing"
+    players.removed = players.removed or {}
+    return {
+        kind      = "delta",
+        base_turn = base.turn,
+        version   = state.version,
+        turn      = state.turn,
+        players   = players,
+    }
+end
+
+--- Collect the full game state into a table.
+local function build_state()
     local state = {
         version = 1,
         turn    = Game.GetCurrentGameTurn(),
@@ -190,8 +343,39 @@ function ExportGameState()
             state.players[#state.players + 1] = player_data
         end
     end
+    return state
+end
+
+--- Export the game state as sentinel-delimited JSON via print().
+-- Prints a keyframe or, between keyframes, a delta frame (see CIV6BRIDGE_KEYFRAME_INTERVAL).
+-- The frame ends with an "export" object timing this call: "started" and "finished"
+-- (Unix time, see utils.now) and the seconds spent in "build_seconds" collecting the
+-- state and "serialize_seconds" encoding it. It is spliced in after encoding, so that
+-- "finished" covers the encoding too; the Python side reads it as FrameMeta.
+function ExportGameState()
+    local started = utils.now()
+    local clock_start = os and os.clock and os.clock()
+    local state = build_state()
+    local built = clock_start and os.clock()
+    local frame = state
+    local base = last_keyframe
+    if CIV6BRIDGE_KEYFRAME_INTERVAL > 1 and base ~= nil
+        and state.turn >= base.turn and state.turn - base.turn < CIV6BRIDGE_KEYFRAME_INTERVAL then
+        frame = make_delta_frame(base, state)
+    else
+        last_keyframe = state
+    end
 
-    local json_str = json.encode(state)
+    local json_str = json.encode(frame)
+    if started ~= nil and clock_start then
+        local export = {
+            started           = started,
+            build_seconds     = built - clock_start,
+            serialize_seconds = os.clock() - built,
+        }
+        export.finished = utils.now()
+        json_str = json_str:sub(1, -2) .. ',"export":' .. json.encode(export) .. "}"
+    end
     print(SENTINEL_BEGIN)
     print(json_str)
     print(SENTINEL_END)
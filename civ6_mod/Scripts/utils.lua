@@ -3,7 +3,12 @@
 
 local utils = {}
 
+local function call_method(obj, method)
+    return obj[method](obj)
+end
+
 --- Safely call a method on an object, returning nil on failure.
+-- pcall runs the shared call_method, so no closure is created per call.
 -- @param obj  The object to call the method on.
 -- @param method  The method name (string).
 -- @return The result of obj:method(), or nil if the call fails.
@@ -11,29 +16,85 @@ function utils.safe_get(obj, method)
     if obj == nil then
         return nil
     end
-    local ok, result = pcall(function()
-        return obj[method](obj)
-    end)
+    local ok, result = pcall(call_method, obj, method)
     if ok then
         return result
     end
     return nil
 end
 
+-- Lookup tables built by utils.type_lookup, keyed by GameInfo table and column
+local lookups = {}
+
+--- Lookup tables between the row indexes and type names of a GameInfo table.
+-- Walks the table once; later calls return the cached tables.
+-- @param info_table  A GameInfo table (e.g. GameInfo.Units).
+-- @param column  The column holding the type name (e.g. "UnitType"); rows without it use row.Type.
+-- @return { names = {[index] = type}, indexes = {[type] = index} }
+function utils.type_lookup(info_table, column)
+    local by_column = lookups[info_table]
+    if by_column == nil then
+        by_column = {}
+        lookups[info_table] = by_column
+    end
+    local key = column or "Type"
+    local lookup = by_column[key]
+    if lookup == nil then
+        lookup = { names = {}, indexes = {} }
+        for row in info_table() do
+            local name = row[key] or row.Type
+            if name ~= nil then
+                lookup.names[row.Index] = name
+                lookup.indexes[name] = row.Index
+            end
+        end
+        by_column[key] = lookup
+    end
+    return lookup
+end
+
 --- Look up a type name from a GameInfo table by type ID.
 -- @param info_table  A GameInfo table (e.g. GameInfo.Units).
 -- @param type_id  The integer type ID.
+-- @param column  The column holding the type name (e.g. "UnitType"); defaults to "Type".
 -- @return The Type string (e.g. "UNIT_WARRIOR"), or "UNKNOWN".
-function utils.get_type_name(info_table, type_id)
+function utils.get_type_name(info_table, type_id, column)
     if info_table == nil or type_id == nil then
         return "UNKNOWN"
     end
-    for row in info_table() do
-        if row.Index == type_id then
-            return row.Type or "UNKNOWN"
-        end
+    return utils.type_lookup(info_table, column).names[type_id] or "UNKNOWN"
+end
+
+--- Look up the row index of a type name in a GameInfo table.
+-- @param info_table  A GameInfo table (e.g. GameInfo.Technologies).
+-- @param type_name  The type name (e.g. "TECH_POTTERY").
+-- @param column  The column holding the type name (e.g. "TechnologyType"); defaults to "Type".
+-- @return The row index, or nil if there is no such type.
+function utils.get_type_index(info_table, type_name, column)
+    if info_table == nil or type_name == nil then
+        return nil
+    end
+    return utils.type_lookup(info_table, column).indexes[type_name]
+end
+
+-- os.time() of the last re-anchoring of utils.now(), and os.clock() at that moment
+local anchor_time = nil
+local anchor_clock = nil
+
+--- Current time in seconds since the Unix epoch, with sub-second resolution.
+-- os.time() only counts whole seconds, so the time is os.time() at an anchor plus
+-- the os.clock() seconds since. os.clock() is wall-clock time on Windows but CPU
+-- time elsewhere, so the anchor is reset whenever the two drift a second apart.
+-- @return The time, or nil if the os library is not available.
+function utils.now()
+    if os == nil or os.time == nil or os.clock == nil then
+        return nil
+    end
+    local t, c = os.time(), os.clock()
+    if anchor_time == nil or math.abs(anchor_time + (c - anchor_clock) - t) >= 1 then
+        anchor_time, anchor_clock = t, c
     end
-    return "UNKNOWN"
+    return anchor_time + (c - anchor_clock)
 end
 
 return utils
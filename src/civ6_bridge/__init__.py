@@ -3,10 +3,32 @@
 __author__ = """minsing"""
 __email__ = "developerminsing@gmail.com"
 
+from civ6_bridge.async_civ6_bridge import AsyncCiv6Bridge
+from civ6_bridge.async_log_watcher import AsyncLogWatcher
+from civ6_bridge.async_tuner_client import AsyncTunerClient
 from civ6_bridge.civ6_bridge import Civ6Bridge
-from civ6_bridge.commands import GameCommands
+from civ6_bridge.commands import AsyncGameCommands, GameCommands
+from civ6_bridge.event_bus import EventBus
+from civ6_bridge.history_store import HistoryStore
 from civ6_bridge.log_watcher import LogWatcher
-from civ6_bridge.models import GameState
+from civ6_bridge.models import FrameMeta, GameState
+from civ6_bridge.multi_log_watcher import MultiLogWatcher
+from civ6_bridge.state_index import GameStateIndex
 from civ6_bridge.tuner_client import TunerClient
 
-__all__ = ["Civ6Bridge", "GameCommands", "GameState", "LogWatcher", "TunerClient"]
+__all__ = [
+    "AsyncCiv6Bridge",
+    "AsyncGameCommands",
+    "AsyncLogWatcher",
+    "AsyncTunerClient",
+    "Civ6Bridge",
+    "EventBus",
+    "FrameMeta",
+    "GameCommands",
+    "GameState",
+    "GameStateIndex",
+    "HistoryStore",
+    "LogWatcher",
+    "MultiLogWatcher",
+    "TunerClient",
+]
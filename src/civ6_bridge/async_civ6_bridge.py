@@ -0,0 +1,148 @@
+"""AsyncCiv6Bridge facade — asyncio version of the Civ6Bridge API."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from pathlib import Path
+
+from civ6_bridge.async_log_watcher import AsyncLogWatcher
+from civ6_bridge.async_tuner_client import AsyncTunerClient
+from civ6_bridge.commands import AsyncGameCommands
+from civ6_bridge.constants import TUNER_HOST, TUNER_PORT
+from civ6_bridge.diff import Change, diff
+from civ6_bridge.models import GameState
+from civ6_bridge.utils import detect_log_path
+from civ6_bridge.watch_backend import WatchBackend
+
+
+class AsyncCiv6Bridge:
+    """asyncio entry point mirroring Civ6Bridge.
+
+    Every blocking call of Civ6Bridge is a coroutine here, and the turn watcher runs
+    as a task instead of a thread, so one event loop can drive many games.
+
+    Usage:
+        bridge = AsyncCiv6Bridge("/path/to/Lua.log")
+
+        state = await bridge.get_current_state()
+
+        async for state in bridge.watch():
+            await bridge.move_unit(0, 1, 10, 20)
+
+        bridge.on_turn(handle_turn)        # sync or async callback
+        bridge.on_change(handle_changes)   # called with (changes, state)
+        await bridge.stop()
+    """
+
+    def __init__(
+        self,
+        log_path: str | Path | None = None,
+        tuner_host: str = TUNER_HOST,
+        tuner_port: int = TUNER_PORT,
+    ):
+        if log_path is None:
+            resolved = detect_log_path()
+        else:
+            resolved = Path(log_path)
+        self._watcher = AsyncLogWatcher(resolved)
+        self._watch_task: asyncio.Task[None] | None = None
+        self._tuner = AsyncTunerClient(host=tuner_host, port=tuner_port)
+        self.commands = AsyncGameCommands(self._tuner)
+
+    async def get_current_state(self) -> GameState | None:
+        """Read the log file and return the latest GameState, or None."""
+        return await self._watcher.read_latest()
+
+    def watch(
+        self, poll_interval: float = 1.0, backend: WatchBackend | str = "auto"
+    ) -> AsyncGenerator[GameState, None]:
+        """Async iterator over new GameStates as they appear in the log."""
+        return self._watcher.watch(poll_interval=poll_interval, backend=backend)
+
+    def on_turn(
+        self,
+        callback: Callable[[GameState], Awaitable[None] | None],
+        poll_interval: float = 1.0,
+        backend: WatchBackend | str = "auto",
+    ) -> None:
+        """Start a task on the running loop that calls `callback` for each new GameState.
+
+        `callback` may be a plain function or a coroutine function. Only one watcher
+        task is active at a time; calling again replaces the previous one.
+        """
+
+        async def _run() -> None:
+            async for state in self.watch(poll_interval=poll_interval, backend=backend):
+                result = callback(state)
+                if inspect.isawaitable(result):
+                    await result
+
+        self._start_watch(_run())
+
+    def on_change(
+        self,
+        callback: Callable[[list[Change], GameState], Awaitable[None] | None],
+        poll_interval: float = 1.0,
+        backend: WatchBackend | str = "auto",
+    ) -> None:
+        """Like on_turn, but call ``callback(changes, state)`` with the diff against the previous state.
+
+        The state in the log when the task starts is the baseline for the first diff
+        (everything counts as added if there is none). States with no changes are not
+        passed on. Replaces any watcher task started by on_turn or on_change.
+        """
+
+        async def _run() -> None:
+            prev = await self.get_current_state()
+            async for state in self.watch(poll_interval=poll_interval, backend=backend):
+                changes = diff(prev, state)
+                prev = state
+                if changes:
+                    result = callback(changes, state)
+                    if inspect.isawaitable(result):
+                        await result
+
+        self._start_watch(_run())
+
+    def _start_watch(self, run: Coroutine[None, None, None]) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+        self._watch_task = asyncio.get_running_loop().create_task(run)
+
+    async def stop(self) -> None:
+        """Stop the watcher task if running."""
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # -- FireTuner command methods --
+
+    async def send_command(self, lua_code: str, context: int = 0) -> str:
+        """Send a raw Lua command via FireTuner and return the response."""
+        return await self._tuner.send_command(lua_code, context)
+
+    async def move_unit(self, player_id: int, unit_id: int, x: int, y: int) -> str:
+        """Move a unit to the target tile."""
+        return await self.commands.move_unit(player_id, unit_id, x, y)
+
+    async def end_turn(self) -> str:
+        """End the current player's turn."""
+        return await self.commands.end_turn()
+
+    async def set_gold(self, player_id: int, amount: int) -> str:
+        """Set a player's gold balance."""
+        return await self.commands.set_gold(player_id, amount)
+
+    async def add_gold(self, player_id: int, amount: int) -> str:
+        """Add gold to a player's treasury."""
+        return await self.commands.add_gold(player_id, amount)
+
+    async def ping(self) -> bool:
+        """Check if the FireTuner server is reachable and responding."""
+        return await self.commands.ping()
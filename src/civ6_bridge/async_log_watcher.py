@@ -0,0 +1,58 @@
+"""AsyncLogWatcher — asyncio counterpart of LogWatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.models import GameState
+from civ6_bridge.watch_backend import WatchBackend, create_backend
+
+
+class AsyncLogWatcher:
+    """Watches a Lua.log file from an asyncio event loop.
+
+    Reads use the same bounded, incremental scanning as LogWatcher and run in a
+    worker thread; waiting for new data never blocks the loop, so one loop can tail
+    many games.
+
+    Usage:
+        watcher = AsyncLogWatcher(Path("Lua.log"))
+
+        state = await watcher.read_latest()
+
+        async for state in watcher.watch():
+            print(state.turn)
+    """
+
+    def __init__(self, log_path: Path):
+        self._watcher = LogWatcher(log_path)
+        self.log_path = log_path
+
+    async def read_latest(self) -> GameState | None:
+        """Return the last valid GameState in the log, or None."""
+        return await asyncio.to_thread(self._watcher.read_latest)
+
+    async def watch(
+        self, poll_interval: float = 1.0, backend: WatchBackend | str = "auto"
+    ) -> AsyncGenerator[GameState, None]:
+        """Yield GameState objects as new frames appear in the log.
+
+        Same semantics as LogWatcher.watch, but waits with the backend's wait_async().
+        """
+        watcher = self._watcher
+        await asyncio.to_thread(watcher.start_tail)
+        owned = isinstance(backend, str)
+        waiter = create_backend(self.log_path, poll_interval, backend) if owned else backend
+        try:
+            while True:
+                start = watcher.position
+                for state in await asyncio.to_thread(watcher.read_new):
+                    yield state
+                waiter.notify(watcher.position != start)
+                await waiter.wait_async(expect_frame=watcher.pending)
+        finally:
+            if owned:
+                waiter.close()
@@ -0,0 +1,76 @@
+"""asyncio FireTuner client for sending Lua commands to Civilization VI."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from civ6_bridge import metrics
+from civ6_bridge.constants import TUNER_HOST, TUNER_PORT
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.tuner_client import build_message, parse_response
+
+
+class AsyncTunerClient:
+    """Short-lived asyncio TCP client for the Civ6 FireTuner debug server.
+
+    Same wire protocol and error handling as TunerClient, built on asyncio.open_connection.
+    """
+
+    def __init__(self, host: str = TUNER_HOST, port: int = TUNER_PORT, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    async def send_command(self, lua_code: str, context: int = 0) -> str:
+        """Send a Lua command and return the response.
+
+        Opens a short-lived TCP connection (connect → send → read to EOF → close).
+        """
+        message = build_message(lua_code, context)
+        timed = metrics.METRICS.enabled
+        if timed:
+            metrics.TUNER_REQUESTS.inc()
+            start = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(self._exchange(message), self.timeout)
+        except ConnectionRefusedError as e:
+            if timed:
+                metrics.TUNER_CONNECTION_ERRORS.inc()
+            raise TunerConnectionError(f"Cannot connect to FireTuner at {self.host}:{self.port}") from e
+        except asyncio.TimeoutError as e:
+            if timed:
+                metrics.TUNER_CONNECTION_ERRORS.inc()
+            raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} timed out") from e
+        except OSError as e:
+            if timed:
+                metrics.TUNER_CONNECTION_ERRORS.inc()
+            raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} failed: {e}") from e
+        if timed:
+            metrics.TUNER_ROUND_TRIP_SECONDS.observe(time.perf_counter() - start)
+        try:
+            return parse_response(data)
+        except TunerCommandError:
+            if timed:
+                metrics.TUNER_COMMAND_ERRORS.inc()
+            raise
+
+    async def _exchange(self, message: bytes) -> bytes:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(message)
+            await writer.drain()
+            return await reader.read()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def is_connected(self) -> bool:
+        """Check if the FireTuner server is reachable."""
+        try:
+            _reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        except (asyncio.TimeoutError, OSError):
+            return False
+        writer.close()
+        await writer.wait_closed()
+        return True
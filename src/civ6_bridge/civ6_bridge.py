@@ -6,12 +6,16 @@ import threading
 from collections.abc import Callable
 from pathlib import Path
 
-from civ6_bridge.commands import GameCommands
+from civ6_bridge.commands import CommandBatch, GameCommands
 from civ6_bridge.constants import TUNER_HOST, TUNER_PORT
+from civ6_bridge.diff import Change, diff
+from civ6_bridge.event_bus import BLOCK, EventBus, Subscription, SubscriptionStats
 from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.metrics import METRICS, HistogramSnapshot
 from civ6_bridge.models import GameState
 from civ6_bridge.tuner_client import TunerClient
 from civ6_bridge.utils import detect_log_path
+from civ6_bridge.watch_backend import WatchBackend, create_backend
 
 
 class Civ6Bridge:
@@ -27,9 +31,25 @@ class Civ6Bridge:
         bridge.on_turn(lambda gs: print(f"Turn {gs.turn}"))
         bridge.stop()
 
+        # Only what changed since the previous state (see civ6_bridge.diff)
+        bridge.on_change(lambda changes, gs: print(changes))
+
+        # Many consumers; a slow one only lags behind itself
+        bridge.subscribe(update_dashboard, policy="keep_latest")
+        bridge.subscribe(record, maxsize=1000, policy="block")
+        print(bridge.subscription_stats())
+
         # Send commands via FireTuner
         bridge.send_command("print('hello')")
         bridge.commands.move_unit(0, 1, 10, 20)
+
+        # Keep up to 4 FireTuner connections open between commands
+        bridge = Civ6Bridge(pool_size=4)
+        bridge.close()
+
+        # Counters and latency histograms (see civ6_bridge.metrics)
+        bridge = Civ6Bridge(metrics=True)
+        print(bridge.stats()["civ6bridge_tuner_round_trip_seconds"].p99)
     """
 
     def __init__(
@@ -37,6 +57,9 @@ class Civ6Bridge:
         log_path: str | Path | None = None,
         tuner_host: str = TUNER_HOST,
         tuner_port: int = TUNER_PORT,
+        pool_size: int = 0,
+        max_workers: int = 4,
+        metrics: bool = False,
     ):
         if log_path is None:
             resolved = detect_log_path()
@@ -44,37 +67,138 @@ class Civ6Bridge:
             resolved = Path(log_path)
         self._watcher = LogWatcher(resolved)
         self._stop_event = threading.Event()
+        self._watch_lock = threading.Lock()
         self._watch_thread: threading.Thread | None = None
-        self._tuner = TunerClient(host=tuner_host, port=tuner_port)
+        self._bus: EventBus[GameState] = EventBus(max_workers=max_workers)
+        self._tuner = TunerClient(host=tuner_host, port=tuner_port, pool_size=pool_size)
         self.commands = GameCommands(self._tuner)
+        if metrics:
+            METRICS.enable()
 
     def get_current_state(self) -> GameState | None:
         """Read the log file and return the latest GameState, or None."""
         return self._watcher.read_latest()
 
-    def on_turn(self, callback: Callable[[GameState], None], poll_interval: float = 1.0) -> None:
-        """Start a background thread that calls `callback` for each new GameState.
+    def subscribe(
+        self,
+        callback: Callable[[GameState], None],
+        maxsize: int = 64,
+        policy: str = BLOCK,
+        name: str | None = None,
+        poll_interval: float = 1.0,
+        backend: WatchBackend | str = "auto",
+    ) -> Subscription[GameState]:
+        """Call ``callback`` for each new GameState, alongside any other subscribers.
+
+        One background thread tails the log and parses each frame once; the state is
+        then queued for every subscriber (see event_bus.EventBus). Each subscriber has
+        a queue of ``maxsize`` states, and ``policy`` says what happens when it is full:
+        "block" holds up the log reader until the subscriber catches up, "drop_oldest"
+        drops the oldest queued state, and "keep_latest" drops all queued states
+        but the newest. Callbacks run on a pool of ``max_workers`` threads, one state
+        at a time per subscriber. ``poll_interval`` and ``backend`` (see LogWatcher.watch)
+        apply when this call starts the log reader. Cancel with the returned
+        Subscription's cancel(), or stop everything with stop(); the reader stops
+        within one wait once no subscriber is left.
+        """
+        subscription = self._bus.subscribe(callback, maxsize=maxsize, policy=policy, name=name)
+        self._start_watcher(poll_interval, backend)
+        return subscription
 
-        Only one watcher thread is active at a time; calling again replaces the previous one.
+    def on_turn(
+        self,
+        callback: Callable[[GameState], None],
+        poll_interval: float = 1.0,
+        backend: WatchBackend | str = "auto",
+    ) -> Subscription[GameState]:
+        """Call `callback` for each new GameState, on a background thread.
+
+        The thread sleeps on `backend` between reads ("auto" uses inotify where available).
+        This is subscribe() with the "block" policy: every state is delivered, in order.
+        Calling it again adds another subscriber.
         """
-        self.stop()
-        self._stop_event.clear()
+        return self.subscribe(callback, poll_interval=poll_interval, backend=backend)
 
-        def _run() -> None:
-            for state in self._watcher.watch(poll_interval=poll_interval):
-                if self._stop_event.is_set():
-                    break
-                callback(state)
+    def on_change(
+        self,
+        callback: Callable[[list[Change], GameState], None],
+        poll_interval: float = 1.0,
+        backend: WatchBackend | str = "auto",
+    ) -> Subscription[GameState]:
+        """Like on_turn, but call ``callback(changes, state)`` with the diff against the previous state.
+
+        The state in the log when this is called is the baseline for the first diff
+        (everything counts as added if there is none). States with no changes are not
+        passed on.
+        """
+        prev = self.get_current_state()
+
+        def _handle(state: GameState) -> None:
+            nonlocal prev
+            changes = diff(prev, state)
+            prev = state
+            if changes:
+                callback(changes, state)
+
+        name = getattr(callback, "__qualname__", None)
+        return self.subscribe(_handle, name=name, poll_interval=poll_interval, backend=backend)
+
+    def subscription_stats(self) -> list[SubscriptionStats]:
+        """Queue length, drop and error counters of every active subscriber."""
+        return [subscription.stats() for subscription in self._bus.subscriptions]
 
-        self._watch_thread = threading.Thread(target=_run, daemon=True)
-        self._watch_thread.start()
+    def stats(self) -> dict[str, int | HistogramSnapshot]:
+        """Snapshot of the process-wide metrics: log reads, frame decoding and FireTuner round trips.
+
+        Metrics are only recorded while enabled, with ``metrics=True`` or METRICS.enable().
+        """
+        return METRICS.snapshot()
 
     def stop(self) -> None:
-        """Stop the background watcher thread if running."""
+        """Cancel all subscribers and stop the background log reader if running."""
         self._stop_event.set()
-        if self._watch_thread is not None:
-            self._watch_thread.join(timeout=5.0)
-            self._watch_thread = None
+        for subscription in self._bus.subscriptions:
+            subscription.cancel()
+        with self._watch_lock:
+            thread, self._watch_thread = self._watch_thread, None
+        if thread is not None:
+            thread.join(timeout=5.0)
+
+    def _start_watcher(self, poll_interval: float, backend: WatchBackend | str) -> None:
+        with self._watch_lock:
+            if self._watch_thread is not None and self._watch_thread.is_alive():
+                return
+            self._stop_event.clear()
+            owned = isinstance(backend, str)
+            waiter = create_backend(self._watcher.log_path, poll_interval, backend) if owned else backend
+            self._watcher.start_tail()
+            self._watch_thread = threading.Thread(target=self._run_watcher, args=(waiter, owned), daemon=True)
+            self._watch_thread.start()
+
+    def _run_watcher(self, waiter: WatchBackend, owned: bool) -> None:
+        """Tail the log and publish each new state to the subscribers until stop() or the last cancel()."""
+        try:
+            while not self._stop_event.is_set():
+                with self._watch_lock:
+                    # A later subscribe() starts a new reader once this one has let go of _watch_thread
+                    if not self._bus.subscriptions:
+                        if self._watch_thread is threading.current_thread():
+                            self._watch_thread = None
+                        return
+                start = self._watcher.position
+                for state in self._watcher.read_new():
+                    self._bus.publish(state)
+                waiter.notify(self._watcher.position != start)
+                waiter.wait(expect_frame=self._watcher.pending)
+        finally:
+            if owned:
+                waiter.close()
+
+    def close(self) -> None:
+        """Stop the watcher thread and subscribers, and close any pooled FireTuner connections."""
+        self.stop()
+        self._bus.close()
+        self._tuner.close()
 
     # -- FireTuner command methods --
 
@@ -101,3 +225,7 @@ class Civ6Bridge:
     def ping(self) -> bool:
         """Check if the FireTuner server is reachable and responding."""
         return self.commands.ping()
+
+    def batch(self) -> CommandBatch:
+        """Start a batch of commands sent in a single FireTuner round trip."""
+        return self.commands.batch()
@@ -1,14 +1,21 @@
 """Console script for civ6_bridge."""
 
+import time
 from pathlib import Path
 
 import typer
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from civ6_bridge.commands import GameCommands
 from civ6_bridge.constants import TUNER_HOST, TUNER_PORT
 from civ6_bridge.exceptions import Civ6BridgeError, TunerConnectionError
+from civ6_bridge.fake_tuner import FakeTunerServer
+from civ6_bridge.ingest import DEFAULT_BATCH_BYTES, HistorySink, IngestStats, JsonlSink, Sink, ingest
+from civ6_bridge.loadtest import MODES, run_loadtest
 from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.metrics import METRICS, TAIL_LAG_SECONDS, HistogramSnapshot, start_http_server
 from civ6_bridge.tuner_client import TunerClient
 
 app = typer.Typer(help="Civ6 Bridge — read Civilization VI game state from Lua.log")
@@ -82,7 +89,8 @@ def status(
 @app.command()
 def watch(
     log_path: str = typer.Option(None, "--log-path", "-l", help="Path to Lua.log (auto-detected if omitted)"),
-    poll: float = typer.Option(1.0, "--poll", "-p", help="Poll interval in seconds"),
+    poll: float = typer.Option(1.0, "--poll", "-p", help="Maximum seconds between log checks"),
+    backend: str = typer.Option("auto", "--backend", "-b", help="Wake-up backend: auto, inotify or poll"),
 ):
     """Continuously watch Lua.log and print new game states."""
     try:
@@ -92,10 +100,13 @@ def watch(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
 
-    console.print(f"[dim]Watching {path} (poll every {poll}s, Ctrl+C to stop)…[/dim]")
+    console.print(f"[dim]Watching {path} ({backend} backend, Ctrl+C to stop)…[/dim]")
     try:
-        for state in watcher.watch(poll_interval=poll):
+        for state in watcher.watch(poll_interval=poll, backend=backend):
             console.print(f"[bold]Turn {state.turn}[/bold] — {len(state.players)} players")
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
     except KeyboardInterrupt:
         console.print("\n[dim]Stopped.[/dim]")
 
@@ -136,6 +147,188 @@ def ping(
         raise typer.Exit(1)
 
 
+@app.command("ingest")
+def ingest_logs(
+    logs: list[str] = typer.Argument(..., help="Lua.log files or directories of them; .gz is decompressed"),  # noqa: B008
+    output: str = typer.Option(..., "--output", "-o", help="JSONL file (.jsonl or .jsonl.gz), or a directory"),
+    fmt: str = typer.Option("jsonl", "--format", "-f", help="jsonl: one file; history: one HistoryStore per log"),
+    workers: int = typer.Option(0, "--workers", "-w", help="Worker processes (0: one per CPU)"),
+    batch_mb: float = typer.Option(
+        DEFAULT_BATCH_BYTES / 1024 / 1024, "--batch-mb", help="Megabytes of frames per worker task"
+    ),
+):
+    """Parse archived logs in parallel and write every game state to OUTPUT."""
+    paths = []
+    for log in map(Path, logs):
+        paths += sorted(p for p in log.iterdir() if p.is_file()) if log.is_dir() else [log]
+    if fmt == "jsonl":
+        sink: Sink = JsonlSink(Path(output))
+    elif fmt == "history":
+        sink = HistorySink(Path(output))
+    else:
+        console.print(f"[red]Error:[/red] unknown format {fmt!r}; expected jsonl or history")
+        raise typer.Exit(1)
+
+    columns = (TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(), TimeElapsedColumn())
+    with Progress(*columns, TextColumn("{task.fields[rate]}"), console=console) as bar:
+        task = bar.add_task("Ingesting", total=len(paths), rate="")
+
+        def report(stats: IngestStats) -> None:
+            rate = f"{stats.states} states, {stats.mb_per_second:.1f} MB/s, {stats.states_per_second:.0f} states/s"
+            bar.update(task, completed=stats.files_done, rate=rate)
+
+        stats = ingest(paths, sink, workers=workers or None, batch_bytes=int(batch_mb * 1024 * 1024), progress=report)
+
+    console.print(
+        f"{stats.states} states from {stats.files_done} files ({stats.bytes_read / 1e6:.1f} MB) "
+        f"in {stats.elapsed:.1f}s: {stats.mb_per_second:.1f} MB/s, {stats.states_per_second:.0f} states/s"
+    )
+    if stats.skipped:
+        console.print(f"[yellow]{stats.skipped} invalid frames skipped.[/yellow]")
+    for path, reason in stats.failed:
+        console.print(f"[red]Failed:[/red] {path}: {reason}")
+    if stats.failed:
+        raise typer.Exit(1)
+
+
+@app.command("fake-tuner")
+def fake_tuner(
+    host: str = typer.Option(TUNER_HOST, "--host", "-H", help="Address to listen on"),
+    port: int = typer.Option(TUNER_PORT, "--port", "-P", help="Port to listen on"),
+    latency: float = typer.Option(0.0, "--latency", help="Seconds before each reply"),
+    jitter: float = typer.Option(0.0, "--jitter", help="Random extra latency, up to this many seconds either way"),
+    failure_rate: float = typer.Option(0.0, "--failure-rate", help="Share of calls answered with ERR"),
+    drop_rate: float = typer.Option(0.0, "--drop-rate", help="Share of messages dropped with the connection"),
+    keep_alive: bool = typer.Option(
+        True, "--keep-alive/--close", help="Keep connections open (pooled clients) or close after each reply"
+    ),
+):
+    """Run a stand-in FireTuner server that answers the mod's agent commands."""
+    server = FakeTunerServer(host, port, latency, jitter, failure_rate, drop_rate, keep_alive)
+    console.print(f"[dim]Fake FireTuner on {host}:{port} (Ctrl+C to stop)…[/dim]")
+    try:
+        server.serve_forever()
+    except OSError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        console.print(f"\n[dim]Stopped after {server.stats.calls} calls.[/dim]")
+
+
+@app.command()
+def loadtest(
+    modes: str = typer.Option(",".join(MODES), "--modes", "-m", help="Comma-separated: short, pooled, batched"),
+    commands: int = typer.Option(2000, "--commands", "-n", help="Commands per mode"),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", help="Client threads (and pooled connections)"),
+    batch_size: int = typer.Option(20, "--batch-size", help="Commands per round trip in batched mode"),
+    latency: float = typer.Option(0.001, "--latency", help="Fake server: seconds before each reply"),
+    jitter: float = typer.Option(0.0, "--jitter", help="Fake server: random extra latency either way"),
+    failure_rate: float = typer.Option(0.0, "--failure-rate", help="Fake server: share of calls answered with ERR"),
+    drop_rate: float = typer.Option(0.0, "--drop-rate", help="Fake server: share of messages dropped"),
+    host: str = typer.Option(None, "--host", "-H", help="Test this server instead of an in-process fake one"),
+    port: int = typer.Option(TUNER_PORT, "--port", "-P", help="Port of the server given with --host"),
+):
+    """Measure commands/sec and latency of each FireTuner client mode."""
+    table = Table(title=f"{commands} commands, {concurrency} threads")
+    for column in ("Mode", "Commands/s", "p50 ms", "p99 ms", "Round trips", "Failed", "Lost"):
+        table.add_column(column, justify="left" if column == "Mode" else "right")
+    for mode in modes.split(","):
+        mode = mode.strip()
+        server = None
+        try:
+            if host is None:
+                # The short-lived client reads each reply up to the end of the connection
+                fake = FakeTunerServer(
+                    port=0,
+                    latency=latency,
+                    jitter=jitter,
+                    failure_rate=failure_rate,
+                    drop_rate=drop_rate,
+                    keep_alive=mode != "short",
+                )
+                server = fake.start()
+            target_host, target_port = (TUNER_HOST, server.port) if server is not None else (host, port)
+            result = run_loadtest(mode, target_host, target_port, commands, concurrency, batch_size)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+        finally:
+            if server is not None:
+                server.stop()
+        table.add_row(
+            mode,
+            f"{result.commands_per_second:,.0f}",
+            f"{result.p50 * 1e3:.2f}",
+            f"{result.p99 * 1e3:.2f}",
+            str(result.requests),
+            str(result.failed),
+            str(result.lost),
+        )
+    console.print(table)
+
+
+@app.command()
+def stats(
+    log_path: str = typer.Option(None, "--log-path", "-l", help="Path to Lua.log (auto-detected if omitted)"),
+    duration: float = typer.Option(5.0, "--duration", "-d", help="Seconds to keep tailing after reading the log"),
+    pings: int = typer.Option(0, "--pings", help="FireTuner pings to time (needs a running game)"),
+    host: str = typer.Option(TUNER_HOST, "--host", "-H", help="FireTuner host"),
+    port: int = typer.Option(TUNER_PORT, "--port", "-P", help="FireTuner port"),
+    prometheus: bool = typer.Option(False, "--prometheus", help="Print in Prometheus text format"),
+    serve: int = typer.Option(None, "--serve", help="Serve /metrics on this port and tail until Ctrl+C"),
+):
+    """Read Lua.log through the tailing pipeline and show its metrics."""
+    METRICS.enable()
+    try:
+        path = _resolve_path(log_path)
+        watcher = LogWatcher(path)
+    except Civ6BridgeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    server = None
+    try:
+        if serve is not None:
+            server = start_http_server(serve)
+            console.print(f"[dim]Serving metrics on http://127.0.0.1:{serve}/metrics (Ctrl+C to stop)…[/dim]")
+        # The whole log first, as a reader that starts with the game would see it. How old
+        # those frames are is not tail lag, so only lag measured after that is kept
+        watcher.read_new()
+        TAIL_LAG_SECONDS.reset()
+        commands = GameCommands(TunerClient(host=host, port=port))
+        for _ in range(pings):
+            try:
+                commands.ping()
+            except Civ6BridgeError:
+                pass  # counted as an error
+        deadline = time.monotonic() + duration
+        while serve is not None or time.monotonic() < deadline:
+            time.sleep(0.2)
+            watcher.read_new()
+    except OSError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    if prometheus:
+        typer.echo(METRICS.to_prometheus(), nl=False)
+        return
+    table = Table(title=f"Metrics for {path}")
+    for column in ("Metric", "Count", "Mean ms", "p50 ms", "p99 ms"):
+        table.add_column(column, justify="left" if column == "Metric" else "right", no_wrap=True)
+    for name, value in METRICS.snapshot().items():
+        if isinstance(value, HistogramSnapshot):
+            times = [f"{t * 1e3:.3f}" if value.count else "—" for t in (value.mean, value.p50, value.p99)]
+            table.add_row(name, f"{value.count:,}", *times)
+        else:
+            table.add_row(name, f"{value:,}", "", "", "")
+    console.print(table)
+
+
 def _resolve_path(log_path: str | None) -> Path:
     if log_path is not None:
         return Path(log_path)
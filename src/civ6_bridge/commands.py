@@ -2,8 +2,57 @@
 
 from __future__ import annotations
 
-from civ6_bridge.exceptions import TunerConnectionError
-from civ6_bridge.tuner_client import TunerClient
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from civ6_bridge import metrics
+from civ6_bridge.async_tuner_client import AsyncTunerClient
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.tuner_client import TunerClient, parse_results
+
+
+class _LuaCall(NamedTuple):
+    """A call to one of the mod's Game.Agent* functions, before it is sent."""
+
+    function: str
+    args: tuple[int | str, ...] = ()
+
+    def to_lua(self) -> str:
+        return f"{self.function}({', '.join(_lua_arg(a) for a in self.args)})"
+
+
+def _lua_arg(value: int | str) -> str:
+    return f'"{value}"' if isinstance(value, str) else str(value)
+
+
+# Builders shared by GameCommands, AsyncGameCommands and CommandBatch
+
+
+def _move_unit(player_id: int, unit_id: int, x: int, y: int) -> _LuaCall:
+    return _LuaCall("Game.AgentMoveUnit", (player_id, unit_id, x, y))
+
+
+def _end_turn() -> _LuaCall:
+    return _LuaCall("Game.AgentEndTurn")
+
+
+def _set_gold(player_id: int, amount: int) -> _LuaCall:
+    return _LuaCall("Game.AgentSetGold", (player_id, amount))
+
+
+def _add_gold(player_id: int, amount: int) -> _LuaCall:
+    return _LuaCall("Game.AgentAddGold", (player_id, amount))
+
+
+def _research_tech(player_id: int, tech_type: str) -> _LuaCall:
+    return _LuaCall("Game.AgentResearchTech", (player_id, tech_type))
+
+
+def _produce_unit(city_id: int, player_id: int, unit_type: str) -> _LuaCall:
+    return _LuaCall("Game.AgentProduceUnit", (city_id, player_id, unit_type))
+
+
+_PING = _LuaCall("Game.AgentPing")
 
 
 class GameCommands:
@@ -14,37 +63,182 @@ class GameCommands:
 
     def move_unit(self, player_id: int, unit_id: int, x: int, y: int) -> str:
         """Move a unit to the target tile."""
-        lua = f"Game.AgentMoveUnit({player_id}, {unit_id}, {x}, {y})"
-        return self._client.send_command(lua)
+        return self._client.send_command(_move_unit(player_id, unit_id, x, y).to_lua())
 
     def end_turn(self) -> str:
         """End the current player's turn."""
-        return self._client.send_command("Game.AgentEndTurn()")
+        return self._client.send_command(_end_turn().to_lua())
 
     def set_gold(self, player_id: int, amount: int) -> str:
         """Set a player's gold balance to an exact amount."""
-        lua = f"Game.AgentSetGold({player_id}, {amount})"
-        return self._client.send_command(lua)
+        return self._client.send_command(_set_gold(player_id, amount).to_lua())
 
     def add_gold(self, player_id: int, amount: int) -> str:
         """Add (or subtract) gold from a player's treasury."""
-        lua = f"Game.AgentAddGold({player_id}, {amount})"
-        return self._client.send_command(lua)
+        return self._client.send_command(_add_gold(player_id, amount).to_lua())
 
     def research_tech(self, player_id: int, tech_type: str) -> str:
         """Set the current research tech for a player."""
-        lua = f'Game.AgentResearchTech({player_id}, "{tech_type}")'
-        return self._client.send_command(lua)
+        return self._client.send_command(_research_tech(player_id, tech_type).to_lua())
 
     def produce_unit(self, city_id: int, player_id: int, unit_type: str) -> str:
         """Queue a unit for production in a city."""
-        lua = f'Game.AgentProduceUnit({city_id}, {player_id}, "{unit_type}")'
-        return self._client.send_command(lua)
+        return self._client.send_command(_produce_unit(city_id, player_id, unit_type).to_lua())
 
     def ping(self) -> bool:
         """Check connectivity by sending a ping command."""
         try:
-            result = self._client.send_command("Game.AgentPing()")
+            result = self._client.send_command(_PING.to_lua())
+            return "PONG" in result
+        except TunerConnectionError:
+            return False
+
+    def batch(self) -> CommandBatch:
+        """Start a batch of commands that is sent in a single FireTuner message.
+
+        Usage:
+            with commands.batch() as batch:
+                move = batch.move_unit(0, 1, 10, 20)
+                batch.research_tech(0, "TECH_POTTERY")
+            move.value  # "OK:move_unit", or raises TunerCommandError
+        """
+        return CommandBatch(self._client)
+
+
+@dataclass
+class BatchCall:
+    """One call queued in a CommandBatch; filled in when the batch executes."""
+
+    id: int
+    lua: str
+    result: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None and self.error is None
+
+    @property
+    def value(self) -> str:
+        """The call's result. Raises TunerCommandError if the call failed or never ran."""
+        if self.error is not None:
+            raise TunerCommandError(self.error)
+        if self.result is None:
+            raise TunerCommandError(f"No result for batched call #{self.id}: {self.lua}")
+        return self.result
+
+
+class CommandBatch:
+    """Collects GameCommands calls and sends them as one Lua chunk.
+
+    Each call is wrapped in ``Game.AgentCall(id, fn, ...)``, which runs it under pcall
+    and tags its CIV6BRIDGE_RESULT with ``#id``, so one failing call only affects its
+    own BatchCall. Used as a context manager, the batch executes on a clean exit.
+    """
+
+    def __init__(self, client: TunerClient):
+        self._client = client
+        self.calls: list[BatchCall] = []
+
+    def _add(self, lua_call: _LuaCall) -> BatchCall:
+        call_id = len(self.calls) + 1
+        args = [str(call_id), lua_call.function, *(_lua_arg(a) for a in lua_call.args)]
+        lua = f"Game.AgentCall({', '.join(args)})"
+        call = BatchCall(id=call_id, lua=lua)
+        self.calls.append(call)
+        return call
+
+    def move_unit(self, player_id: int, unit_id: int, x: int, y: int) -> BatchCall:
+        """Queue a unit move."""
+        return self._add(_move_unit(player_id, unit_id, x, y))
+
+    def end_turn(self) -> BatchCall:
+        """Queue ending the current player's turn."""
+        return self._add(_end_turn())
+
+    def set_gold(self, player_id: int, amount: int) -> BatchCall:
+        """Queue setting a player's gold balance."""
+        return self._add(_set_gold(player_id, amount))
+
+    def add_gold(self, player_id: int, amount: int) -> BatchCall:
+        """Queue adding (or subtracting) gold."""
+        return self._add(_add_gold(player_id, amount))
+
+    def research_tech(self, player_id: int, tech_type: str) -> BatchCall:
+        """Queue setting the current research tech."""
+        return self._add(_research_tech(player_id, tech_type))
+
+    def produce_unit(self, city_id: int, player_id: int, unit_type: str) -> BatchCall:
+        """Queue a unit for production in a city."""
+        return self._add(_produce_unit(city_id, player_id, unit_type))
+
+    def to_lua(self) -> str:
+        """Return the Lua chunk for all queued calls."""
+        return "\n".join(call.lua for call in self.calls)
+
+    def execute(self) -> list[BatchCall]:
+        """Send all queued calls in one message and fill in their results."""
+        if not self.calls:
+            return self.calls
+        raw = self._client.send_raw(self.to_lua(), expected_results=len(self.calls))
+        by_id = {call.id: call for call in self.calls}
+        for result in parse_results(raw):
+            if not result.startswith("#"):
+                continue
+            call_id, _, body = result[1:].partition(":")
+            call = by_id.get(int(call_id)) if call_id.isdigit() else None
+            if call is None:
+                continue
+            if body.startswith("ERR:"):
+                call.error = body[4:]
+            else:
+                call.result = body
+        if metrics.METRICS.enabled:
+            metrics.TUNER_COMMAND_ERRORS.inc(sum(call.error is not None for call in self.calls))
+        return self.calls
+
+    def __enter__(self) -> CommandBatch:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is None:
+            self.execute()
+
+
+class AsyncGameCommands:
+    """asyncio counterpart of GameCommands, backed by an AsyncTunerClient."""
+
+    def __init__(self, client: AsyncTunerClient):
+        self._client = client
+
+    async def move_unit(self, player_id: int, unit_id: int, x: int, y: int) -> str:
+        """Move a unit to the target tile."""
+        return await self._client.send_command(_move_unit(player_id, unit_id, x, y).to_lua())
+
+    async def end_turn(self) -> str:
+        """End the current player's turn."""
+        return await self._client.send_command(_end_turn().to_lua())
+
+    async def set_gold(self, player_id: int, amount: int) -> str:
+        """Set a player's gold balance to an exact amount."""
+        return await self._client.send_command(_set_gold(player_id, amount).to_lua())
+
+    async def add_gold(self, player_id: int, amount: int) -> str:
+        """Add (or subtract) gold from a player's treasury."""
+        return await self._client.send_command(_add_gold(player_id, amount).to_lua())
+
+    async def research_tech(self, player_id: int, tech_type: str) -> str:
+        """Set the current research tech for a player."""
+        return await self._client.send_command(_research_tech(player_id, tech_type).to_lua())
+
+    async def produce_unit(self, city_id: int, player_id: int, unit_type: str) -> str:
+        """Queue a unit for production in a city."""
+        return await self._client.send_command(_produce_unit(city_id, player_id, unit_type).to_lua())
+
+    async def ping(self) -> bool:
+        """Check connectivity by sending a ping command."""
+        try:
+            result = await self._client.send_command(_PING.to_lua())
             return "PONG" in result
         except TunerConnectionError:
             return False
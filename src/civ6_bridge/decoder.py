@@ -0,0 +1,108 @@
+"""Single-pass frame decoder that builds GameState models while the JSON is parsed."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import TypeVar
+
+from civ6_bridge.constants import SCHEMA_VERSION
+from civ6_bridge.exceptions import ParseError, SchemaVersionError
+from civ6_bridge.game_state import (
+    FIELDS,
+    _build_city,
+    _build_culture,
+    _build_player,
+    _build_religion,
+    _build_science,
+    _build_state,
+    _build_treasury,
+    _build_unit,
+)
+from civ6_bridge.log_parser import DELTA_KIND
+from civ6_bridge.models import City, GameState, Unit
+
+M = TypeVar("M")
+
+
+def _slot_builder(cls: type[M], fallback: Callable[[dict], M], tuples: tuple[str, ...] = ()) -> Callable[[dict], M]:
+    """Return a builder that fills ``cls``'s slots straight from a dict holding every field.
+
+    A frozen dataclass __init__ assigns each field through object.__setattr__;
+    writing the slot descriptors directly is about 2.5x faster for a Unit. Values are
+    taken as the JSON gives them (lists named in ``tuples`` become tuples) when every
+    int field holds an int. A dict missing a field, or holding anything else in an
+    int field (a string, a float, a bool), goes through ``fallback``, which applies
+    the defaults and coercion of from_dict.
+    """
+    new = object.__new__
+    setters = tuple((cls.__dict__[name].__set__, name, kind is int) for name, kind, _default in FIELDS[cls])
+
+    def build(d: dict) -> M:
+        try:
+            for name in tuples:
+                d[name] = tuple(d[name])
+            obj = new(cls)
+            for set_field, name, is_int in setters:
+                value = d[name]
+                if is_int and type(value) is not int:
+                    return fallback(d)
+                set_field(obj, value)
+        except KeyError:
+            return fallback(d)
+        return obj
+
+    return build
+
+
+# A key only one kind of object in the frame schema has, checked in this order. The
+# from_dict builders keep the models the hook already built for nested objects
+_BUILDERS = (
+    ("treasury", _build_player),
+    ("gold_balance", _build_treasury),
+    ("faith_balance", _build_religion),
+    ("progressing_tech", _build_science),
+    ("progressing_civic", _build_culture),
+)
+_build_unit_slots = _slot_builder(Unit, _build_unit)
+_build_city_slots = _slot_builder(City, _build_city, tuples=("buildings", "districts"))
+
+
+def _build(d: dict) -> object:
+    # Units and cities are nearly all the objects in a frame; test for them first
+    if "moves_remaining" in d:
+        return _build_unit_slots(d)
+    if "population" in d:
+        return _build_city_slots(d)
+    for key, build in _BUILDERS:
+        if key in d:
+            return build(d)
+    return d
+
+
+_decoder = json.JSONDecoder(object_hook=_build)
+
+
+def decode_frame(raw: str) -> GameState:
+    """Parse a full JSON frame straight into a GameState.
+
+    Equivalent to ``from_dict(parse_frame(raw))``, but each JSON object is turned into
+    its model as soon as the parser finishes it, so the frame is walked once and no
+    dict tree is kept. Objects are recognised by a key only they carry in the mod's
+    schema. Delta frames need their keyframe and are decoded by parse_frame and
+    game_state.from_dict instead; passing one here raises ParseError.
+    Raises ParseError for invalid JSON, SchemaVersionError for version mismatch.
+    """
+    try:
+        data = _decoder.decode(raw)
+    except json.JSONDecodeError as e:
+        raise ParseError(f"Invalid JSON in frame: {e}") from e
+    if not isinstance(data, dict):
+        raise ParseError(f"Expected JSON object, got {type(data).__name__}")
+
+    version = data.get("version")
+    if version != SCHEMA_VERSION:
+        raise SchemaVersionError(expected=SCHEMA_VERSION, got=version)
+    if data.get("kind") == DELTA_KIND:
+        raise ParseError(f"Delta frame for turn {data.get('turn')} needs its keyframe; use from_dict")
+    return _build_state(data)
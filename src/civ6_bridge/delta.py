@@ -0,0 +1,122 @@
+"""Entity-level deltas between consecutive game state dicts.
+
+A delta holds the top-level keys of the new state (turn, version, ...) and, for
+``players``, an entity delta::
+
+    {"upsert": [...], "removed": [ids], "order": [ids]}
+
+Entities are matched by ``id``. ``upsert`` lists new entities in full and changed
+entities as partial dicts: a changed player carries its id, the keys whose value
+changed and, for ``cities``/``units``, a nested entity delta whose upserts are
+whole cities/units. ``order`` is only present when the new id order is not the
+one apply_delta produces by default (survivors in their old order, then new ids).
+Wherever a delta is expected, a list means "replace the collection with this".
+The mod's delta frames use the same format, plus ``"kind": "delta"`` and the
+``base_turn`` of the keyframe they apply to.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from civ6_bridge.exceptions import ParseError
+
+# Player keys holding id-keyed entity lists
+ENTITY_COLLECTIONS = ("cities", "units")
+
+# Keys describing a delta frame rather than the state it rebuilds
+_FRAME_KEYS = ("players", "kind", "base_turn")
+
+
+def _entity_id(entity: dict) -> int:
+    return entity.get("id", 0)
+
+
+def _diff_entities(old: list[dict], new: list[dict], diff_entity: Callable[[dict, dict], dict]) -> dict:
+    old_by_id = {_entity_id(e): e for e in old}
+    new_ids = [_entity_id(e) for e in new]
+    new_id_set = set(new_ids)
+    upsert = []
+    for entity in new:
+        before = old_by_id.get(_entity_id(entity))
+        if before is None:
+            upsert.append(entity)
+        elif before != entity:
+            upsert.append(diff_entity(before, entity))
+    removed = [i for i in old_by_id if i not in new_id_set]
+
+    delta: dict = {}
+    if upsert:
+        delta["upsert"] = upsert
+    if removed:
+        delta["removed"] = removed
+    default_order = [i for i in old_by_id if i in new_id_set]
+    default_order += [i for i in new_ids if i not in old_by_id]
+    if default_order != new_ids:
+        delta["order"] = new_ids
+    return delta
+
+
+def _whole(_before: dict, after: dict) -> dict:
+    return after
+
+
+def _diff_player(before: dict, after: dict) -> dict:
+    delta = {"id": _entity_id(after)}
+    for key, value in after.items():
+        if key in ENTITY_COLLECTIONS:
+            changes = _diff_entities(before.get(key, []), value, _whole)
+            if changes:
+                delta[key] = changes
+        elif before.get(key) != value:
+            delta[key] = value
+    return delta
+
+
+def make_delta(prev: dict, cur: dict) -> dict:
+    """Return a delta that turns the state dict ``prev`` into ``cur``."""
+    delta = {key: value for key, value in cur.items() if key != "players"}
+    delta["players"] = _diff_entities(prev.get("players", []), cur.get("players", []), _diff_player)
+    return delta
+
+
+def _apply_entities(old: list[dict], delta: dict | list, apply_entity: Callable[[dict, dict], dict]) -> list[dict]:
+    if isinstance(delta, list):
+        return delta
+    removed = set(delta.get("removed", ()))
+    by_id = {_entity_id(e): e for e in old if _entity_id(e) not in removed}
+    for entry in delta.get("upsert", ()):
+        entity_id = _entity_id(entry)
+        before = by_id.get(entity_id)
+        by_id[entity_id] = entry if before is None else apply_entity(before, entry)
+    order = delta.get("order")
+    if order is not None:
+        missing = next((i for i in order if i not in by_id), None)
+        if missing is not None:
+            raise ParseError(f"order lists id {missing}, which neither the base nor the delta has")
+        return [by_id[i] for i in order]
+    return list(by_id.values())
+
+
+def _apply_player(before: dict, entry: dict) -> dict:
+    player = dict(before)
+    for key, value in entry.items():
+        if key in ENTITY_COLLECTIONS:
+            player[key] = _apply_entities(before.get(key, []), value, _whole)
+        else:
+            player[key] = value
+    return player
+
+
+def apply_delta(base: dict, delta: dict) -> dict:
+    """Rebuild a full state dict from ``base`` and a delta made against it.
+
+    ``base`` is not modified; unchanged entities are shared with the result.
+    Raises ParseError if the delta does not fit ``base``.
+    """
+    state = {key: value for key, value in delta.items() if key not in _FRAME_KEYS}
+    try:
+        state["players"] = _apply_entities(base.get("players", []), delta.get("players", {}), _apply_player)
+    except ParseError as e:
+        raise ParseError(f"Delta for turn {delta.get('turn')} does not apply: {e}") from None
+    return state
@@ -0,0 +1,179 @@
+"""Turn-to-turn change events between two GameStates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from civ6_bridge.models import City, GameState, Player, Unit
+
+# Player fields reported by PlayerStatChanged, with the object holding each
+_PLAYER_STATS = (
+    ("is_alive", None),
+    ("gold_balance", "treasury"),
+    ("gold_yield", "treasury"),
+    ("total_maintenance", "treasury"),
+    ("faith_balance", "religion"),
+    ("faith_yield", "religion"),
+    ("science_yield", "science"),
+    ("progressing_tech", "science"),
+    ("progressing_civic", "culture"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """Base class of all change events; ``player_id`` is the player the change belongs to."""
+
+    player_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerAdded(Change):
+    player: Player
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerRemoved(Change):
+    player: Player
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerStatChanged(Change):
+    """A scalar of a player changed: gold, faith or science figures, research, civic, or is_alive."""
+
+    stat: str
+    before: float | str | bool
+    after: float | str | bool
+
+
+@dataclass(frozen=True, slots=True)
+class UnitAdded(Change):
+    unit: Unit
+
+
+@dataclass(frozen=True, slots=True)
+class UnitRemoved(Change):
+    """A unit is gone: killed, disbanded, consumed (settlers, builders) or upgraded to a new id."""
+
+    unit: Unit
+
+
+@dataclass(frozen=True, slots=True)
+class UnitMoved(Change):
+    before: Unit
+    after: Unit
+
+
+@dataclass(frozen=True, slots=True)
+class UnitUpdated(Change):
+    """A unit that did not move changed other fields (moves left, strength, ...)."""
+
+    before: Unit
+    after: Unit
+
+
+@dataclass(frozen=True, slots=True)
+class CityAdded(Change):
+    """A city was founded or captured by ``player_id``."""
+
+    city: City
+
+
+@dataclass(frozen=True, slots=True)
+class CityRemoved(Change):
+    city: City
+
+
+@dataclass(frozen=True, slots=True)
+class CityPopulationChanged(Change):
+    city_id: int
+    before: int
+    after: int
+
+
+@dataclass(frozen=True, slots=True)
+class BuildingCompleted(Change):
+    city_id: int
+    building: str
+
+
+@dataclass(frozen=True, slots=True)
+class DistrictCompleted(Change):
+    city_id: int
+    district: str
+
+
+def _stat(player: Player, name: str, holder: str | None) -> float | str | bool:
+    return getattr(player if holder is None else getattr(player, holder), name)
+
+
+def _diff_player(player_id: int, old: Player, new: Player, changes: list[Change]) -> None:
+    for name, holder in _PLAYER_STATS:
+        if holder is not None and getattr(old, holder) is getattr(new, holder):
+            continue
+        before, after = _stat(old, name, holder), _stat(new, name, holder)
+        if before != after:
+            changes.append(PlayerStatChanged(player_id, name, before, after))
+
+    if old.cities is not new.cities:
+        old_cities = {city.id: city for city in old.cities}
+        new_ids = set()
+        for city in new.cities:
+            new_ids.add(city.id)
+            before = old_cities.get(city.id)
+            if before is None:
+                changes.append(CityAdded(player_id, city))
+            elif before is not city and before != city:
+                _diff_city(player_id, before, city, changes)
+        changes += [CityRemoved(player_id, city) for city in old.cities if city.id not in new_ids]
+
+    if old.units is not new.units:
+        old_units = {unit.id: unit for unit in old.units}
+        new_ids = set()
+        for unit in new.units:
+            new_ids.add(unit.id)
+            before = old_units.get(unit.id)
+            if before is None:
+                changes.append(UnitAdded(player_id, unit))
+            elif before is not unit and before != unit:
+                moved = (before.x, before.y) != (unit.x, unit.y)
+                changes.append((UnitMoved if moved else UnitUpdated)(player_id, before, unit))
+        changes += [UnitRemoved(player_id, unit) for unit in old.units if unit.id not in new_ids]
+
+
+def _diff_city(player_id: int, old: City, new: City, changes: list[Change]) -> None:
+    if old.population != new.population:
+        changes.append(CityPopulationChanged(player_id, new.id, old.population, new.population))
+    if old.buildings != new.buildings:
+        had = set(old.buildings)
+        changes += [BuildingCompleted(player_id, new.id, b) for b in new.buildings if b not in had]
+    if old.districts != new.districts:
+        had = set(old.districts)
+        changes += [DistrictCompleted(player_id, new.id, d) for d in new.districts if d not in had]
+
+
+def diff(prev: GameState | None, curr: GameState) -> list[Change]:
+    """Return what changed from ``prev`` to ``curr`` as a list of Change events.
+
+    Players are matched by id, and cities and units by id within their player, using
+    dicts, so the cost is linear in the number of entities. Objects that are the same
+    instance in both states (see StateBuilder) are skipped without comparing fields.
+    A city or unit that changes owner shows up as removed from one player and added
+    to the other. With ``prev`` None, everything in ``curr`` is reported as added.
+
+    Events come player by player: stat changes, then cities, then units.
+    """
+    changes: list[Change] = []
+    old_players = {player.id: player for player in prev.players} if prev is not None else {}
+    seen = set()
+    for player in curr.players:
+        seen.add(player.id)
+        old = old_players.get(player.id)
+        if old is None:
+            changes.append(PlayerAdded(player.id, player))
+            changes += [CityAdded(player.id, city) for city in player.cities]
+            changes += [UnitAdded(player.id, unit) for unit in player.units]
+        elif old is not player:
+            _diff_player(player.id, old, player, changes)
+    changes += [PlayerRemoved(pid, player) for pid, player in old_players.items() if pid not in seen]
+    return changes
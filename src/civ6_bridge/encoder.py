@@ -0,0 +1,315 @@
+"""Fixed-layout NumPy observations of GameStates, for training agents.
+
+Needs NumPy (``pip install 'civ6-bridge[rl]'``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("civ6_bridge.encoder needs NumPy; install it with: pip install 'civ6-bridge[rl]'") from e
+
+from civ6_bridge.models import GameState
+
+VOCAB_FORMAT = 1
+
+# Token categories of a Vocabulary
+CATEGORIES = ("unit_types", "buildings", "civilizations", "techs", "civics")
+
+# Columns of Observation.player_features
+PLAYER_FEATURES = (
+    "is_alive",
+    "is_human",
+    "gold_balance",
+    "gold_yield",
+    "total_maintenance",
+    "faith_balance",
+    "faith_yield",
+    "science_yield",
+    "num_cities",
+    "num_units",
+)
+
+_WORD_MASK = (1 << 64) - 1
+_BUILDING_CACHE_SIZE = 1 << 16
+
+_UNIT_FIELDS = attrgetter("owner_id", "x", "y", "moves_remaining", "max_moves", "combat", "ranged_combat", "range")
+_CITY_FIELDS = attrgetter("owner_id", "x", "y", "population")
+
+
+class Vocabulary:
+    """Stable mapping from type strings (UNIT_WARRIOR, BUILDING_MONUMENT, ...) to integer ids.
+
+    Usage:
+        vocab = Vocabulary()
+        vocab.id("unit_types", "UNIT_WARRIOR")    # 1
+        vocab.save(Path("vocab.json"))
+        vocab = Vocabulary.load(Path("vocab.json"), frozen=True)
+
+    Each category in CATEGORIES numbers its tokens from 1 in the order they are first
+    seen; 0 means padding or unknown. Ids never change once given, so a saved
+    vocabulary keeps observations comparable across runs. A frozen vocabulary maps
+    tokens it has not seen to 0 instead of adding them.
+    """
+
+    def __init__(self, tokens: dict[str, Sequence[str]] | None = None, frozen: bool = False):
+        self.frozen = frozen
+        self._ids: dict[str, dict[str, int]] = {category: {} for category in CATEGORIES}
+        for category, names in (tokens or {}).items():
+            table = self._table(category)
+            for name in names:
+                table.setdefault(name, len(table) + 1)
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._ids.values())
+
+    def _table(self, category: str) -> dict[str, int]:
+        try:
+            return self._ids[category]
+        except KeyError:
+            raise ValueError(f"Unknown vocabulary category {category!r}, expected one of {CATEGORIES}") from None
+
+    def id(self, category: str, token: str) -> int:
+        """Return the id of ``token``, adding it unless the vocabulary is frozen (then 0)."""
+        table = self._table(category)
+        token_id = table.get(token)
+        if token_id is None:
+            if self.frozen or not token:
+                return 0
+            token_id = table[token] = len(table) + 1
+        return token_id
+
+    def ids(self, category: str, tokens: Iterable[str]) -> list[int]:
+        """Return the ids of ``tokens`` in order, as id() would."""
+        table = self._table(category)
+        return [table.get(token) or self.id(category, token) for token in tokens]
+
+    def tokens(self, category: str) -> list[str]:
+        """Tokens of ``category`` in id order (the token with id i is at index i - 1)."""
+        return list(self._table(category))
+
+    def size(self, category: str) -> int:
+        """Number of ids in use for ``category``, counting 0."""
+        return len(self._table(category)) + 1
+
+    def to_dict(self) -> dict:
+        """JSON-compatible form: each category's tokens in id order."""
+        return {"format": VOCAB_FORMAT, **{category: list(table) for category, table in self._ids.items()}}
+
+    def save(self, path: Path) -> None:
+        """Write the vocabulary as JSON."""
+        path.write_text(json.dumps(self.to_dict(), indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path, frozen: bool = False) -> Vocabulary:
+        """Read a vocabulary written by save()."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("format") != VOCAB_FORMAT:
+            raise ValueError(f"{path} is not a civ6_bridge vocabulary (format {data.get('format')!r})")
+        return cls({category: data.get(category, []) for category in CATEGORIES}, frozen=frozen)
+
+
+class Observation(NamedTuple):
+    """Struct-of-arrays encoding of a batch of states. Every array starts with the batch axis.
+
+    Slots past the last real unit/city/player are zero and False in the matching mask.
+    Owners are player ids; ``unit_type``, ``player_civilization``, ``player_tech`` and
+    ``player_civic`` are Vocabulary ids. Bit ``i`` of ``city_buildings`` (word
+    ``i // 64``, bit ``i % 64``) is set when the city has the building with id ``i``.
+    """
+
+    turn: np.ndarray  # (B,) int32
+    unit_mask: np.ndarray  # (B, U) bool
+    unit_type: np.ndarray  # (B, U) int32
+    unit_owner: np.ndarray  # (B, U) int32
+    unit_x: np.ndarray
+    unit_y: np.ndarray
+    unit_moves: np.ndarray
+    unit_max_moves: np.ndarray
+    unit_combat: np.ndarray
+    unit_ranged_combat: np.ndarray
+    unit_range: np.ndarray
+    city_mask: np.ndarray  # (B, C) bool
+    city_owner: np.ndarray  # (B, C) int32
+    city_x: np.ndarray
+    city_y: np.ndarray
+    city_population: np.ndarray
+    city_buildings: np.ndarray  # (B, C, building_capacity // 64) uint64
+    player_mask: np.ndarray  # (B, P) bool
+    player_id: np.ndarray  # (B, P) int32
+    player_civilization: np.ndarray
+    player_tech: np.ndarray
+    player_civic: np.ndarray
+    player_features: np.ndarray  # (B, P, len(PLAYER_FEATURES)) float32
+
+
+class ObservationEncoder:
+    """Encode GameStates into fixed-size NumPy arrays (see Observation).
+
+    Usage:
+        encoder = ObservationEncoder(max_units=512, max_cities=128)
+        obs = encoder.encode(state)                  # batch of one
+        batch = encoder.encode_batch(states)
+        encoder.vocab.save(Path("vocab.json"))
+
+    Units and cities of all players are laid out in export order (player by player)
+    and cut off at ``max_units`` / ``max_cities``; players past ``max_players`` are
+    dropped. Each state is walked once to collect plain tuples of fields, and the
+    arrays are then filled with one NumPy scatter per group of fields. Building
+    bitmasks are cached per distinct set of buildings.
+    """
+
+    def __init__(
+        self,
+        max_units: int = 256,
+        max_cities: int = 64,
+        max_players: int = 16,
+        building_capacity: int = 256,
+        vocab: Vocabulary | None = None,
+    ):
+        if building_capacity % 64:
+            raise ValueError(f"building_capacity must be a multiple of 64, got {building_capacity}")
+        self.max_units = max_units
+        self.max_cities = max_cities
+        self.max_players = max_players
+        self.building_capacity = building_capacity
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self._words = building_capacity // 64
+        # Vocabulary ids never change once given, so a building set always has the same mask
+        self._building_cache: dict[tuple[str, ...], tuple[int, ...]] = {}
+
+    def encode(self, state: GameState) -> Observation:
+        """Encode one state as a batch of one."""
+        return self.encode_batch([state])
+
+    def encode_batch(self, states: Sequence[GameState]) -> Observation:
+        """Encode ``states`` into arrays with a leading batch axis of ``len(states)``."""
+        vocab = self.vocab
+        batch = len(states)
+        unit_counts, unit_rows = [], []
+        city_counts, city_rows, city_words = [], [], []
+        player_counts, player_rows, player_tokens = [], [], []
+        for state in states:
+            units = [unit for player in state.players for unit in player.units][: self.max_units]
+            unit_counts.append(len(units))
+            type_ids = vocab.ids("unit_types", [unit.type for unit in units])
+            unit_rows += [(*_UNIT_FIELDS(unit), type_id) for unit, type_id in zip(units, type_ids, strict=True)]
+
+            cities = [city for player in state.players for city in player.cities][: self.max_cities]
+            city_counts.append(len(cities))
+            city_rows += map(_CITY_FIELDS, cities)
+            city_words += [self._building_words(city.buildings) for city in cities]
+
+            players = state.players[: self.max_players]
+            player_counts.append(len(players))
+            for player in players:
+                player_tokens.append(
+                    (
+                        player.id,
+                        vocab.id("civilizations", player.civilization),
+                        vocab.id("techs", player.science.progressing_tech),
+                        vocab.id("civics", player.culture.progressing_civic),
+                    )
+                )
+                player_rows.append(
+                    (
+                        player.is_alive,
+                        player.is_human,
+                        player.treasury.gold_balance,
+                        player.treasury.gold_yield,
+                        player.treasury.total_maintenance,
+                        player.religion.faith_balance,
+                        player.religion.faith_yield,
+                        player.science.science_yield,
+                        len(player.cities),
+                        len(player.units),
+                    )
+                )
+
+        unit_at = _positions(unit_counts)
+        city_at = _positions(city_counts)
+        player_at = _positions(player_counts)
+        units = _scatter(unit_at, unit_rows, (batch, self.max_units), 9, np.int32)
+        cities = _scatter(city_at, city_rows, (batch, self.max_cities), 4, np.int32)
+        tokens = _scatter(player_at, player_tokens, (batch, self.max_players), 4, np.int32)
+        features = _scatter(player_at, player_rows, (batch, self.max_players), len(PLAYER_FEATURES), np.float32)
+        features = np.ascontiguousarray(np.moveaxis(features, 0, -1))
+        return Observation(
+            turn=np.array([state.turn for state in states], dtype=np.int32),
+            unit_mask=_mask(unit_at, (batch, self.max_units)),
+            unit_type=units[8],
+            unit_owner=units[0],
+            unit_x=units[1],
+            unit_y=units[2],
+            unit_moves=units[3],
+            unit_max_moves=units[4],
+            unit_combat=units[5],
+            unit_ranged_combat=units[6],
+            unit_range=units[7],
+            city_mask=_mask(city_at, (batch, self.max_cities)),
+            city_owner=cities[0],
+            city_x=cities[1],
+            city_y=cities[2],
+            city_population=cities[3],
+            city_buildings=np.ascontiguousarray(
+                np.moveaxis(_scatter(city_at, city_words, (batch, self.max_cities), self._words, np.uint64), 0, -1)
+            ),
+            player_mask=_mask(player_at, (batch, self.max_players)),
+            player_id=tokens[0],
+            player_civilization=tokens[1],
+            player_tech=tokens[2],
+            player_civic=tokens[3],
+            player_features=features,
+        )
+
+    def _building_words(self, buildings: tuple[str, ...]) -> tuple[int, ...]:
+        """The building bitmask of a city as ``building_capacity // 64`` words, cached per building set."""
+        words = self._building_cache.get(buildings)
+        if words is None:
+            mask = 0
+            for building_id in self.vocab.ids("buildings", buildings):
+                mask |= 1 << building_id
+            mask &= ~1  # id 0: unknown to a frozen vocabulary
+            if mask >> self.building_capacity:
+                raise ValueError(
+                    f"Building id {mask.bit_length() - 1} does not fit building_capacity={self.building_capacity}; "
+                    "use a larger capacity"
+                )
+            words = tuple((mask >> (64 * k)) & _WORD_MASK for k in range(self._words))
+            if len(self._building_cache) >= _BUILDING_CACHE_SIZE:
+                self._building_cache.clear()
+            self._building_cache[buildings] = words
+        return words
+
+
+def _positions(counts: list[int]) -> tuple[np.ndarray, np.ndarray]:
+    """(batch index, slot) of every item, for ``counts[b]`` items in slots 0.. of batch entry ``b``."""
+    counts_array = np.array(counts, dtype=np.intp)
+    batch_index = np.repeat(np.arange(len(counts), dtype=np.intp), counts_array)
+    starts = np.repeat(np.cumsum(counts_array) - counts_array, counts_array)
+    return batch_index, np.arange(len(batch_index), dtype=np.intp) - starts
+
+
+def _mask(at: tuple[np.ndarray, np.ndarray], shape: tuple[int, int]) -> np.ndarray:
+    mask = np.zeros(shape, dtype=bool)
+    mask[at] = True
+    return mask
+
+
+def _scatter(
+    at: tuple[np.ndarray, np.ndarray], rows: list[tuple], shape: tuple[int, int], width: int, dtype
+) -> np.ndarray:
+    """Place ``rows[i]`` at position ``i`` of ``at``, field-major: ``out[k]`` is one contiguous array per field."""
+    out = np.zeros((width, *shape), dtype=dtype)
+    if rows:
+        values = np.fromiter(chain.from_iterable(rows), dtype=dtype, count=len(rows) * width)
+        out[:, at[0], at[1]] = values.reshape(len(rows), width).T
+    return out
@@ -0,0 +1,198 @@
+"""EventBus — fan out published items to many subscribers with bounded queues."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# Overflow policies: what publish() does when a subscriber's queue is full
+BLOCK = "block"  # wait until the subscriber catches up (backpressure on the publisher)
+DROP_OLDEST = "drop_oldest"  # discard the oldest queued item
+KEEP_LATEST = "keep_latest"  # discard everything queued; only the newest item is delivered next
+POLICIES = (BLOCK, DROP_OLDEST, KEEP_LATEST)
+
+
+class SubscriptionStats(NamedTuple):
+    """Counters of one subscription."""
+
+    name: str
+    pending: int  # items queued and not yet handled: how far the subscriber lags
+    max_pending: int  # highest ``pending`` seen
+    delivered: int  # items handed to the callback
+    dropped: int  # items discarded by the overflow policy
+    errors: int  # callback calls that raised
+
+
+class Subscription(Generic[T]):
+    """One consumer of an EventBus. Created by EventBus.subscribe()."""
+
+    def __init__(self, bus: EventBus[T], callback: Callable[[T], object], maxsize: int, policy: str, name: str):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown overflow policy {policy!r}, expected one of {POLICIES}")
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.last_error: BaseException | None = None
+        self._bus = bus
+        self._callback = callback
+        self._queue: deque[T] = deque()
+        self._cond = threading.Condition()
+        self._scheduled = False  # a drain task is queued or running on the pool
+        self._active = True
+        self._delivered = 0
+        self._dropped = 0
+        self._errors = 0
+        self._max_pending = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def stats(self) -> SubscriptionStats:
+        with self._cond:
+            return SubscriptionStats(
+                self.name, len(self._queue), self._max_pending, self._delivered, self._dropped, self._errors
+            )
+
+    def cancel(self) -> None:
+        """Stop delivering to this subscriber and discard what is queued."""
+        self._bus.unsubscribe(self)
+
+    def _close(self) -> None:
+        with self._cond:
+            self._active = False
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _put(self, item: T) -> bool:
+        """Queue ``item``; return True if a drain task must be scheduled."""
+        with self._cond:
+            if len(self._queue) >= self.maxsize:
+                if self.policy == BLOCK:
+                    while self._active and len(self._queue) >= self.maxsize:
+                        self._cond.wait()
+                elif self.policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                else:
+                    self._dropped += len(self._queue)
+                    self._queue.clear()
+            if not self._active:
+                return False
+            self._queue.append(item)
+            self._max_pending = max(self._max_pending, len(self._queue))
+            if self._scheduled:
+                return False
+            self._scheduled = True
+            return True
+
+    def _drain(self) -> None:
+        """Deliver queued items in order; runs on the bus's worker pool."""
+        while True:
+            with self._cond:
+                if not self._queue or not self._active:
+                    self._scheduled = False
+                    self._cond.notify_all()
+                    return
+                item = self._queue.popleft()
+                self._cond.notify_all()
+            try:
+                self._callback(item)
+            except Exception as e:
+                with self._cond:
+                    self._errors += 1
+                    self.last_error = e
+            with self._cond:
+                self._delivered += 1
+
+    def _wait_idle(self, timeout: float | None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._scheduled, timeout)
+
+
+class EventBus(Generic[T]):
+    """Delivers every published item to each subscriber, on a shared worker pool.
+
+    Usage:
+        bus = EventBus(max_workers=4)
+        fast = bus.subscribe(update_ui, policy=KEEP_LATEST)
+        slow = bus.subscribe(train_step, maxsize=256, policy=BLOCK)
+        bus.publish(state)
+        print(slow.stats())
+        bus.close()
+
+    Each subscriber has its own bounded queue. Its items are handled one at a time
+    and in order, while different subscribers run in parallel on up to
+    ``max_workers`` threads, so a slow subscriber only delays itself. When a queue
+    is full, the subscriber's policy decides: BLOCK makes publish() wait (pushing
+    back on the publisher), DROP_OLDEST discards the oldest queued item, and
+    KEEP_LATEST discards all queued items so only the newest is delivered next.
+    Exceptions raised by a callback are counted in the subscriber's stats (and the
+    last one kept in ``last_error``); delivery continues.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="civ6-bridge-bus")
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription[T]] = []
+        self._closed = False
+
+    @property
+    def subscriptions(self) -> list[Subscription[T]]:
+        with self._lock:
+            return list(self._subscriptions)
+
+    def subscribe(
+        self,
+        callback: Callable[[T], object],
+        maxsize: int = 64,
+        policy: str = DROP_OLDEST,
+        name: str | None = None,
+    ) -> Subscription[T]:
+        """Register ``callback`` for items published from now on."""
+        name = name or getattr(callback, "__qualname__", repr(callback))
+        subscription = Subscription(self, callback, maxsize, policy, name)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EventBus is closed")
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[T]) -> None:
+        """Remove a subscriber; items already being handled finish, queued ones are dropped."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription._close()
+
+    def publish(self, item: T) -> None:
+        """Queue ``item`` for every subscriber. Blocks only on full BLOCK subscribers."""
+        for subscription in self.subscriptions:
+            if subscription._put(item):
+                self._pool.submit(subscription._drain)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every subscriber has handled its queue; False if ``timeout`` ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in self.subscriptions:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscription._wait_idle(remaining):
+                return False
+        return True
+
+    def close(self, wait: bool = True) -> None:
+        """Unsubscribe everyone and shut the worker pool down."""
+        with self._lock:
+            self._closed = True
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription._close()
+        self._pool.shutdown(wait=wait)
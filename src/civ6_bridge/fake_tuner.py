@@ -0,0 +1,285 @@
+"""FakeTunerServer — a stand-in for the FireTuner debug server, for tests and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import threading
+from dataclasses import dataclass
+
+from civ6_bridge.constants import RESULT_BEGIN, RESULT_END, TUNER_HOST, TUNER_PORT
+from civ6_bridge.models import GameState
+from civ6_bridge.tuner_client import HEADER
+
+# Message type of the server's replies
+REPLY_MSG_TYPE = 1
+
+_CALL_RE = re.compile(r"^\s*(?:GameCore\.)?Game\.(Agent\w+)\((.*)\)\s*;?\s*$")
+_ARG_RE = re.compile(r'\s*("(?:[^"\\]|\\.)*"|[^,]+?)\s*(?:,|$)')
+
+
+def _parse_args(text: str) -> list[int | str]:
+    args: list[int | str] = []
+    for token in _ARG_RE.findall(text):
+        if token.startswith('"'):
+            args.append(token[1:-1])
+        else:
+            try:
+                args.append(int(token))
+            except ValueError:
+                args.append(token.removeprefix("GameCore.").removeprefix("Game."))
+    return args
+
+
+@dataclass
+class FakeTunerStats:
+    """Counters of a FakeTunerServer."""
+
+    connections: int = 0
+    messages: int = 0
+    calls: int = 0
+    injected_failures: int = 0
+    dropped: int = 0
+
+
+class FakeTunerServer:
+    """Answers the mod's Game.Agent* calls over the FireTuner wire protocol, without a game.
+
+    Usage:
+        with FakeTunerServer(port=0, latency=0.005, jitter=0.002) as server:
+            client = TunerClient(port=server.port, pool_size=4)
+            GameCommands(client).move_unit(0, 65536, 10, 12)  # "OK:move_unit"
+
+        # Or in its own process:  civ6_bridge fake-tuner --port 4318 --keep-alive
+
+    Every message is read with the build_message framing. Each ``Game.AgentXxx(...)``
+    line in it, and each ``Game.AgentCall(id, Game.AgentXxx, ...)`` line of a batch,
+    is answered the way agent_commands.lua answers it: one CIV6BRIDGE_RESULT per
+    call, tagged with ``#id`` inside a batch, sent as one reply message per result.
+    Players, units and cities are checked against ``state`` when one is given (else
+    any id below ``players`` is a valid player), and gold changes are tracked.
+
+    ``latency`` seconds, plus a uniform random ``jitter`` either way, pass before each
+    reply. A call fails with "ERR:injected failure" with probability ``failure_rate``,
+    and with probability ``drop_rate`` a message gets no reply and the connection is
+    closed. With ``keep_alive`` the connection stays open for more commands, as the
+    pooled TunerClient expects; without it the server closes the connection after
+    each reply, which is what the short-lived TunerClient reads up to.
+
+    Connections are served on an asyncio loop, in a background thread after start()
+    or in the calling thread with serve_forever().
+    """
+
+    def __init__(
+        self,
+        host: str = TUNER_HOST,
+        port: int = TUNER_PORT,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        keep_alive: bool = True,
+        state: GameState | None = None,
+        players: int = 8,
+        seed: int | None = None,
+    ):
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must not be negative")
+        if not (0 <= failure_rate <= 1 and 0 <= drop_rate <= 1):
+            raise ValueError("failure_rate and drop_rate must be between 0 and 1")
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.keep_alive = keep_alive
+        self.state = state
+        self.stats = FakeTunerStats()
+        self._rng = random.Random(seed)
+        if state is not None:
+            self.gold = {p.id: p.treasury.gold_balance for p in state.players}
+            self._units = {p.id: {u.id for u in p.units} for p in state.players}
+            self._cities = {p.id: {c.id for c in p.cities} for p in state.players}
+        else:
+            self.gold = {pid: 0.0 for pid in range(players)}
+            self._units = self._cities = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped: asyncio.Event | None = None
+        self._handlers: set[asyncio.Task] = set()
+        self._error: OSError | None = None
+
+    # -- the mod's functions --
+
+    def call(self, function: str, args: list[int | str]) -> str:
+        """Run one Agent* call and return its result, without the sentinels."""
+        handler = getattr(self, f"_{function}", None)
+        if handler is None:
+            return f"ERR:attempt to call a nil value (field '{function}')"
+        try:
+            return handler(*args)
+        except TypeError:
+            return f"ERR:bad arguments to {function}"
+
+    def _player(self, player_id: object) -> bool:
+        return player_id in self.gold
+
+    def _AgentPing(self) -> str:
+        return "PONG"
+
+    def _AgentEndTurn(self) -> str:
+        return "OK:end_turn"
+
+    def _AgentMoveUnit(self, player_id, unit_id, x, y) -> str:
+        if not self._player(player_id):
+            return f"ERR:invalid player {player_id}"
+        if self._units is not None and unit_id not in self._units[player_id]:
+            return f"ERR:unit not found {unit_id}"
+        return "OK:move_unit"
+
+    def _AgentSetGold(self, player_id, amount) -> str:
+        if not self._player(player_id):
+            return f"ERR:invalid player {player_id}"
+        self.gold[player_id] = float(amount)
+        return "OK:set_gold"
+
+    def _AgentAddGold(self, player_id, amount) -> str:
+        if not self._player(player_id):
+            return f"ERR:invalid player {player_id}"
+        self.gold[player_id] += amount
+        return "OK:add_gold"
+
+    def _AgentResearchTech(self, player_id, tech_type) -> str:
+        if not self._player(player_id):
+            return f"ERR:invalid player {player_id}"
+        if not str(tech_type).startswith("TECH_"):
+            return f"ERR:unknown tech {tech_type}"
+        return "OK:research_tech"
+
+    def _AgentProduceUnit(self, city_id, player_id, unit_type) -> str:
+        if not self._player(player_id):
+            return f"ERR:invalid player {player_id}"
+        if self._cities is not None and city_id not in self._cities[player_id]:
+            return f"ERR:city not found {city_id}"
+        if not str(unit_type).startswith("UNIT_"):
+            return f"ERR:unknown unit type {unit_type}"
+        return "OK:produce_unit"
+
+    # -- wire protocol --
+
+    def reply(self, lua: str) -> list[str]:
+        """The results a message of Lua code is answered with, one per call, with sentinels."""
+        results = []
+        for line in lua.splitlines():
+            match = _CALL_RE.match(line)
+            if match is None:
+                continue
+            function, args = match.group(1), _parse_args(match.group(2))
+            tag = ""
+            if function == "AgentCall" and len(args) >= 2:
+                tag = f"#{args[0]}:"
+                function, args = str(args[1]), args[2:]
+            self.stats.calls += 1
+            if self.failure_rate and self._rng.random() < self.failure_rate:
+                self.stats.injected_failures += 1
+                result = "ERR:injected failure"
+            else:
+                result = self.call(function, args)
+            results.append(f"{RESULT_BEGIN}{tag}{result}{RESULT_END}")
+        return results
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        try:
+            while True:
+                try:
+                    length, _msg_type = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    payload = await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                self.stats.messages += 1
+                _, _, lua = payload.rstrip(b"\x00").decode(errors="replace").partition(":")
+                _, _, lua = lua.partition(":")  # drop "CMD:<context>:"
+                results = self.reply(lua)
+                if self.drop_rate and self._rng.random() < self.drop_rate:
+                    self.stats.dropped += 1
+                    return
+                delay = self._delay()
+                if delay:
+                    await asyncio.sleep(delay)
+                for result in results:
+                    body = result.encode() + b"\x00"
+                    writer.write(HEADER.pack(len(body), REPLY_MSG_TYPE) + body)
+                await writer.drain()
+                if not self.keep_alive:
+                    return
+        except (ConnectionError, asyncio.CancelledError):
+            return  # client gone, or cancelled by stop()
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _serve(self, ready: threading.Event | None = None) -> None:
+        self._stopped = asyncio.Event()
+        try:
+            server = await asyncio.start_server(self._handle, self.host, self.port)
+        except OSError as e:
+            if ready is None:
+                raise
+            self._error = e
+            ready.set()
+            return
+        self.port = server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready.set()
+        async with server:
+            await self._stopped.wait()
+            handlers = list(self._handlers)
+            for task in handlers:
+                task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        asyncio.run(self._serve())
+
+    def start(self) -> FakeTunerServer:
+        """Serve from a background thread. With ``port=0`` a free port is picked; read it from ``port``."""
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(self._serve(ready),), name="fake-tuner", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+            raise self._error
+        return self
+
+    def stop(self) -> None:
+        """Stop a server started with start()."""
+        if self._loop is None or self._thread is None or self._stopped is None:
+            return
+        self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join(5)
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def __enter__(self) -> FakeTunerServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
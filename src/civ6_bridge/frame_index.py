@@ -0,0 +1,210 @@
+"""Sidecar index mapping turn numbers to frame byte offsets in Lua.log."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import NamedTuple, TextIO
+
+from civ6_bridge.log_parser import FrameScanner, frame_turn
+
+INDEX_SUFFIX = ".c6bidx"
+INDEX_FORMAT = 1
+
+_MAGIC = "civ6bridge-index"
+# Bytes at the start of the log hashed to detect a replaced file
+_HEAD_SIZE = 4096
+_SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+class IndexEntry(NamedTuple):
+    """Location of one frame in the log."""
+
+    turn: int
+    offset: int  # byte offset of the BEGIN sentinel
+    length: int  # bytes from the start of BEGIN to the end of END
+
+
+class _Identity(NamedTuple):
+    dev: int
+    ino: int
+    head_size: int
+    head_sha1: str
+
+
+def _read_identity(log_path: Path, head_size: int = _HEAD_SIZE) -> _Identity:
+    st = os.stat(log_path)
+    with open(log_path, "rb") as f:
+        head = f.read(head_size)
+    return _Identity(st.st_dev, st.st_ino, len(head), hashlib.sha1(head).hexdigest())
+
+
+class FrameIndex:
+    """Persistent turn → (offset, length) index stored next to the log.
+
+    The sidecar (``Lua.log.c6bidx`` by default) is a small append-only text file:
+    a header line identifying the log (device, inode and a hash of its first bytes),
+    then ``F turn offset length`` lines for frames and ``S position`` checkpoints
+    meaning "every frame before position is indexed". If the log is truncated or
+    replaced the index is discarded and rebuilt. With ``persist=False``, or if the
+    sidecar cannot be written, the index lives in memory only.
+
+    Sidecar writes go through one buffered append handle and reach disk at each
+    checkpoint (or on flush/close).
+    """
+
+    def __init__(self, log_path: Path, index_path: Path | None = None, persist: bool = True):
+        self.log_path = log_path
+        self.index_path = index_path or log_path.with_name(log_path.name + INDEX_SUFFIX)
+        self.indexed_to = 0
+        self._entries: dict[int, IndexEntry] = {}
+        self._identity: _Identity | None = None
+        self._persist = persist
+        self._file: TextIO | None = None
+        if persist:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, turn: int) -> bool:
+        return turn in self._entries
+
+    def get(self, turn: int) -> IndexEntry | None:
+        """Return the location of the latest frame for ``turn``, or None."""
+        return self._entries.get(turn)
+
+    def turns(self) -> list[int]:
+        """All indexed turn numbers, ascending."""
+        return sorted(self._entries)
+
+    def add(self, turn: int, offset: int, length: int) -> None:
+        """Record a frame. A later frame for the same turn (e.g. after a reload) replaces the earlier one."""
+        entry = IndexEntry(turn, offset, length)
+        if self._entries.get(turn) == entry:
+            return
+        self._entries[turn] = entry
+        self._append(f"F {turn} {offset} {length}\n")
+
+    def checkpoint(self, position: int) -> None:
+        """Record that every frame starting before ``position`` has been added."""
+        if position > self.indexed_to:
+            self.indexed_to = position
+            self._append(f"S {position}\n")
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered sidecar lines to disk."""
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError:
+                self._drop_persistence()
+
+    def close(self) -> None:
+        """Flush and close the sidecar handle. The index can still be used afterwards."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def is_valid(self) -> bool:
+        """True if the index still describes the log on disk."""
+        try:
+            size = os.stat(self.log_path).st_size
+        except FileNotFoundError:
+            return False
+        if self._identity is None or size < self.indexed_to:
+            return False
+        if size < self._identity.head_size:
+            return False
+        return _read_identity(self.log_path, self._identity.head_size) == self._identity
+
+    def update(self) -> None:
+        """Bring the index up to date with the log, scanning only unindexed bytes.
+
+        Frames are located by sentinel and their turn read with frame_turn; payloads
+        are not JSON-decoded here, so an invalid frame is only rejected when read.
+        """
+        if not self.is_valid():
+            self.reset()
+        scanner = FrameScanner(offset=self.indexed_to)
+        with open(self.log_path, "rb") as f:
+            f.seek(self.indexed_to)
+            while chunk := f.read(_SCAN_CHUNK_SIZE):
+                for frame in scanner.feed(chunk):
+                    turn = frame_turn(frame.payload)
+                    if turn is not None:
+                        self.add(turn, frame.offset, frame.length)
+        self.checkpoint(scanner.resume_offset)
+
+    def reset(self) -> None:
+        """Forget all entries and start a fresh sidecar for the current log file."""
+        self._entries.clear()
+        self.indexed_to = 0
+        self._identity = _read_identity(self.log_path)
+        self._write_header(self._identity)
+
+    def _load(self) -> None:
+        try:
+            lines = self.index_path.read_text(encoding="ascii").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+        if not lines:
+            return
+        header = lines[0].split()
+        if len(header) != 6 or header[0] != _MAGIC or header[1] != str(INDEX_FORMAT):
+            return
+        try:
+            self._identity = _Identity(int(header[2]), int(header[3]), int(header[4]), header[5])
+        except ValueError:
+            return
+        for line in lines[1:]:
+            parts = line.split()
+            try:
+                if parts[0] == "F" and len(parts) == 4:
+                    turn, offset, length = (int(p) for p in parts[1:])
+                    self._entries[turn] = IndexEntry(turn, offset, length)
+                elif parts[0] == "S" and len(parts) == 2:
+                    self.indexed_to = max(self.indexed_to, int(parts[1]))
+            except (IndexError, ValueError):
+                continue  # ignore a torn last line
+        if not self.is_valid():
+            self._entries.clear()
+            self.indexed_to = 0
+            self._identity = None
+
+    def _write_header(self, identity: _Identity) -> None:
+        if not self._persist:
+            return
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        line = f"{_MAGIC} {INDEX_FORMAT} {identity.dev} {identity.ino} {identity.head_size} {identity.head_sha1}\n"
+        try:
+            self.index_path.write_text(line, encoding="ascii")
+        except OSError:
+            self._drop_persistence()
+
+    def _append(self, line: str) -> None:
+        if self._identity is None:
+            self._identity = _read_identity(self.log_path)
+            self._write_header(self._identity)
+        if not self._persist:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.index_path, "a", encoding="ascii")  # noqa: SIM115
+            self._file.write(line)
+        except OSError:
+            self._drop_persistence()
+
+    def _drop_persistence(self) -> None:
+        self._persist = False
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
@@ -1,5 +1,13 @@
 """Build GameState model trees from parsed dicts and provide query helpers."""
 
+import dataclasses
+import typing
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from civ6_bridge.delta import apply_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.log_parser import is_delta_frame
 from civ6_bridge.models import (
     City,
     CultureState,
@@ -11,89 +19,135 @@ from civ6_bridge.models import (
     Unit,
 )
 
-
-def _build_treasury(data: dict) -> Treasury:
-    return Treasury(
-        gold_balance=float(data.get("gold_balance", 0)),
-        gold_yield=float(data.get("gold_yield", 0)),
-        total_maintenance=float(data.get("total_maintenance", 0)),
-    )
-
-
-def _build_culture(data: dict) -> CultureState:
-    return CultureState(progressing_civic=data.get("progressing_civic", ""))
-
-
-def _build_religion(data: dict) -> ReligionState:
-    return ReligionState(
-        faith_balance=float(data.get("faith_balance", 0)),
-        faith_yield=float(data.get("faith_yield", 0)),
-    )
-
-
-def _build_science(data: dict) -> ScienceState:
-    return ScienceState(
-        progressing_tech=data.get("progressing_tech", ""),
-        science_yield=float(data.get("science_yield", 0)),
-    )
-
-
-def _build_city(data: dict) -> City:
-    return City(
-        id=int(data.get("id", 0)),
-        name=data.get("name", ""),
-        x=int(data.get("x", 0)),
-        y=int(data.get("y", 0)),
-        population=int(data.get("population", 0)),
-        owner_id=int(data.get("owner_id", 0)),
-        buildings=tuple(data.get("buildings", [])),
-        districts=tuple(data.get("districts", [])),
-    )
-
-
-def _build_unit(data: dict) -> Unit:
-    return Unit(
-        id=int(data.get("id", 0)),
-        type=data.get("type", ""),
-        name=data.get("name", ""),
-        x=int(data.get("x", 0)),
-        y=int(data.get("y", 0)),
-        owner_id=int(data.get("owner_id", 0)),
-        moves_remaining=int(data.get("moves_remaining", 0)),
-        max_moves=int(data.get("max_moves", 0)),
-        combat=int(data.get("combat", 0)),
-        ranged_combat=int(data.get("ranged_combat", 0)),
-        range=int(data.get("range", 0)),
-        base_moves=int(data.get("base_moves", 2)),
-    )
-
-
-def _build_player(data: dict) -> Player:
-    return Player(
-        id=int(data.get("id", 0)),
-        is_alive=bool(data.get("is_alive", True)),
-        is_human=bool(data.get("is_human", False)),
-        civilization=data.get("civilization", ""),
-        leader=data.get("leader", ""),
-        treasury=_build_treasury(data.get("treasury", {})),
-        culture=_build_culture(data.get("culture", {})),
-        religion=_build_religion(data.get("religion", {})),
-        science=_build_science(data.get("science", {})),
-        cities=tuple(_build_city(c) for c in data.get("cities", [])),
-        units=tuple(_build_unit(u) for u in data.get("units", [])),
-    )
-
-
-def from_dict(data: dict) -> GameState:
-    """Convert a parsed JSON dict into a GameState model tree."""
-    return GameState(
-        version=int(data.get("version", 1)),
-        turn=int(data.get("turn", 0)),
-        players=tuple(_build_player(p) for p in data.get("players", [])),
-    )
-
-
-def get_human_player(state: GameState) -> Player | None:
+if TYPE_CHECKING:  # lazy_state builds on this module
+    from civ6_bridge.lazy_state import AnyGameState, LazyGameState, LazyPlayer
+
+M = TypeVar("M")
+
+
+def _default(f: dataclasses.Field) -> Any:
+    return f.default if f.default_factory is dataclasses.MISSING else f.default_factory()
+
+
+# Every model's fields as (name, type, default), in declaration order. from_dict,
+# decoder.decode_frame and StateBuilder all read and coerce fields from this table
+FIELDS: dict[type, tuple[tuple[str, Any, Any], ...]] = {
+    cls: tuple((f.name, f.type, _default(f)) for f in dataclasses.fields(cls))
+    for cls in (Treasury, CultureState, ReligionState, ScienceState, City, Unit, Player, GameState)
+}
+
+# The from_dict builder of each model, filled in by _builder()
+_BUILDERS: dict[type, Callable[[dict], Any]] = {}
+
+
+def _coercer(kind: Any) -> Callable[[Any], Any] | None:
+    """How from_dict turns a JSON value into a field of type ``kind``; None keeps it as is."""
+    if kind in (int, float, bool):
+        return kind
+    if kind is str:
+        return None
+    if kind in _BUILDERS:
+        build = _BUILDERS[kind]
+        # json.lua encodes an empty table as [], so anything but a dict gets the default
+        return lambda v: v if type(v) is kind else build(v) if isinstance(v, dict) else kind()
+    args = typing.get_args(kind)
+    if args and args[0] in _BUILDERS:
+        item, build_item = args[0], _BUILDERS[args[0]]
+        return lambda v: tuple(x if type(x) is item else build_item(x) for x in v)
+    return tuple
+
+
+def field_reader(
+    fields: tuple[tuple[str, Any, Any], ...],
+    coercer: Callable[[Any], Callable[[Any], Any] | None],
+    into: type | None = None,
+) -> Callable[[dict], Any]:
+    """Compile a function reading ``fields`` (entries of FIELDS) from a dict.
+
+    Missing keys take the field defaults, and each value goes through
+    ``coercer(field type)`` (None keeps it as is). The function returns the values as
+    a tuple, or ``into(*values)``. It is generated source, as dataclasses does for
+    __init__, so it costs what a hand-written one would.
+    """
+    namespace: dict[str, Any] = {"into": into}
+    values = []
+    for i, (name, kind, default) in enumerate(fields):
+        namespace[f"d{i}"] = default
+        value = f"get({name!r}, d{i})"
+        coerce = coercer(kind)
+        if coerce is not None:
+            namespace[f"c{i}"] = coerce
+            value = f"c{i}({value})"
+        values.append(value)
+    joined = ", ".join(values)
+    result = f"({joined},)" if into is None else f"into({joined})"
+    exec(f"def read(data):\n    get = data.get\n    return {result}\n", namespace)
+    return namespace["read"]
+
+
+def _builder(cls: type[M]) -> Callable[[dict], M]:
+    """Return a function building ``cls`` from a dict: missing keys take the defaults, values are coerced."""
+    build = field_reader(FIELDS[cls], _coercer, into=cls)
+    _BUILDERS[cls] = build
+    return build
+
+
+_build_treasury = _builder(Treasury)
+_build_culture = _builder(CultureState)
+_build_religion = _builder(ReligionState)
+_build_science = _builder(ScienceState)
+_build_city = _builder(City)
+_build_unit = _builder(Unit)
+_build_player = _builder(Player)
+_build_state = _builder(GameState)
+
+
+def from_dict(data: dict, base: dict | None = None) -> GameState:
+    """Convert a parsed JSON dict into a GameState model tree.
+
+    Delta frames are applied to ``base``, the parsed keyframe they were made against.
+    Raises ParseError for a delta frame without a matching base.
+    """
+    if is_delta_frame(data):
+        if base is None or base.get("turn") != data.get("base_turn"):
+            turn, base_turn = data.get("turn"), data.get("base_turn")
+            raise ParseError(f"Delta frame for turn {turn} needs the keyframe for turn {base_turn}")
+        data = apply_delta(base, data)
+    return _build_state(data)
+
+
+# Field names of every model, in declaration order
+_FIELD_NAMES = {cls: tuple(name for name, _kind, _default in fields) for cls, fields in FIELDS.items()}
+
+
+def _model_dict(obj: object) -> dict:
+    out = {}
+    for name in _FIELD_NAMES[type(obj)]:
+        value = getattr(obj, name)
+        if type(value) in _FIELD_NAMES:
+            value = _model_dict(value)
+        elif type(value) is tuple and value and type(value[0]) in _FIELD_NAMES:
+            value = tuple(map(_model_dict, value))
+        out[name] = value
+    return out
+
+
+def to_dict(state: "AnyGameState") -> dict:
+    """Convert a GameState model tree back into a JSON-compatible dict (the inverse of from_dict).
+
+    Gives the same result as dataclasses.asdict, without its deep copies of every value.
+    A LazyGameState (see civ6_bridge.lazy_state) is materialized first.
+    """
+    if not dataclasses.is_dataclass(state):
+        state = state.materialize()
+    return _model_dict(state)
+
+
+@overload
+def get_human_player(state: GameState) -> Player | None: ...
+@overload
+def get_human_player(state: "LazyGameState") -> "LazyPlayer | None": ...
+def get_human_player(state: "AnyGameState") -> "Player | LazyPlayer | None":
     """Return the first human player, or None."""
     for player in state.players:
         if player.is_human:
@@ -101,7 +155,11 @@ def get_human_player(state: GameState) -> Player | None:
     return None
 
 
-def get_player_by_id(state: GameState, player_id: int) -> Player | None:
+@overload
+def get_player_by_id(state: GameState, player_id: int) -> Player | None: ...
+@overload
+def get_player_by_id(state: "LazyGameState", player_id: int) -> "LazyPlayer | None": ...
+def get_player_by_id(state: "AnyGameState", player_id: int) -> "Player | LazyPlayer | None":
     """Return the player with the given ID, or None."""
     for player in state.players:
         if player.id == player_id:
@@ -0,0 +1,198 @@
+"""HistoryStore — compact, chunked on-disk history of GameStates."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from civ6_bridge.delta import apply_delta, make_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import from_dict, to_dict
+from civ6_bridge.models import GameState
+from civ6_bridge.state_builder import StateBuilder
+
+MAGIC = b"C6BHIST1"
+# [4-byte LE compressed length][4-byte LE state count], then one 4-byte LE turn per state
+CHUNK_HEADER = struct.Struct("<II")
+DEFAULT_CHUNK_SIZE = 64
+
+
+class _Chunk(NamedTuple):
+    offset: int  # byte offset of the compressed payload
+    length: int
+    turns: tuple[int, ...]
+
+
+def _encode(data: dict) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+class HistoryStore:
+    """Append-only, compressed history of GameStates with turn-range queries.
+
+    Usage:
+        with HistoryStore(Path("game.c6bh")) as store:
+            for state in LogWatcher(Path("Lua.log")).watch():
+                store.append(state)
+
+        store = HistoryStore(Path("game.c6bh"))
+        state = store.get(120)
+        for state in store.read_range(100, 151):
+            ...
+
+    States are written in chunks of ``chunk_size``. Each chunk is one zlib stream
+    holding the first state in full and every later state as a delta against the
+    one before it (see civ6_bridge.delta), one JSON document per line. Chunk headers
+    list the turns they hold, so opening a store only reads headers and a query
+    decompresses only the chunks it needs. States appended since the last full chunk
+    stay in memory until flush() or close(). A chunk torn by a crash is ignored and
+    overwritten by the next write.
+
+    States from one read_range() or iteration share every object that did not change
+    between them (see StateBuilder), so loading a long history keeps its memory low.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, level: int = 6):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.level = level
+        self._chunks: list[_Chunk] = []
+        # turn -> (chunk number, position in chunk) of the latest state for that turn
+        self._index: dict[int, tuple[int, int]] = {}
+        self._pending: list[dict] = []
+        self._end = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return sum(len(chunk.turns) for chunk in self._chunks) + len(self._pending)
+
+    def __contains__(self, turn: int) -> bool:
+        return turn in self._index or any(data["turn"] == turn for data in self._pending)
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def turns(self) -> list[int]:
+        """All stored turn numbers, ascending."""
+        return sorted(set(self._index).union(data["turn"] for data in self._pending))
+
+    def append(self, state: GameState) -> None:
+        """Add a state to the end of the history."""
+        self._pending.append(to_dict(state))
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def extend(self, states: Iterable[GameState]) -> None:
+        """Append every state from ``states``."""
+        for state in states:
+            self.append(state)
+
+    def flush(self) -> None:
+        """Write states held in memory to disk as one chunk."""
+        if not self._pending:
+            return
+        lines = [_encode(self._pending[0])]
+        lines += [_encode(make_delta(prev, cur)) for prev, cur in pairwise(self._pending)]
+        payload = zlib.compress("\n".join(lines).encode(), self.level)
+        turns = tuple(data["turn"] for data in self._pending)
+        header = CHUNK_HEADER.pack(len(payload), len(turns)) + struct.pack(f"<{len(turns)}i", *turns)
+        with open(self.path, "r+b") as f:
+            f.seek(self._end)
+            f.write(header + payload)
+            f.truncate()
+        self._add_chunk(_Chunk(self._end + len(header), len(payload), turns))
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending states. The store can still be read and appended to afterwards."""
+        self.flush()
+
+    def get(self, turn: int) -> GameState | None:
+        """Return the latest stored state for ``turn``, or None."""
+        for data in reversed(self._pending):
+            if data["turn"] == turn:
+                return from_dict(data)
+        location = self._index.get(turn)
+        if location is None:
+            return None
+        chunk_no, position = location
+        with open(self.path, "rb") as f:
+            for i, data in enumerate(self._decode_chunk(f, self._chunks[chunk_no])):
+                if i == position:
+                    return from_dict(data)
+        return None
+
+    def read_range(self, start: int, stop: int) -> Iterator[GameState]:
+        """Yield stored states with ``start`` <= turn < ``stop``, in the order they were appended."""
+        builder = StateBuilder()
+        with open(self.path, "rb") as f:
+            for chunk in self._chunks:
+                if any(start <= turn < stop for turn in chunk.turns):
+                    for data in self._decode_chunk(f, chunk):
+                        if start <= data["turn"] < stop:
+                            yield builder.build(data)
+        for data in list(self._pending):
+            if start <= data["turn"] < stop:
+                yield builder.build(data)
+
+    def __iter__(self) -> Iterator[GameState]:
+        """Yield every stored state in the order they were appended."""
+        builder = StateBuilder()
+        with open(self.path, "rb") as f:
+            for chunk in self._chunks:
+                for data in self._decode_chunk(f, chunk):
+                    yield builder.build(data)
+        for data in list(self._pending):
+            yield builder.build(data)
+
+    def _decode_chunk(self, f: BinaryIO, chunk: _Chunk) -> Iterator[dict]:
+        f.seek(chunk.offset)
+        lines = zlib.decompress(f.read(chunk.length)).split(b"\n")
+        state = json.loads(lines[0])
+        yield state
+        for line in lines[1:]:
+            state = apply_delta(state, json.loads(line))
+            yield state
+
+    def _add_chunk(self, chunk: _Chunk) -> None:
+        chunk_no = len(self._chunks)
+        self._chunks.append(chunk)
+        for position, turn in enumerate(chunk.turns):
+            self._index[turn] = (chunk_no, position)
+        self._end = chunk.offset + chunk.length
+
+    def _load(self) -> None:
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            size = 0
+        if size == 0:
+            self.path.write_bytes(MAGIC)
+            self._end = len(MAGIC)
+            return
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ParseError(f"{self.path} is not a civ6_bridge history file")
+            self._end = len(MAGIC)
+            while True:
+                header = f.read(CHUNK_HEADER.size)
+                if len(header) < CHUNK_HEADER.size:
+                    break
+                length, count = CHUNK_HEADER.unpack(header)
+                raw_turns = f.read(4 * count)
+                offset = self._end + CHUNK_HEADER.size + len(raw_turns)
+                if len(raw_turns) < 4 * count or offset + length > size:
+                    break  # torn chunk from an interrupted write
+                self._add_chunk(_Chunk(offset, length, struct.unpack(f"<{count}i", raw_turns)))
+                f.seek(self._end)
@@ -0,0 +1,260 @@
+"""Bulk ingestion of archived Lua.log files across a process pool."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from civ6_bridge.exceptions import ParseError, SchemaVersionError
+from civ6_bridge.game_state import to_dict
+from civ6_bridge.history_store import HistoryStore
+from civ6_bridge.log_parser import FrameScanner, may_be_delta, parse_frame
+from civ6_bridge.models import GameState
+from civ6_bridge.state_builder import StateBuilder
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Bytes read from a log in one go
+READ_CHUNK_SIZE = 1024 * 1024
+# Frame bytes handed to a worker in one task
+DEFAULT_BATCH_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class IngestStats:
+    """Progress of an ingest() run; passed to the progress callback after every batch."""
+
+    files_total: int = 0
+    files_done: int = 0
+    bytes_read: int = 0  # uncompressed log bytes scanned
+    frames: int = 0
+    states: int = 0
+    skipped: int = 0  # invalid frames, and deltas whose keyframe is not in the log
+    failed: list[tuple[Path, str]] = field(default_factory=list)  # unreadable files and why
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def states_per_second(self) -> float:
+        return self.states / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Sink(ABC):
+    """Receives the states of each log, in log order."""
+
+    @abstractmethod
+    def write(self, source: Path, states: list[GameState]) -> None:
+        """Store ``states``, the next states read from ``source``."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Flush and release the output."""
+
+
+class JsonlSink(Sink):
+    """One JSON line per state, ``{"source": ..., "state": ...}``; gzip-compressed if the path ends in .gz."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file: IO[str] = (
+            gzip.open(path, "wt", encoding="utf-8") if path.suffix == ".gz" else open(path, "w", encoding="utf-8")
+        )
+
+    def write(self, source: Path, states: list[GameState]) -> None:
+        name = str(source)
+        self._file.writelines(
+            json.dumps({"source": name, "state": to_dict(state)}, separators=(",", ":")) + "\n" for state in states
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class HistorySink(Sink):
+    """One HistoryStore per log, in ``directory``, named after the log (run1.log.gz -> run1.c6bh)."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+        self._stores: dict[Path, HistoryStore] = {}
+        self._names: set[str] = set()
+
+    def write(self, source: Path, states: list[GameState]) -> None:
+        store = self._stores.get(source)
+        if store is None:
+            store = self._stores[source] = HistoryStore(self._store_path(source))
+        store.extend(states)
+
+    def close(self) -> None:
+        for store in self._stores.values():
+            store.close()
+
+    def _store_path(self, source: Path) -> Path:
+        stem = source.name.removesuffix(".gz").rsplit(".", 1)[0] or source.name
+        name, n = stem, 1
+        while name in self._names:
+            n += 1
+            name = f"{stem}-{n}"
+        self._names.add(name)
+        return self.directory / f"{name}.c6bh"
+
+
+class CallbackSink(Sink):
+    """Calls ``callback(source, state)`` for every state."""
+
+    def __init__(self, callback: Callable[[Path, GameState], object]):
+        self.callback = callback
+
+    def write(self, source: Path, states: list[GameState]) -> None:
+        for state in states:
+            self.callback(source, state)
+
+
+def open_log(path: Path) -> io.BufferedIOBase:
+    """Open a log for streaming reads, decompressing it on the fly if it is gzip-compressed."""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    return gzip.open(path, "rb") if magic == _GZIP_MAGIC else open(path, "rb")
+
+
+def split_frames(f: io.BufferedIOBase, batch_bytes: int = DEFAULT_BATCH_BYTES) -> Iterator[list[str]]:
+    """Yield the frame payloads of a log stream in batches of about ``batch_bytes``.
+
+    A batch only ends right before a keyframe, so the delta frames in a batch can be
+    rebuilt from the keyframes in the same batch, and batches can be decoded independently.
+    """
+    scanner = FrameScanner()
+    batch: list[str] = []
+    size = 0
+    while chunk := f.read(READ_CHUNK_SIZE):
+        for frame in scanner.feed(chunk):
+            if size >= batch_bytes and not may_be_delta(frame.payload):
+                yield batch
+                batch, size = [], 0
+            batch.append(frame.payload)
+            size += len(frame.payload)
+    if batch:
+        yield batch
+
+
+def decode_batch(payloads: list[str]) -> tuple[list[GameState], int]:
+    """Decode a batch from split_frames into states; also return how many frames were skipped.
+
+    Runs in the worker processes. States share their unchanged objects (see StateBuilder),
+    which also keeps them small to send back.
+    """
+    builder = StateBuilder()
+    states: list[GameState] = []
+    keyframe: dict | None = None
+    skipped = 0
+    for raw in payloads:
+        try:
+            data = parse_frame(raw)
+            states.append(builder.build(data, base=keyframe))
+        except (ParseError, SchemaVersionError):
+            skipped += 1
+            continue
+        if not may_be_delta(raw):
+            keyframe = data
+    return states, skipped
+
+
+class _InlineExecutor(Executor):
+    """Runs tasks in the calling thread, for ``workers=1``; errors surface from result(), as with the pool."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def ingest(
+    paths: Iterable[Path],
+    sink: Sink,
+    workers: int | None = None,
+    batch_bytes: int = DEFAULT_BATCH_BYTES,
+    progress: Callable[[IngestStats], object] | None = None,
+) -> IngestStats:
+    """Parse every frame of the logs in ``paths`` and write the states to ``sink``.
+
+    Usage:
+        logs = sorted(Path("archive").glob("*.log*"))
+        stats = ingest(logs, JsonlSink(Path("states.jsonl.gz")), workers=8)
+        print(stats.states, stats.mb_per_second)
+
+    Logs are read as streams (gzip-compressed ones are decompressed on the fly),
+    split into batches at frame boundaries (see split_frames), and the batches are
+    decoded on a pool of ``workers`` processes (all CPUs by default; 1 decodes in
+    this process). States reach the sink in log order, log by log. At most two
+    batches per worker are in flight, so memory stays bounded whatever the size of
+    the archive. A file that cannot be read is recorded in ``stats.failed`` and the
+    run goes on. The sink is closed at the end.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    stats = IngestStats(files_total=len(paths))
+    executor: Executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else _InlineExecutor()
+    in_flight: deque[tuple[Path, Future]] = deque()
+    # The last batch of each file still in flight; the file is done once it is collected
+    last_batches: set[Future] = set()
+
+    def collect() -> None:
+        source, future = in_flight.popleft()
+        states, skipped = future.result()
+        sink.write(source, states)
+        stats.frames += len(states) + skipped
+        stats.states += len(states)
+        stats.skipped += skipped
+        if future in last_batches:
+            last_batches.remove(future)
+            stats.files_done += 1
+        if progress is not None:
+            progress(stats)
+
+    try:
+        for path in paths:
+            last: Future | None = None
+            try:
+                with open_log(path) as f:
+                    read = 0
+                    for batch in split_frames(f, batch_bytes):
+                        stats.bytes_read += f.tell() - read
+                        read = f.tell()
+                        if len(in_flight) >= 2 * workers:
+                            collect()
+                        last = executor.submit(decode_batch, batch)
+                        in_flight.append((path, last))
+                    stats.bytes_read += f.tell() - read
+            except (OSError, EOFError) as e:
+                stats.failed.append((path, str(e) or type(e).__name__))
+            if last is None:
+                stats.files_done += 1
+            else:
+                last_batches.add(last)
+        while in_flight:
+            collect()
+    finally:
+        executor.shutdown(cancel_futures=True)
+        sink.close()
+    if progress is not None:
+        progress(stats)
+    return stats
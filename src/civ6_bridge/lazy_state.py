@@ -0,0 +1,187 @@
+"""Lazy GameState views that build players, cities and units on first access."""
+
+from __future__ import annotations
+
+import dataclasses
+from abc import ABC, abstractmethod
+from functools import cached_property
+
+from civ6_bridge.delta import apply_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import (
+    _build_city,
+    _build_culture,
+    _build_religion,
+    _build_science,
+    _build_treasury,
+    _build_unit,
+)
+from civ6_bridge.log_parser import is_delta_frame
+from civ6_bridge.models import (
+    City,
+    CultureState,
+    GameState,
+    Player,
+    ReligionState,
+    ScienceState,
+    Treasury,
+    Unit,
+)
+
+
+class _Frozen(ABC):
+    """Attribute assignment raises FrozenInstanceError, as on the frozen models.
+
+    cached_property stores into the instance __dict__ directly, so caching still works.
+    """
+
+    _data: dict
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    @abstractmethod
+    def materialize(self) -> object:
+        """Return the equivalent frozen model."""
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Frozen):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        return f"Lazy{self.materialize()!r}"
+
+
+class LazyPlayer(_Frozen):
+    """A Player read from its frame dict: fields are coerced as from_dict does, on access.
+
+    ``treasury``, ``culture``, ``religion``, ``science``, ``cities`` and ``units`` are
+    built the first time they are read and then cached.
+    """
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    @property
+    def id(self) -> int:
+        return int(self._data.get("id", 0))
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self._data.get("is_alive", True))
+
+    @property
+    def is_human(self) -> bool:
+        return bool(self._data.get("is_human", False))
+
+    @property
+    def civilization(self) -> str:
+        return self._data.get("civilization", "")
+
+    @property
+    def leader(self) -> str:
+        return self._data.get("leader", "")
+
+    @cached_property
+    def treasury(self) -> Treasury:
+        return _build_treasury(self._data.get("treasury", {}))
+
+    @cached_property
+    def culture(self) -> CultureState:
+        return _build_culture(self._data.get("culture", {}))
+
+    @cached_property
+    def religion(self) -> ReligionState:
+        return _build_religion(self._data.get("religion", {}))
+
+    @cached_property
+    def science(self) -> ScienceState:
+        return _build_science(self._data.get("science", {}))
+
+    @cached_property
+    def cities(self) -> tuple[City, ...]:
+        return tuple(_build_city(c) for c in self._data.get("cities", []))
+
+    @cached_property
+    def units(self) -> tuple[Unit, ...]:
+        return tuple(_build_unit(u) for u in self._data.get("units", []))
+
+    def materialize(self) -> Player:
+        """Return the equivalent frozen Player, building everything not built yet."""
+        return Player(
+            id=self.id,
+            is_alive=self.is_alive,
+            is_human=self.is_human,
+            civilization=self.civilization,
+            leader=self.leader,
+            treasury=self.treasury,
+            culture=self.culture,
+            religion=self.religion,
+            science=self.science,
+            cities=self.cities,
+            units=self.units,
+        )
+
+
+class LazyGameState(_Frozen):
+    """A GameState that keeps its parsed frame dict and builds models only when read.
+
+    Usage:
+        state = lazy_from_dict(parse_frame(raw))
+        state.turn                          # no models built
+        get_human_player(state).treasury    # builds the players and one Treasury
+
+    It has the attributes of models.GameState (and its players those of
+    models.Player), compares equal to the equivalent GameState, and cannot be
+    modified. Each player's cities and units are built on first access and cached.
+    materialize() returns the plain frozen GameState. The frame dict must not be
+    modified while the lazy state is in use.
+    """
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    @property
+    def version(self) -> int:
+        return int(self._data.get("version", 1))
+
+    @property
+    def turn(self) -> int:
+        return int(self._data.get("turn", 0))
+
+    @cached_property
+    def players(self) -> tuple[LazyPlayer, ...]:
+        return tuple(LazyPlayer(p) for p in self._data.get("players", []))
+
+    def materialize(self) -> GameState:
+        """Return the equivalent frozen GameState, building everything not built yet."""
+        return GameState(
+            version=self.version,
+            turn=self.turn,
+            players=tuple(player.materialize() for player in self.players),
+        )
+
+
+# What LogWatcher and MultiLogWatcher yield: a LazyGameState with lazy=True, else a GameState
+AnyGameState = GameState | LazyGameState
+
+
+def lazy_from_dict(data: dict, base: dict | None = None) -> LazyGameState:
+    """Like game_state.from_dict, but return a LazyGameState over ``data``.
+
+    Delta frames are applied to ``base`` first (only the changed entities are copied).
+    Raises ParseError for a delta frame without a matching base.
+    """
+    if is_delta_frame(data):
+        if base is None or base.get("turn") != data.get("base_turn"):
+            turn, base_turn = data.get("turn"), data.get("base_turn")
+            raise ParseError(f"Delta frame for turn {turn} needs the keyframe for turn {base_turn}")
+        data = apply_delta(base, data)
+    return LazyGameState(data)
@@ -0,0 +1,133 @@
+"""Command load test against a FireTuner server (a game, or a FakeTunerServer)."""
+
+from __future__ import annotations
+
+import itertools
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from civ6_bridge.commands import GameCommands
+from civ6_bridge.constants import TUNER_HOST, TUNER_PORT
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.tuner_client import TunerClient
+
+# short: a connection per command; pooled: persistent connections; batched: batch_size commands per round trip
+MODES = ("short", "pooled", "batched")
+
+# (GameCommands / CommandBatch method, arguments), sent in turn
+WORKLOAD = (
+    ("move_unit", (0, 65536, 10, 12)),
+    ("add_gold", (0, 1)),
+    ("research_tech", (0, "TECH_WRITING")),
+    ("produce_unit", (0, 0, "UNIT_WARRIOR")),
+)
+
+
+@dataclass
+class LoadTestResult:
+    """Outcome of one load test run. Latencies are per round trip (a whole batch in batched mode)."""
+
+    mode: str
+    commands: int = 0  # commands answered, failed or not
+    requests: int = 0  # completed round trips
+    failed: int = 0  # commands answered with ERR
+    lost: int = 0  # commands without an answer: connection errors, timeouts, empty replies
+    seconds: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.seconds if self.seconds > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds below which ``q`` percent of round trips finished."""
+        if not self.latencies:
+            return 0.0
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[min(98, max(0, round(q) - 1))]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+
+def run_loadtest(
+    mode: str,
+    host: str = TUNER_HOST,
+    port: int = TUNER_PORT,
+    commands: int = 1000,
+    concurrency: int = 8,
+    batch_size: int = 20,
+    timeout: float = 5.0,
+) -> LoadTestResult:
+    """Send ``commands`` game commands from ``concurrency`` threads and measure throughput and latency.
+
+    Usage:
+        with FakeTunerServer(port=0, latency=0.002) as server:
+            result = run_loadtest("pooled", port=server.port, commands=5000)
+        print(result.commands_per_second, result.p99)
+
+    ``mode`` is one of MODES. The short-lived client reads each reply up to the
+    end of the connection, so a FakeTunerServer for "short" needs ``keep_alive=False``.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown load test mode {mode!r}; expected one of {', '.join(MODES)}")
+    if commands < 1 or concurrency < 1 or batch_size < 1:
+        raise ValueError("commands, concurrency and batch_size must be at least 1")
+    client = TunerClient(host, port, timeout, pool_size=concurrency if mode != "short" else 0)
+    game = GameCommands(client)
+    per_request = batch_size if mode == "batched" else 1
+    tickets = itertools.count()
+    lock = threading.Lock()
+    result = LoadTestResult(mode)
+
+    def worker() -> None:
+        latencies: list[float] = []
+        done = failed = lost = 0
+        while (first := next(tickets) * per_request) < commands:
+            calls = [WORKLOAD[i % len(WORKLOAD)] for i in range(first, min(first + per_request, commands))]
+            start = time.perf_counter()
+            try:
+                if mode == "batched":
+                    with game.batch() as batch:
+                        queued = [getattr(batch, name)(*args) for name, args in calls]
+                    answered = sum(call.result is not None or call.error is not None for call in queued)
+                    failed += sum(call.error is not None for call in queued)
+                else:
+                    name, args = calls[0]
+                    try:
+                        # The short-lived client returns an empty reply if the connection closes unanswered
+                        answered = 1 if getattr(game, name)(*args) else 0
+                    except TunerCommandError:
+                        answered = 1
+                        failed += 1
+            except TunerConnectionError:
+                lost += len(calls)
+                continue
+            latencies.append(time.perf_counter() - start)
+            done += answered
+            lost += len(calls) - answered
+        with lock:
+            result.commands += done
+            result.requests += len(latencies)
+            result.failed += failed
+            result.lost += lost
+            result.latencies += latencies
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+    finally:
+        client.close()
+    result.seconds = time.perf_counter() - start
+    return result
@@ -1,10 +1,34 @@
 """Extract and parse sentinel-delimited JSON frames from Lua.log text."""
 
 import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
 
 from civ6_bridge.constants import SCHEMA_VERSION, SENTINEL_BEGIN, SENTINEL_END
 from civ6_bridge.exceptions import ParseError, SchemaVersionError
 
+_BEGIN_BYTES = SENTINEL_BEGIN.encode()
+_END_BYTES = SENTINEL_END.encode()
+
+_TURN_RE = re.compile(r'"turn"\s*:\s*(-?\d+)')
+
+# "kind" of frames holding only what changed since a keyframe (see civ6_bridge.delta)
+DELTA_KIND = "delta"
+
+# Top-level key of the mod's export timings, and how far from the end of a frame it is looked for
+EXPORT_KEY = "export"
+EXPORT_SEARCH_SIZE = 512
+_EXPORT_MARKER = f'"{EXPORT_KEY}":{{'
+_json_decoder = json.JSONDecoder()
+
+# Block size used when scanning Lua.log backwards from the end.
+REVERSE_BLOCK_SIZE = 64 * 1024
+
+# Frames larger than this are dropped by FrameScanner instead of being buffered.
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
 
 def extract_frames(text: str) -> list[str]:
     """Find all complete BEGIN…END blocks in raw log text.
@@ -29,6 +53,194 @@ def extract_frames(text: str) -> list[str]:
     return frames
 
 
+def iter_frames_reverse(
+    path: Path, block_size: int = REVERSE_BLOCK_SIZE, max_frame_size: int = MAX_FRAME_SIZE
+) -> Iterator[str]:
+    """Yield complete BEGIN…END frames from a log file, newest first.
+
+    Reads fixed-size blocks backwards from the end of the file, so the cost of
+    reaching the last frame depends on the frame size, not the log size. Each block
+    is searched once, plus a few bytes of overlap for sentinels split across blocks.
+    Incomplete (truncated) frames are silently skipped, as in extract_frames, and
+    frames larger than ``max_frame_size`` are skipped without being buffered.
+    """
+    overlap = max(len(_BEGIN_BYTES), len(_END_BYTES)) - 1
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        carry = b""  # head of the previous window, searched again for split sentinels
+        # Payload pieces after the current window, newest first; None until an END is found
+        parts: list[bytes] | None = None
+        size = 0
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            window = f.read(read_size) + carry
+            limit = len(window)  # only window[:limit] is still unsearched
+            while True:
+                end_idx = window.rfind(_END_BYTES, 0, limit)
+                if parts is None:
+                    if end_idx == -1:
+                        break
+                    parts, size, limit = [], 0, end_idx
+                    continue
+                begin_idx = window.rfind(_BEGIN_BYTES, 0, limit)
+                if end_idx > begin_idx:
+                    # END without a matching BEGIN (e.g. a frame cut by a restart)
+                    parts, size, limit = [], 0, end_idx
+                    continue
+                if begin_idx == -1:
+                    break
+                payload_start = begin_idx + len(_BEGIN_BYTES)
+                if size + limit - payload_start <= max_frame_size:
+                    raw = (window[payload_start:limit] + b"".join(reversed(parts))).strip()
+                    if raw:
+                        yield raw.decode("utf-8", errors="replace")
+                parts, limit = None, begin_idx
+            keep = min(overlap, limit)
+            if parts is not None:
+                parts.append(window[keep:limit])
+                size += limit - keep
+                if size > max_frame_size:
+                    # Too large to be a frame; the skipped bytes hold no sentinel
+                    parts = None
+            carry = window[:keep]
+
+
+class ScannedFrame(NamedTuple):
+    """A complete frame found by FrameScanner."""
+
+    payload: str
+    offset: int  # byte offset of the BEGIN sentinel in the stream
+    length: int  # bytes from the start of BEGIN to the end of END
+
+
+class FrameScanner:
+    """Incremental, byte-level sentinel scanner for a growing log.
+
+    Feed it arbitrary chunks of bytes; it returns the frames completed by each chunk
+    and keeps any partial frame for the next call. Only frame payloads are decoded
+    to text. Frames larger than ``max_frame_size`` are dropped so memory stays bounded.
+    """
+
+    def __init__(self, offset: int = 0, max_frame_size: int = MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self.dropped = 0
+        self._buf = bytearray()
+        self._buf_offset = offset
+        # Where to resume looking for END inside a pending frame at the start of _buf
+        self._end_search_from = 0
+
+    @property
+    def offset(self) -> int:
+        """Stream offset just past the last byte fed."""
+        return self._buf_offset + len(self._buf)
+
+    @property
+    def resume_offset(self) -> int:
+        """Stream offset from which a fresh scanner would find every frame not yet returned."""
+        return self._buf_offset
+
+    @property
+    def pending(self) -> bool:
+        """True if a frame has started but its END sentinel has not been seen yet."""
+        return self._buf.startswith(_BEGIN_BYTES)
+
+    def reset(self, offset: int = 0) -> None:
+        """Discard any buffered data and restart at ``offset``."""
+        self._buf.clear()
+        self._buf_offset = offset
+        self._end_search_from = 0
+
+    def feed(self, data: bytes) -> list[ScannedFrame]:
+        """Append ``data`` and return the frames it completes."""
+        buf = self._buf
+        buf += data
+        frames: list[ScannedFrame] = []
+        start = 0
+        while True:
+            begin_idx = buf.find(_BEGIN_BYTES, start)
+            if begin_idx == -1:
+                # Keep just enough bytes to match a BEGIN split across chunks
+                keep_from = max(start, len(buf) - (len(_BEGIN_BYTES) - 1))
+                self._end_search_from = 0
+                break
+            payload_start = begin_idx + len(_BEGIN_BYTES)
+            search_from = payload_start
+            if begin_idx == 0 and self._end_search_from > payload_start:
+                search_from = self._end_search_from
+            end_idx = buf.find(_END_BYTES, search_from)
+            if end_idx == -1:
+                if len(buf) - begin_idx > self.max_frame_size:
+                    self.dropped += 1
+                    start = payload_start
+                    continue
+                keep_from = begin_idx
+                self._end_search_from = len(buf) - begin_idx - (len(_END_BYTES) - 1)
+                break
+            frame_end = end_idx + len(_END_BYTES)
+            start = frame_end
+            if frame_end - begin_idx > self.max_frame_size:
+                self.dropped += 1
+                continue
+            raw = buf[payload_start:end_idx].strip()
+            if raw:
+                frames.append(
+                    ScannedFrame(
+                        payload=raw.decode("utf-8", errors="replace"),
+                        offset=self._buf_offset + begin_idx,
+                        length=frame_end - begin_idx,
+                    )
+                )
+        del buf[:keep_from]
+        self._buf_offset += keep_from
+        return frames
+
+
+def frame_turn(raw: str) -> int | None:
+    """Read the top-level turn number of a frame without decoding the whole JSON.
+
+    Only frame objects have a "turn" key (quotes inside string values are escaped),
+    and the mod sorts keys so it sits near the end; the search starts there.
+    Returns None if the frame has no turn. Use parse_frame to validate the frame.
+    """
+    idx = raw.rfind('"turn"')
+    if idx == -1:
+        return None
+    match = _TURN_RE.match(raw, idx)
+    return int(match.group(1)) if match else None
+
+
+def frame_export(raw: str) -> dict | None:
+    """Cheap lookup of the mod's export timings in an undecoded frame, or None if it has none.
+
+    ExportGameState appends ``"export": {...}`` as the last key of the frame, so only the
+    last EXPORT_SEARCH_SIZE characters are searched and only that object is decoded.
+    """
+    idx = raw.rfind(_EXPORT_MARKER, max(0, len(raw) - EXPORT_SEARCH_SIZE))
+    if idx == -1:
+        return None
+    try:
+        export, _ = _json_decoder.raw_decode(raw, idx + len(_EXPORT_MARKER) - 1)
+    except json.JSONDecodeError:
+        return None
+    return export if isinstance(export, dict) else None
+
+
+def is_delta_frame(data: dict) -> bool:
+    """True if a parsed frame is a delta against the keyframe for ``data["base_turn"]``."""
+    return data.get("kind") == DELTA_KIND
+
+
+def may_be_delta(raw: str) -> bool:
+    """Cheap test on an undecoded frame: False means it is certainly not a delta frame.
+
+    Only delta frames carry a "kind" key, and a quote inside a string value is escaped,
+    so a frame without the literal ``"kind"`` is a keyframe.
+    """
+    return '"kind"' in raw
+
+
 def parse_frame(raw: str) -> dict:
     """Parse a single JSON frame string and validate the schema version.
 
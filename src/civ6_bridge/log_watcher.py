@@ -3,16 +3,36 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
+from typing import BinaryIO, Generic, Literal, TypeVar, cast, overload
 
+from civ6_bridge import metrics
+from civ6_bridge.decoder import decode_frame
 from civ6_bridge.exceptions import LogNotFoundError, ParseError, SchemaVersionError
+from civ6_bridge.frame_index import FrameIndex, IndexEntry
 from civ6_bridge.game_state import from_dict
-from civ6_bridge.log_parser import extract_frames, parse_frame
-from civ6_bridge.models import GameState
+from civ6_bridge.lazy_state import AnyGameState, LazyGameState, lazy_from_dict
+from civ6_bridge.log_parser import (
+    FrameScanner,
+    frame_export,
+    frame_turn,
+    is_delta_frame,
+    iter_frames_reverse,
+    may_be_delta,
+    parse_frame,
+)
+from civ6_bridge.models import FrameMeta, GameState
+from civ6_bridge.watch_backend import WatchBackend, create_backend
 
+# Maximum number of bytes read from the log in one go while tailing.
+READ_CHUNK_SIZE = 1024 * 1024
 
-class LogWatcher:
+# The state type a LogWatcher yields: GameState, or LazyGameState with lazy=True
+S = TypeVar("S", GameState, LazyGameState, AnyGameState)
+
+
+class LogWatcher(Generic[S]):
     """Watches a Lua.log file for sentinel-delimited game state frames.
 
     Usage:
@@ -24,59 +44,328 @@ class LogWatcher:
         # Continuous: yield new states as they appear
         for state in watcher.watch(poll_interval=1.0):
             print(state.turn)
+
+        # Random access through the frame index
+        state = watcher.read_turn(120)
+        for state in watcher.iter_turns(100, 151):
+            ...
+
+        # Where each turn's latency went (see models.FrameMeta)
+        for state, meta in watcher.watch_with_meta():
+            print(meta.export_seconds, meta.visibility_lag, meta.processing_seconds)
+
+    Delta frames (see CIV6BRIDGE_KEYFRAME_INTERVAL in the mod) are rebuilt into full
+    states from their keyframe; a delta whose keyframe is not in the log is skipped.
+
+    The frame index is kept in memory by default. With ``persist_index=True`` it is
+    also saved to a sidecar next to the log (Lua.log.c6bidx), so a later LogWatcher
+    only scans bytes appended since.
+
+    With ``lazy=True`` states are LazyGameState views (see civ6_bridge.lazy_state)
+    that only build the players, cities and units a consumer reads.
     """
 
-    def __init__(self, log_path: Path):
+    @overload
+    def __init__(
+        self: LogWatcher[GameState], log_path: Path, persist_index: bool = False, lazy: Literal[False] = False
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: LogWatcher[LazyGameState], log_path: Path, persist_index: bool = False, *, lazy: Literal[True]
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: LogWatcher[AnyGameState], log_path: Path, persist_index: bool = False, *, lazy: bool
+    ) -> None: ...
+
+    def __init__(self, log_path: Path, persist_index: bool = False, lazy: bool = False):
         if not log_path.exists():
             raise LogNotFoundError(f"Log file not found: {log_path}")
         self.log_path = log_path
+        self.index = FrameIndex(log_path, persist=persist_index)
+        self.lazy = lazy
+        # S is LazyGameState exactly when lazy; decode_frame only runs when it is GameState
+        self._from_dict = cast("Callable[..., S]", lazy_from_dict if lazy else from_dict)
         self._position: int = 0
+        self._scanner = FrameScanner()
+        # Last keyframe seen, the base for the delta frames that follow it. Keyframes are
+        # decoded straight into models, so the dict is only parsed once a delta needs it
+        self._keyframe_raw: str | None = None
+        self._keyframe: dict | None = None
+        # True while every frame before the tail position is in the index
+        self._index_current = False
+        # Timings of the last state read while tailing
+        self.last_meta: FrameMeta | None = None
+
+    def read_latest(self) -> S | None:
+        """Return the last valid GameState in the log, or None.
+
+        Scans backwards from the end of the file and stops at the first frame that parses
+        (and, for a delta frame, at its keyframe).
+        """
+        delta: dict | None = None
+        for raw in iter_frames_reverse(self.log_path):
+            try:
+                if delta is None:
+                    if not self.lazy and not may_be_delta(raw):
+                        return cast("S", decode_frame(raw))
+                    data = parse_frame(raw)
+                    if not is_delta_frame(data):
+                        return self._from_dict(data)
+                    delta = data
+                elif not may_be_delta(raw) and frame_turn(raw) == delta.get("base_turn"):
+                    return self._from_dict(delta, base=parse_frame(raw))
+            except (ParseError, SchemaVersionError):
+                continue
+        return None
 
-    def read_latest(self) -> GameState | None:
-        """Read the entire log file and return the last valid GameState, or None."""
-        text = self.log_path.read_text(encoding="utf-8", errors="replace")
-        frames = extract_frames(text)
-        if not frames:
+    def read_turn(self, turn: int) -> S | None:
+        """Return the state exported for ``turn``, or None if the log has no valid frame for it.
+
+        Brings the frame index up to date, then reads only that frame (and its keyframe).
+        """
+        self.index.update()
+        entry = self.index.get(turn)
+        if entry is None:
             return None
-        # Parse from the end, return first valid frame
-        for raw in reversed(frames):
+        with open(self.log_path, "rb") as f:
+            return self._read_entry(f, entry)
+
+    def iter_turns(self, start: int, stop: int) -> Generator[S, None, None]:
+        """Yield the states for turns ``start`` <= turn < ``stop`` that exist in the log, in turn order."""
+        self.index.update()
+        with open(self.log_path, "rb") as f:
+            for turn in self.index.turns():
+                if start <= turn < stop:
+                    state = self._read_entry(f, self.index.get(turn))
+                    if state is not None:
+                        yield state
+
+    def _read_entry(self, f: BinaryIO, entry: IndexEntry | None) -> S | None:
+        raw = self._entry_payload(f, entry)
+        if raw is None:
+            return None
+
+        def find_base(turn: int | None) -> dict | None:
+            base = self._last_keyframe(turn)
+            if base is None and turn is not None:
+                base_raw = self._entry_payload(f, self.index.get(turn))
+                if base_raw is not None and not may_be_delta(base_raw):
+                    base = parse_frame(base_raw)
+                    self._keyframe_raw, self._keyframe = base_raw, base
+            return base
+
+        try:
+            return self._decode(raw, find_base)
+        except (ParseError, SchemaVersionError):
+            return None
+
+    def _entry_payload(self, f: BinaryIO, entry: IndexEntry | None) -> str | None:
+        if entry is None:
+            return None
+        f.seek(entry.offset)
+        frames = FrameScanner(offset=entry.offset).feed(f.read(entry.length))
+        if len(frames) != 1 or frames[0].offset != entry.offset:
+            return None
+        return frames[0].payload
+
+    def _decode(self, raw: str, find_base: Callable[[int | None], dict | None]) -> S:
+        """Decode a frame into a GameState.
+
+        A keyframe becomes the base for later deltas; a delta is rebuilt on
+        ``find_base(base_turn)``. Raises ParseError or SchemaVersionError for an invalid frame or a missing keyframe.
+        """
+        timed = metrics.METRICS.enabled
+        start = time.perf_counter() if timed else 0.0
+        if not self.lazy and not may_be_delta(raw):
+            state = cast("S", decode_frame(raw))
+            if timed:
+                metrics.DECODE_FRAME_SECONDS.observe(time.perf_counter() - start)
+            self._keyframe_raw, self._keyframe = raw, None
+            return state
+        data = parse_frame(raw)
+        if timed:
+            metrics.PARSE_FRAME_SECONDS.observe(time.perf_counter() - start)
+        if not is_delta_frame(data):
+            self._keyframe_raw, self._keyframe = raw, data
+            base = None
+        else:
+            base = find_base(data.get("base_turn"))
+        start = time.perf_counter() if timed else 0.0
+        state = self._from_dict(data, base=base)
+        if timed:
+            metrics.FROM_DICT_SECONDS.observe(time.perf_counter() - start)
+        return state
+
+    def _last_keyframe(self, turn: int | None) -> dict | None:
+        """The last keyframe seen, parsed to a dict, if it is the one for ``turn``."""
+        if self._keyframe_raw is None or frame_turn(self._keyframe_raw) != turn:
+            return None
+        if self._keyframe is None:
+            self._keyframe = parse_frame(self._keyframe_raw)
+        return self._keyframe
+
+    def _find_keyframe(self, turn: int | None) -> dict | None:
+        """Return the keyframe for ``turn``, searching the log backwards if it is not the last one seen.
+
+        The search gives up at the first older keyframe.
+        """
+        base = self._last_keyframe(turn)
+        if base is not None or turn is None:
+            return base
+        for raw in iter_frames_reverse(self.log_path):
+            if may_be_delta(raw):
+                continue
             try:
                 data = parse_frame(raw)
-                return from_dict(data)
             except (ParseError, SchemaVersionError):
                 continue
+            if data.get("turn") == turn:
+                self._keyframe_raw, self._keyframe = raw, data
+                return data
+            if data.get("turn", turn) < turn:
+                return None
         return None
 
-    def watch(self, poll_interval: float = 1.0) -> Generator[GameState, None, None]:
+    def watch(self, poll_interval: float = 1.0, backend: WatchBackend | str = "auto") -> Generator[S, None, None]:
         """Yield GameState objects as new frames appear in the log.
 
-        Handles file truncation (e.g., game restart) by resetting position.
+        Between reads the watcher sleeps on ``backend``: a WatchBackend instance, or
+        one of "auto", "inotify", "poll" (see watch_backend.create_backend).
+        ``poll_interval`` is the longest it sleeps without checking the log.
+
+        Frames that are only partially written when the log is read are kept and
+        completed on a later read. Handles file truncation (e.g., game restart) by
+        resetting position.
         """
+        frames = self.watch_with_meta(poll_interval, backend)
+        try:
+            for state, _meta in frames:
+                yield state
+        finally:
+            frames.close()
+
+    def watch_with_meta(
+        self, poll_interval: float = 1.0, backend: WatchBackend | str = "auto"
+    ) -> Generator[tuple[S, FrameMeta], None, None]:
+        """Like watch(), but yield each state with the FrameMeta of its frame."""
+        self.start_tail()
+        owned = isinstance(backend, str)
+        waiter = create_backend(self.log_path, poll_interval, backend) if owned else backend
+        try:
+            while True:
+                start = self._position
+                yield from self._read_new_frames()
+                waiter.notify(self._position != start)
+                waiter.wait(expect_frame=self.pending)
+        finally:
+            if owned:
+                waiter.close()
+
+    # -- step API, for driving the tail from another loop (see AsyncLogWatcher) --
+
+    @property
+    def position(self) -> int:
+        """Byte offset up to which the log has been read while tailing."""
+        return self._position
+
+    @property
+    def pending(self) -> bool:
+        """True if the tail has seen the start of a frame but not its end yet."""
+        return self._scanner.pending
+
+    def start_tail(self) -> None:
+        """Skip everything already in the log; only frames appended from now on are read."""
         self._position = self.log_path.stat().st_size
+        self._scanner.reset(self._position)
+        self._index_current = self.index.is_valid() and self.index.indexed_to >= self._position
 
-        while True:
-            try:
-                size = self.log_path.stat().st_size
-            except FileNotFoundError:
-                time.sleep(poll_interval)
-                continue
+    def read_new(self) -> list[S]:
+        """Read everything appended since the last call and return the new states.
 
-            # Detect truncation
-            if size < self._position:
-                self._position = 0
+        Call start_tail() first. watch() is this plus a wait between calls.
+        """
+        return [state for state, _meta in self._read_new_frames()]
+
+    def read_new_with_meta(self) -> list[tuple[S, FrameMeta]]:
+        """Like read_new(), but pair each state with the FrameMeta of its frame."""
+        return list(self._read_new_frames())
+
+    def _read_new_frames(self) -> Generator[tuple[S, FrameMeta], None, None]:
+        """Read everything appended since the last call, in bounded chunks."""
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            return
+        size = stat.st_size
 
-            if size > self._position:
-                with open(self.log_path, encoding="utf-8", errors="replace") as f:
-                    f.seek(self._position)
-                    new_text = f.read()
-                    self._position = f.tell()
+        # Detect truncation
+        if size < self._position:
+            self._position = 0
+            self._keyframe_raw = self._keyframe = None
+            self._scanner.reset(0)
+            self.index.reset()
+            self._index_current = True
 
-                frames = extract_frames(new_text)
-                for raw in frames:
+        if size <= self._position:
+            return
+
+        # Metrics are counted only if enabled when the read starts
+        timed = metrics.METRICS.enabled
+        lag_observed = False
+        with open(self.log_path, "rb") as f:
+            f.seek(self._position)
+            while chunk := f.read(READ_CHUNK_SIZE):
+                read_at = time.time()
+                self._position += len(chunk)
+                if timed:
+                    metrics.LOG_BYTES_READ.inc(len(chunk))
+                for frame in self._scanner.feed(chunk):
+                    if timed:
+                        metrics.FRAMES_FOUND.inc()
                     try:
-                        data = parse_frame(raw)
-                        yield from_dict(data)
-                    except (ParseError, SchemaVersionError):
+                        state = self._decode(frame.payload, self._find_keyframe)
+                    except (ParseError, SchemaVersionError) as e:
+                        if timed:
+                            schema = isinstance(e, SchemaVersionError)
+                            (metrics.FRAMES_SKIPPED_SCHEMA if schema else metrics.FRAMES_SKIPPED_PARSE).inc()
                         continue
+                    self.index.add(state.turn, frame.offset, frame.length)
+                    meta = self._frame_meta(state, frame.payload, frame.offset, read_at)
+                    self.last_meta = meta
+                    if timed:
+                        if not lag_observed:
+                            # Time since the log was last written, when the first new state is ready
+                            metrics.TAIL_LAG_SECONDS.observe(max(0.0, meta.parsed_at - stat.st_mtime))
+                            lag_observed = True
+                        if (export_seconds := meta.export_seconds) is not None:
+                            metrics.EXPORT_SECONDS.observe(export_seconds)
+                        if (visibility_lag := meta.visibility_lag) is not None:
+                            metrics.VISIBILITY_LAG_SECONDS.observe(max(0.0, visibility_lag))
+                    yield state, meta
+        if self._index_current:
+            self.index.checkpoint(self._scanner.resume_offset)
+
+    @staticmethod
+    def _frame_meta(state: S, raw: str, offset: int, read_at: float) -> FrameMeta:
+        parsed_at = time.time()
+        export = frame_export(raw)
+        if export is None:
+            return FrameMeta(state.turn, offset, read_at, parsed_at)
+
+        def seconds(key: str) -> float | None:
+            value = export.get(key)
+            return float(value) if isinstance(value, int | float) else None
 
-            time.sleep(poll_interval)
+        return FrameMeta(
+            state.turn,
+            offset,
+            read_at,
+            parsed_at,
+            seconds("started"),
+            seconds("finished"),
+            seconds("build_seconds"),
+            seconds("serialize_seconds"),
+        )
@@ -0,0 +1,280 @@
+"""Counters and latency histograms for the log and command pipelines, exported in Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{value}"' for key, value in sorted(labels.items())) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A count that only goes up. Created by Metrics.counter()."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: dict[str, str]):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0
+
+    def snapshot(self) -> int:
+        return self.value
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [(_series(self.name, self.labels), self.value)]
+
+
+class HistogramSnapshot(NamedTuple):
+    """Observations of a Histogram at one point in time."""
+
+    count: int
+    sum: float
+    buckets: tuple[tuple[float, int], ...]  # (upper bound, cumulative count), ending with +Inf
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0–1) by interpolating inside its bucket, like Prometheus does."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower, below = 0.0, 0
+        for bound, cumulative in self.buckets:
+            if cumulative >= rank:
+                if bound == math.inf:
+                    return lower  # past the last finite bound; its value is all we know
+                inside = cumulative - below
+                return lower + (bound - lower) * ((rank - below) / inside if inside else 1.0)
+            lower, below = bound, cumulative
+        return lower
+
+    @property
+    def p50(self) -> float:
+        return self.quantile(0.5)
+
+    @property
+    def p99(self) -> float:
+        return self.quantile(0.99)
+
+
+class Histogram:
+    """Observed values counted into fixed buckets, plus their count and sum. Created by Metrics.histogram()."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: dict[str, str], buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be increasing")
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.bounds = tuple(buckets)
+        self._counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self._sum = 0.0
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, buckets = 0, []
+        for bound, count in zip((*self.bounds, math.inf), counts, strict=True):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return HistogramSnapshot(cumulative, total, tuple(buckets))
+
+    def samples(self) -> list[tuple[str, float]]:
+        snap = self.snapshot()
+        samples: list[tuple[str, float]] = [
+            (_series(f"{self.name}_bucket", {**self.labels, "le": _number(bound)}), count)
+            for bound, count in snap.buckets
+        ]
+        samples.append((_series(f"{self.name}_sum", self.labels), snap.sum))
+        samples.append((_series(f"{self.name}_count", self.labels), snap.count))
+        return samples
+
+
+class Metrics:
+    """A registry of counters and histograms that can be switched off.
+
+    Usage:
+        METRICS.enable()
+        for state in LogWatcher(path).watch():
+            ...
+        print(METRICS.snapshot()["civ6bridge_frames_found_total"])
+        print(METRICS.to_prometheus())
+
+        # Or serve it for Prometheus to scrape
+        start_http_server(9464)
+
+    Instrumented code checks ``enabled`` before taking any timing, so while the
+    registry is disabled each instrumented spot costs one attribute read. Metrics
+    are process-wide: every LogWatcher, Civ6Bridge and TunerClient of the process
+    adds to the same series. A metric is identified by its name and labels;
+    registering it twice returns the same object.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def counter(self, name: str, help: str, **labels: str) -> Counter:
+        """Register a counter, or return the one already registered with this name and labels."""
+        return self._register(Counter, name, help, labels)
+
+    def histogram(self, name: str, help: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS, **labels: str) -> Histogram:
+        """Register a histogram, or return the one already registered with this name and labels."""
+        return self._register(Histogram, name, help, labels, buckets)
+
+    def _register(self, cls: type, name: str, help: str, labels: dict[str, str], *args: object):
+        key = _series(name, labels)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = cls(name, help, labels, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{key} is already registered as a {metric.kind}")
+        return metric
+
+    def snapshot(self) -> dict[str, int | HistogramSnapshot]:
+        """Current value of every metric, keyed by series name (with labels, as in Prometheus)."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {key: metric.snapshot() for key, metric in metrics.items()}
+
+    def reset(self) -> None:
+        """Set every counter and histogram back to zero."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def to_prometheus(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        described: set[str] = set()
+        for metric in metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{series} {_number(value)}" for series, value in metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# The registry all of civ6_bridge reports to; set CIV6BRIDGE_METRICS=1 to enable it at import
+METRICS = Metrics(enabled=os.environ.get("CIV6BRIDGE_METRICS", "") not in ("", "0"))
+
+# LogWatcher
+LOG_BYTES_READ = METRICS.counter("civ6bridge_log_bytes_read_total", "Bytes of Lua.log read while tailing")
+FRAMES_FOUND = METRICS.counter("civ6bridge_frames_found_total", "Complete frames found while tailing")
+FRAMES_SKIPPED_PARSE = METRICS.counter(
+    "civ6bridge_frames_skipped_total", "Frames skipped while tailing, by error", error="ParseError"
+)
+FRAMES_SKIPPED_SCHEMA = METRICS.counter(
+    "civ6bridge_frames_skipped_total", "Frames skipped while tailing, by error", error="SchemaVersionError"
+)
+DECODE_FRAME_SECONDS = METRICS.histogram(
+    "civ6bridge_decode_frame_seconds", "Seconds decoding a keyframe straight into a GameState"
+)
+PARSE_FRAME_SECONDS = METRICS.histogram("civ6bridge_parse_frame_seconds", "Seconds in parse_frame")
+FROM_DICT_SECONDS = METRICS.histogram("civ6bridge_from_dict_seconds", "Seconds in from_dict")
+TAIL_LAG_SECONDS = METRICS.histogram(
+    "civ6bridge_tail_lag_seconds", "Seconds from the last write to Lua.log until its new states were read"
+)
+EXPORT_SECONDS = METRICS.histogram(
+    "civ6bridge_export_seconds", "Seconds the mod spent exporting a frame, from its export timings"
+)
+VISIBILITY_LAG_SECONDS = METRICS.histogram(
+    "civ6bridge_visibility_lag_seconds", "Seconds from the mod printing a frame until it was read from Lua.log"
+)
+
+# TunerClient
+TUNER_REQUESTS = METRICS.counter("civ6bridge_tuner_requests_total", "FireTuner round trips attempted")
+TUNER_ROUND_TRIP_SECONDS = METRICS.histogram(
+    "civ6bridge_tuner_round_trip_seconds", "Seconds from sending a FireTuner command until its reply was read"
+)
+TUNER_CONNECTION_ERRORS = METRICS.counter(
+    "civ6bridge_tuner_errors_total", "Failed FireTuner commands, by cause", error="connection"
+)
+TUNER_COMMAND_ERRORS = METRICS.counter(
+    "civ6bridge_tuner_errors_total", "Failed FireTuner commands, by cause", error="command"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    metrics: Metrics = METRICS
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.metrics.to_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # no access log on stderr
+
+
+def start_http_server(port: int = 9464, host: str = "127.0.0.1", metrics: Metrics = METRICS) -> ThreadingHTTPServer:
+    """Serve ``metrics`` at /metrics from a background thread; stop with the returned server's shutdown()."""
+    handler = type("MetricsHandler", (_Handler,), {"metrics": metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="civ6bridge-metrics", daemon=True).start()
+    return server
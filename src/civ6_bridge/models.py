@@ -75,3 +75,48 @@ class GameState:
     version: int = 1
     turn: int = 0
     players: tuple[Player, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrameMeta:
+    """Where the time went between the mod exporting a frame and its GameState being ready.
+
+    All times are Unix timestamps in seconds. The ``export_*`` ones come from the
+    mod (see ExportGameState) and are None for frames without export timings; the
+    game's clock only resolves whole seconds outside Windows.
+    """
+
+    turn: int = 0
+    offset: int = 0  # byte offset of the frame in the log
+    read_at: float = 0.0  # when the end of the frame was read from the log
+    parsed_at: float = 0.0  # when its GameState was built
+    export_started: float | None = None
+    export_finished: float | None = None
+    build_seconds: float | None = None  # mod: collecting the state
+    serialize_seconds: float | None = None  # mod: encoding it to JSON
+
+    @property
+    def export_seconds(self) -> float | None:
+        """Time the mod spent in ExportGameState."""
+        if self.export_started is None or self.export_finished is None:
+            return None
+        return self.export_finished - self.export_started
+
+    @property
+    def visibility_lag(self) -> float | None:
+        """Time from the mod printing the frame to it being read: log flushing plus polling."""
+        if self.export_finished is None:
+            return None
+        return self.read_at - self.export_finished
+
+    @property
+    def processing_seconds(self) -> float:
+        """Time from reading the frame to its GameState being built."""
+        return self.parsed_at - self.read_at
+
+    @property
+    def total_latency(self) -> float | None:
+        """Time from the mod starting the export to the GameState being ready."""
+        if self.export_started is None:
+            return None
+        return self.parsed_at - self.export_started
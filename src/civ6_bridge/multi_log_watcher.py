@@ -0,0 +1,220 @@
+"""MultiLogWatcher — tails many Lua.log files from one thread."""
+
+from __future__ import annotations
+
+import os
+import selectors
+import threading
+from collections.abc import Generator, Hashable, Mapping
+from pathlib import Path
+
+from civ6_bridge.lazy_state import AnyGameState
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.watch_backend import BACKENDS, InotifyWatches, PollingBackend
+
+
+class MultiLogWatcher:
+    """Watches the Lua.log files of several games with one thread and one selector.
+
+    Usage:
+        watcher = MultiLogWatcher({"game-0": Path("run0/Lua.log"), "game-1": Path("run1/Lua.log")})
+        for game_id, state in watcher.watch():
+            print(game_id, state.turn)
+
+        # From another thread, while watch() runs
+        watcher.add("game-2", Path("run2/Lua.log"))
+        watcher.remove("game-0")
+        watcher.close()
+
+    Each game is a LogWatcher driven through its step API, so frames are scanned,
+    decoded and indexed exactly as by LogWatcher.watch(), and only frames appended
+    after a game is added are read. With inotify ("auto" on Linux, or "inotify"), a
+    single inotify instance watches every log's directory and only the logs named in
+    its events are read; every ``poll_interval`` all logs are checked as a safety net.
+    With "poll", every log is checked at an adaptive interval (see PollingBackend),
+    which costs one stat() per game. Either way the thread count does not grow with
+    the number of games, and an idle game costs no reads.
+
+    Games can be added and removed from any thread; a blocked watch() wakes up at
+    once to pick the change up.
+    """
+
+    def __init__(
+        self,
+        logs: Mapping[Hashable, Path] | None = None,
+        poll_interval: float = 1.0,
+        backend: str = "auto",
+        lazy: bool = False,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown watch backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+        self.poll_interval = poll_interval
+        self.lazy = lazy
+        self._lock = threading.Lock()
+        self._games: dict[Hashable, LogWatcher[AnyGameState]] = {}
+        self._watch_ids: dict[Hashable, int] = {}
+        self._names: dict[tuple[int, bytes], set[Hashable]] = {}
+        # Games to read on the next read_new(); None means all of them
+        self._dirty: set[Hashable] | None = None
+        self._closed = False
+        self._waiting = False  # a thread is blocked in wait(); it releases the descriptors on close()
+
+        self._inotify: InotifyWatches | None = None
+        self._poller: PollingBackend | None = None
+        if backend != "poll":
+            try:
+                self._inotify = InotifyWatches()
+            except OSError:
+                if backend == "inotify":
+                    raise
+        if self._inotify is None:
+            self._poller = PollingBackend(max_interval=poll_interval)
+
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        if self._inotify is not None:
+            self._selector.register(self._inotify.fileno(), selectors.EVENT_READ)
+
+        for game_id, log_path in (logs or {}).items():
+            self.add(game_id, log_path)
+
+    @property
+    def games(self) -> dict[Hashable, Path]:
+        """The watched games and their log paths."""
+        with self._lock:
+            return {game_id: watcher.log_path for game_id, watcher in self._games.items()}
+
+    def add(self, game_id: Hashable, log_path: Path) -> None:
+        """Start watching ``log_path`` as ``game_id``, from the current end of the log.
+
+        Raises LogNotFoundError if the log does not exist, ValueError if ``game_id`` is taken.
+        """
+        watcher = LogWatcher(log_path, lazy=self.lazy)
+        watcher.start_tail()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MultiLogWatcher is closed")
+            if game_id in self._games:
+                raise ValueError(f"Game {game_id!r} is already watched")
+            if self._inotify is not None:
+                wd = self._inotify.add(log_path.parent)
+                self._watch_ids[game_id] = wd
+                self._names.setdefault((wd, os.fsencode(log_path.name)), set()).add(game_id)
+            self._games[game_id] = watcher
+            self._wake()
+
+    def remove(self, game_id: Hashable) -> None:
+        """Stop watching ``game_id``. Raises KeyError if it is not watched."""
+        with self._lock:
+            watcher = self._games.pop(game_id)
+            wd = self._watch_ids.pop(game_id, None)
+            if wd is not None and self._inotify is not None:
+                key = (wd, os.fsencode(watcher.log_path.name))
+                self._names[key].discard(game_id)
+                if not self._names[key]:
+                    del self._names[key]
+                # The descriptor is shared by every log in the same directory
+                if wd not in self._watch_ids.values():
+                    self._inotify.remove(wd)
+            self._wake()
+
+    def read_new(self) -> list[tuple[Hashable, AnyGameState]]:
+        """Read the logs that may have changed and return the new (game_id, state) pairs.
+
+        States of one game are in log order; games are read one after the other.
+        watch() is this plus wait() between calls.
+        """
+        with self._lock:
+            if self._dirty is None:
+                games = list(self._games.items())
+            else:
+                games = [(game_id, self._games[game_id]) for game_id in self._dirty if game_id in self._games]
+            self._dirty = set()
+        new: list[tuple[Hashable, AnyGameState]] = []
+        changed = False
+        for game_id, watcher in games:
+            start = watcher.position
+            states = watcher.read_new()
+            changed = changed or watcher.position != start
+            new += [(game_id, state) for state in states]
+        if self._poller is not None:
+            self._poller.notify(changed)
+        return new
+
+    def wait(self) -> None:
+        """Block until a log may have changed, a game was added or removed, or the interval elapsed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._waiting = True
+            if self._poller is not None:
+                if any(watcher.pending for watcher in self._games.values()):
+                    self._poller.interval = self._poller.min_interval
+                timeout = self._poller.interval
+            else:
+                timeout = self.poll_interval
+        try:
+            ready = self._selector.select(timeout)
+        finally:
+            with self._lock:
+                self._waiting = False
+                if self._closed:
+                    self._release()
+        with self._lock:
+            if self._closed:
+                return
+            if not ready or self._poller is not None:
+                self._dirty = None
+            for key, _events in ready:
+                if key.fd == self._wake_r:
+                    self._drain_wake()
+                elif self._dirty is not None and self._inotify is not None:
+                    for wd, name in self._inotify.read_events():
+                        self._dirty.update(self._names.get((wd, name), ()))
+
+    def watch(self) -> Generator[tuple[Hashable, AnyGameState], None, None]:
+        """Yield (game_id, GameState) pairs as new frames appear in any watched log, until close()."""
+        while not self._closed:
+            yield from self.read_new()
+            self.wait()
+
+    def close(self) -> None:
+        """Stop watch() and release the selector and inotify descriptors.
+
+        Can be called from another thread; watch() returns after its current read.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._games.clear()
+            if self._waiting:
+                self._wake()
+            else:
+                self._release()
+
+    def _release(self) -> None:
+        self._selector.close()
+        if self._inotify is not None:
+            self._inotify.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _wake(self) -> None:
+        # Called with the lock held, so the pipe cannot be released meanwhile
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass  # the pipe is full (already woken) or closed
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
@@ -0,0 +1,133 @@
+"""StateBuilder — builds consecutive GameStates that share unchanged objects."""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from sys import intern
+from typing import Any, TypeVar
+
+from civ6_bridge.delta import apply_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import FIELDS, field_reader
+from civ6_bridge.log_parser import is_delta_frame
+from civ6_bridge.models import (
+    City,
+    CultureState,
+    GameState,
+    Player,
+    ReligionState,
+    ScienceState,
+    Treasury,
+    Unit,
+)
+
+M = TypeVar("M")
+
+_LEAF_TYPES = (Treasury, CultureState, ReligionState, ScienceState, City, Unit)
+
+
+def _intern_all(values: list[str]) -> tuple[str, ...]:
+    return tuple(map(intern, values))
+
+
+_COERCE: dict[Any, Callable[[Any], Any]] = {int: int, float: float, bool: bool, str: intern}
+
+
+def _coercer(kind: Any) -> Callable[[Any], Any] | None:
+    """from_dict's coercion, with strings interned; the tuple fields of leaf models hold strings."""
+    return _COERCE.get(kind, _intern_all)
+
+
+# Field values of each leaf model, read as game_state.FIELDS describes them
+_READERS: dict[type, Callable[[dict], tuple]] = {cls: field_reader(FIELDS[cls], _coercer) for cls in _LEAF_TYPES}
+# Player fields are its scalars, then its leaf models, then its cities and units
+_PLAYER_SCALARS = tuple(f for f in FIELDS[Player] if f[1] in _COERCE)
+_PLAYER_PARTS = tuple((name, kind) for name, kind, _default in FIELDS[Player] if kind in _READERS)
+_read_player_scalars = field_reader(_PLAYER_SCALARS, _coercer)
+_player_scalars = operator.attrgetter(*(name for name, _kind, _default in _PLAYER_SCALARS))
+_player_parts = operator.attrgetter(*(name for name, _kind in _PLAYER_PARTS))
+
+
+def _as_dict(value: object) -> dict:
+    # json.lua encodes an empty table as []
+    return value if isinstance(value, dict) else {}
+
+
+def _same_items(old: tuple, new: tuple) -> bool:
+    return len(old) == len(new) and all(map(operator.is_, old, new))
+
+
+class StateBuilder:
+    """Build GameStates from frame dicts, reusing the objects of the previous build that did not change.
+
+    Usage:
+        builder = StateBuilder()
+        states = [builder.build(parse_frame(raw)) for raw in frames]
+
+    Cities, units, treasuries and the other leaf models are remembered in a dict keyed
+    by their field values (the id included), so a lookup is one hash of the fields. An
+    object whose fields equal last build's is returned as is, and a player whose fields
+    and nested objects are all unchanged is reused whole, along with its cities/units
+    tuples. Strings are interned, so unit types, buildings, districts and names are
+    stored once. Only the previous build is remembered: a history of states costs
+    memory for what changed between turns, not for turns times entities.
+
+    The states are the same frozen models from_dict returns.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[type, dict[tuple, Any]] = {cls: {} for cls in _LEAF_TYPES}
+        self._players: dict[int, Player] = {}
+        self._next_memo: dict[type, dict[tuple, Any]] = {}
+
+    def build(self, data: dict, base: dict | None = None) -> GameState:
+        """Convert a parsed frame dict into a GameState, as game_state.from_dict does.
+
+        Delta frames are applied to ``base``, the parsed keyframe they were made against.
+        Raises ParseError for a delta frame without a matching base.
+        """
+        if is_delta_frame(data):
+            if base is None or base.get("turn") != data.get("base_turn"):
+                turn, base_turn = data.get("turn"), data.get("base_turn")
+                raise ParseError(f"Delta frame for turn {turn} needs the keyframe for turn {base_turn}")
+            data = apply_delta(base, data)
+        self._next_memo = {cls: {} for cls in _LEAF_TYPES}
+        players = tuple(self._player(p) for p in data.get("players", []))
+        self._memo = self._next_memo
+        self._players = {player.id: player for player in players}
+        return GameState(
+            version=int(data.get("version", 1)),
+            turn=int(data.get("turn", 0)),
+            players=players,
+        )
+
+    def _get(self, cls: type[M], data: dict) -> M:
+        values = _READERS[cls](data)
+        obj = self._memo[cls].get(values)
+        if obj is None:
+            obj = cls(*values)
+        self._next_memo[cls][values] = obj
+        return obj
+
+    def _player(self, data: dict) -> Player:
+        get = data.get
+        scalars = _read_player_scalars(data)
+        parts = tuple(self._get(cls, _as_dict(get(name))) for name, cls in _PLAYER_PARTS)
+        cities = tuple(self._get(City, c) for c in get("cities", []))
+        units = tuple(self._get(Unit, u) for u in get("units", []))
+
+        old = self._players.get(scalars[0])
+        if old is not None:
+            if _same_items(old.cities, cities):
+                cities = old.cities
+            if _same_items(old.units, units):
+                units = old.units
+            if (
+                cities is old.cities
+                and units is old.units
+                and _same_items(_player_parts(old), parts)
+                and _player_scalars(old) == scalars
+            ):
+                return old
+        return Player(*scalars, *parts, cities, units)
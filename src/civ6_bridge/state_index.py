@@ -0,0 +1,126 @@
+"""GameStateIndex — constant-time lookups by id and by tile over a GameState."""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+from civ6_bridge.models import City, GameState, Player, Unit
+
+
+class PlayerIndex:
+    """Lookups over one player's cities and units. Get one from GameStateIndex.of()."""
+
+    def __init__(self, player: Player | None):
+        self.player = player
+        self.cities: tuple[City, ...] = player.cities if player is not None else ()
+        self.units: tuple[Unit, ...] = player.units if player is not None else ()
+
+    @cached_property
+    def _cities_by_id(self) -> dict[int, City]:
+        return {city.id: city for city in self.cities}
+
+    @cached_property
+    def _units_by_id(self) -> dict[int, Unit]:
+        return {unit.id: unit for unit in self.units}
+
+    @cached_property
+    def _cities_by_tile(self) -> dict[tuple[int, int], City]:
+        return {(city.x, city.y): city for city in self.cities}
+
+    @cached_property
+    def _units_by_tile(self) -> dict[tuple[int, int], tuple[Unit, ...]]:
+        return _group_by_tile(self.units)
+
+    def city(self, city_id: int) -> City | None:
+        """Return the city with the given ID, or None."""
+        return self._cities_by_id.get(city_id)
+
+    def unit(self, unit_id: int) -> Unit | None:
+        """Return the unit with the given ID, or None."""
+        return self._units_by_id.get(unit_id)
+
+    def city_at(self, x: int, y: int) -> City | None:
+        """Return the city on tile (x, y), or None."""
+        return self._cities_by_tile.get((x, y))
+
+    def units_at(self, x: int, y: int) -> tuple[Unit, ...]:
+        """Return the units on tile (x, y), in export order."""
+        return self._units_by_tile.get((x, y), ())
+
+
+def _group_by_tile(units: tuple[Unit, ...]) -> dict[tuple[int, int], tuple[Unit, ...]]:
+    tiles: dict[tuple[int, int], list[Unit]] = {}
+    for unit in units:
+        tiles.setdefault((unit.x, unit.y), []).append(unit)
+    return {tile: tuple(stack) for tile, stack in tiles.items()}
+
+
+class GameStateIndex:
+    """Hash-map lookups over one GameState, for decision code that queries it a lot.
+
+    Usage:
+        index = GameStateIndex(state)
+        me = index.human_player()
+        warrior = index.unit(me.id, 65536)
+        stack = index.units_at(12, 7)
+        mine = index.of(me.id)
+        for unit in mine.units_at(12, 7):
+            ...
+
+    City and unit IDs are only unique per player in Civ6 (as in GameCommands), so
+    lookups by id take the owner's player ID. Each map is built the first time it is
+    queried and then answers in O(1); an index is only valid for the state it was
+    built from. Missing players, cities and units give None or an empty tuple.
+    """
+
+    def __init__(self, state: GameState):
+        self.state = state
+
+    @cached_property
+    def _players(self) -> dict[int, Player]:
+        return {player.id: player for player in self.state.players}
+
+    @cached_property
+    def _human(self) -> Player | None:
+        return next((player for player in self.state.players if player.is_human), None)
+
+    @cached_property
+    def _owners(self) -> dict[int, PlayerIndex]:
+        return {player.id: PlayerIndex(player) for player in self.state.players}
+
+    @cached_property
+    def _cities_by_tile(self) -> dict[tuple[int, int], City]:
+        return {(city.x, city.y): city for player in self.state.players for city in player.cities}
+
+    @cached_property
+    def _units_by_tile(self) -> dict[tuple[int, int], tuple[Unit, ...]]:
+        return _group_by_tile(tuple(unit for player in self.state.players for unit in player.units))
+
+    def player(self, player_id: int) -> Player | None:
+        """Return the player with the given ID, or None."""
+        return self._players.get(player_id)
+
+    def human_player(self) -> Player | None:
+        """Return the first human player, or None."""
+        return self._human
+
+    def of(self, player_id: int) -> PlayerIndex:
+        """Return the lookups restricted to one player's cities and units."""
+        view = self._owners.get(player_id)
+        return view if view is not None else PlayerIndex(None)
+
+    def city(self, owner_id: int, city_id: int) -> City | None:
+        """Return city ``city_id`` of player ``owner_id``, or None."""
+        return self.of(owner_id).city(city_id)
+
+    def unit(self, owner_id: int, unit_id: int) -> Unit | None:
+        """Return unit ``unit_id`` of player ``owner_id``, or None."""
+        return self.of(owner_id).unit(unit_id)
+
+    def city_at(self, x: int, y: int) -> City | None:
+        """Return the city on tile (x, y), whoever owns it, or None."""
+        return self._cities_by_tile.get((x, y))
+
+    def units_at(self, x: int, y: int) -> tuple[Unit, ...]:
+        """Return every player's units on tile (x, y)."""
+        return self._units_by_tile.get((x, y), ())
@@ -0,0 +1,216 @@
+"""Synthetic Lua.log files of a game of any size, for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.delta import make_delta
+from civ6_bridge.log_parser import DELTA_KIND
+
+UNIT_TYPES = (
+    "UNIT_BUILDER",
+    "UNIT_SETTLER",
+    "UNIT_SCOUT",
+    "UNIT_WARRIOR",
+    "UNIT_ARCHER",
+    "UNIT_SWORDSMAN",
+    "UNIT_CROSSBOWMAN",
+    "UNIT_KNIGHT",
+    "UNIT_MUSKETMAN",
+    "UNIT_CANNON",
+    "UNIT_INFANTRY",
+    "UNIT_ARTILLERY",
+    "UNIT_TANK",
+    "UNIT_FIGHTER",
+    "UNIT_TRADER",
+)
+BUILDINGS = (
+    "BUILDING_MONUMENT",
+    "BUILDING_GRANARY",
+    "BUILDING_WATER_MILL",
+    "BUILDING_LIBRARY",
+    "BUILDING_UNIVERSITY",
+    "BUILDING_RESEARCH_LAB",
+    "BUILDING_MARKET",
+    "BUILDING_BANK",
+    "BUILDING_STOCK_EXCHANGE",
+    "BUILDING_WORKSHOP",
+    "BUILDING_FACTORY",
+    "BUILDING_POWER_PLANT",
+    "BUILDING_SHRINE",
+    "BUILDING_TEMPLE",
+    "BUILDING_AMPHITHEATER",
+    "BUILDING_MUSEUM_ART",
+    "BUILDING_BARRACKS",
+    "BUILDING_ARMORY",
+    "BUILDING_LIGHTHOUSE",
+    "BUILDING_SHIPYARD",
+    "BUILDING_WALLS",
+    "BUILDING_CASTLE",
+)
+DISTRICTS = (
+    "DISTRICT_CITY_CENTER",
+    "DISTRICT_CAMPUS",
+    "DISTRICT_COMMERCIAL_HUB",
+    "DISTRICT_INDUSTRIAL_ZONE",
+    "DISTRICT_HOLY_SITE",
+    "DISTRICT_THEATER",
+    "DISTRICT_ENCAMPMENT",
+    "DISTRICT_HARBOR",
+    "DISTRICT_ENTERTAINMENT_COMPLEX",
+    "DISTRICT_AQUEDUCT",
+)
+TECHS = ("TECH_MINING", "TECH_WRITING", "TECH_EDUCATION", "TECH_PRINTING", "TECH_INDUSTRIALIZATION", "TECH_ROBOTICS")
+CIVICS = ("CIVIC_CODE_OF_LAWS", "CIVIC_POLITICAL_PHILOSOPHY", "CIVIC_HUMANISM", "CIVIC_IDEOLOGY", "CIVIC_GLOBALIZATION")
+
+NOISE_LINES = (
+    "InGame: Turn processing complete",
+    "GameCore: AI player evaluating trade routes",
+    "UI: Refreshing city banners",
+    "Tuner: heartbeat",
+    "WorldView: Plot visibility changed",
+)
+
+
+def _unit(rng: random.Random, owner: int, unit_id: int, width: int, height: int) -> dict[str, Any]:
+    unit_type = rng.choice(UNIT_TYPES)
+    combat = 0 if unit_type in ("UNIT_BUILDER", "UNIT_SETTLER", "UNIT_TRADER") else rng.choice((20, 35, 55, 70, 85))
+    ranged = combat if unit_type in ("UNIT_ARCHER", "UNIT_CROSSBOWMAN", "UNIT_CANNON", "UNIT_ARTILLERY") else 0
+    return {
+        "base_moves": 2,
+        "combat": combat,
+        "id": unit_id,
+        "max_moves": 2,
+        "moves_remaining": 2,
+        "name": unit_type.removeprefix("UNIT_").title(),
+        "owner_id": owner,
+        "range": 2 if ranged else 0,
+        "ranged_combat": ranged,
+        "type": unit_type,
+        "x": rng.randrange(width),
+        "y": rng.randrange(height),
+    }
+
+
+def generate_states(
+    players: int = 8,
+    cities: int = 15,
+    units: int = 60,
+    turns: int = 100,
+    seed: int = 0,
+    start_turn: int = 1,
+    map_size: tuple[int, int] = (106, 66),
+) -> Iterator[dict]:
+    """Yield the frame dicts of a game that evolves turn by turn, as the mod would export them.
+
+    Every player keeps ``cities`` cities and ``units`` units. Each turn gold and faith
+    accumulate, about a third of the units move, a few units die and are replaced
+    under a new id, and cities grow and complete buildings and districts now and
+    then, so consecutive states differ the way real ones do. The same arguments
+    always give the same game.
+    """
+    rng = random.Random(seed)
+    width, height = map_size
+    next_id = [pid * 65536 + cities for pid in range(players)]
+    game: list[dict[str, Any]] = []
+    for pid in range(players):
+        game.append(
+            {
+                "cities": [
+                    {
+                        "buildings": sorted(rng.sample(BUILDINGS, rng.randrange(len(BUILDINGS) // 2))),
+                        "districts": ["DISTRICT_CITY_CENTER"],
+                        "id": pid * 65536 + c,
+                        "name": f"City {pid}-{c}",
+                        "owner_id": pid,
+                        "population": rng.randint(1, 12),
+                        "x": rng.randrange(width),
+                        "y": rng.randrange(height),
+                    }
+                    for c in range(cities)
+                ],
+                "civilization": f"CIVILIZATION_{pid}",
+                "culture": {"progressing_civic": CIVICS[0]},
+                "id": pid,
+                "is_alive": True,
+                "is_human": pid == 0,
+                "leader": f"LEADER_{pid}",
+                "religion": {"faith_balance": 0.0, "faith_yield": float(rng.randint(1, 20))},
+                "science": {"progressing_tech": TECHS[0], "science_yield": float(rng.randint(5, 120))},
+                "treasury": {"gold_balance": 0.0, "gold_yield": float(rng.randint(5, 80)), "total_maintenance": 4.0},
+                "units": [],
+            }
+        )
+        for _ in range(units):
+            game[pid]["units"].append(_unit(rng, pid, next_id[pid], width, height))
+            next_id[pid] += 1
+
+    for turn in range(start_turn, start_turn + turns):
+        for player in game:
+            pid = player["id"]
+            treasury, religion = player["treasury"], player["religion"]
+            treasury["gold_balance"] += treasury["gold_yield"] - treasury["total_maintenance"]
+            religion["faith_balance"] += religion["faith_yield"]
+            player["science"]["progressing_tech"] = TECHS[(turn // 15 + pid) % len(TECHS)]
+            player["culture"]["progressing_civic"] = CIVICS[(turn // 20 + pid) % len(CIVICS)]
+            for city in player["cities"]:
+                if rng.random() < 0.1:
+                    city["population"] += 1
+                if rng.random() < 0.05 and len(city["buildings"]) < len(BUILDINGS):
+                    city["buildings"] = sorted({*city["buildings"], rng.choice(BUILDINGS)})
+                if rng.random() < 0.02 and len(city["districts"]) < len(DISTRICTS):
+                    city["districts"] = [*city["districts"], *sorted({*DISTRICTS} - {*city["districts"]})[:1]]
+            for i, unit in enumerate(player["units"]):
+                if rng.random() < 0.02:
+                    player["units"][i] = _unit(rng, pid, next_id[pid], width, height)
+                    next_id[pid] += 1
+                elif rng.random() < 0.35:
+                    unit["x"] = min(width - 1, max(0, unit["x"] + rng.choice((-1, 0, 1))))
+                    unit["y"] = min(height - 1, max(0, unit["y"] + rng.choice((-1, 0, 1))))
+                    unit["moves_remaining"] = rng.randint(0, unit["max_moves"])
+        yield json.loads(json.dumps({"players": game, "turn": turn, "version": 1}))
+
+
+def format_frame(data: dict) -> str:
+    """A frame as the mod writes it: sentinel lines around compact JSON with sorted keys."""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return f"{SENTINEL_BEGIN}\n{payload}\n{SENTINEL_END}\n"
+
+
+def generate_log(
+    path: Path,
+    players: int = 8,
+    cities: int = 15,
+    units: int = 60,
+    turns: int = 100,
+    noise_lines: int = 20,
+    keyframe_interval: int = 1,
+    seed: int = 0,
+) -> int:
+    """Write a synthetic Lua.log to ``path`` and return its size in bytes.
+
+    Usage:
+        generate_log(Path("late_game.log"), players=12, cities=25, units=120, turns=300)
+
+    ``noise_lines`` unrelated log lines precede every frame. With ``keyframe_interval``
+    above 1, only every that many turns is a full keyframe and the turns in between
+    are delta frames against it, as with CIV6BRIDGE_KEYFRAME_INTERVAL in the mod.
+    """
+    if keyframe_interval < 1:
+        raise ValueError(f"keyframe_interval must be at least 1, got {keyframe_interval}")
+    rng = random.Random(seed + 1)
+    keyframe: dict | None = None
+    with open(path, "w", encoding="utf-8") as f:
+        for i, data in enumerate(generate_states(players, cities, units, turns, seed)):
+            f.writelines(rng.choice(NOISE_LINES) + "\n" for _ in range(noise_lines))
+            if keyframe is None or i % keyframe_interval == 0:
+                keyframe = data
+                f.write(format_frame(data))
+            else:
+                f.write(format_frame({**make_delta(keyframe, data), "kind": DELTA_KIND, "base_turn": keyframe["turn"]}))
+        return f.tell()
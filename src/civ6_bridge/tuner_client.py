@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import queue
+import select
 import socket
 import struct
+import time
 
+from civ6_bridge import metrics
 from civ6_bridge.constants import RESULT_BEGIN, RESULT_END, TUNER_HOST, TUNER_MSG_TYPE, TUNER_PORT
 from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
 
+# [4-byte LE payload length][4-byte LE message type]
+HEADER = struct.Struct("<II")
+
 
 def build_message(lua_code: str, context: int = 0) -> bytes:
     """Build a FireTuner wire-protocol message.
@@ -15,26 +22,32 @@ def build_message(lua_code: str, context: int = 0) -> bytes:
     Format: [4-byte LE payload length][4-byte LE message type] + CMD:{context}:{lua_code}\\x00
     """
     payload = f"CMD:{context}:{lua_code}\x00".encode()
-    header = struct.pack("<II", len(payload), TUNER_MSG_TYPE)
+    header = HEADER.pack(len(payload), TUNER_MSG_TYPE)
     return header + payload
 
 
+# Deletion table for bytes.translate: everything outside printable ASCII (32–126)
+_NON_PRINTABLE = bytes(b for b in range(256) if not 32 <= b < 127)
+_RESULT_BEGIN_BYTES = RESULT_BEGIN.encode()
+_RESULT_END_BYTES = RESULT_END.encode()
+
+
 def parse_response(data: bytes) -> str:
     """Extract the result string from a FireTuner binary response.
 
     Looks for printable ASCII, then extracts text between RESULT_BEGIN and RESULT_END sentinels.
     Raises TunerCommandError if the result starts with 'ERR:'.
     """
-    # Extract printable ASCII characters from the binary response
-    text = "".join(chr(b) for b in data if 32 <= b < 127)
+    # Keep only printable ASCII characters from the binary response
+    printable = data.translate(None, _NON_PRINTABLE)
 
-    begin_idx = text.find(RESULT_BEGIN)
-    end_idx = text.find(RESULT_END)
+    begin_idx = printable.find(_RESULT_BEGIN_BYTES)
+    end_idx = printable.find(_RESULT_END_BYTES, begin_idx + len(_RESULT_BEGIN_BYTES))
 
     if begin_idx == -1 or end_idx == -1:
-        return text
+        return printable.decode("ascii")
 
-    result = text[begin_idx + len(RESULT_BEGIN) : end_idx]
+    result = printable[begin_idx + len(_RESULT_BEGIN_BYTES) : end_idx].decode("ascii")
 
     if result.startswith("ERR:"):
         raise TunerCommandError(result[4:])
@@ -42,19 +55,280 @@ def parse_response(data: bytes) -> str:
     return result
 
 
-class TunerClient:
-    """Short-lived TCP client for the Civ6 FireTuner debug server."""
+def parse_results(data: bytes) -> list[str]:
+    """Extract every RESULT_BEGIN…RESULT_END result from a FireTuner response, in order.
+
+    Unlike parse_response, errors are returned as-is ('ERR:...') rather than raised.
+    """
+    return ResponseDecoder(framed=False).feed(data)
+
+
+class ResponseDecoder:
+    """Incremental decoder for FireTuner replies.
+
+    Feed it bytes as they arrive from the socket; it returns every CIV6BRIDGE_RESULT
+    payload completed so far. With ``framed`` (the default) the input is split on the
+    8-byte length/type header first, so headers never leak into results; with
+    ``framed=False`` it scans a raw byte stream. Non-printable bytes are stripped
+    with bytes.translate and only result payloads are decoded to text.
+    With ``keep_payload`` the complete message payloads are also collected, unfiltered,
+    in ``payload``.
+    """
+
+    def __init__(self, framed: bool = True, keep_payload: bool = False):
+        self.framed = framed
+        self.keep_payload = keep_payload
+        self.count = 0
+        self.payload = bytearray()
+        self._frames = bytearray()
+        self._text = bytearray()
+
+    def feed(self, data: bytes) -> list[str]:
+        """Append ``data`` and return the results it completes."""
+        if self.framed:
+            self._frames += data
+            frames = self._frames
+            pos = 0
+            while len(frames) - pos >= HEADER.size:
+                length, _msg_type = HEADER.unpack_from(frames, pos)
+                end = pos + HEADER.size + length
+                if end > len(frames):
+                    break
+                body = frames[pos + HEADER.size : end]
+                if self.keep_payload:
+                    self.payload += body
+                self._text += body.translate(None, _NON_PRINTABLE)
+                pos = end
+            del frames[:pos]
+        else:
+            if self.keep_payload:
+                self.payload += data
+            self._text += data.translate(None, _NON_PRINTABLE)
+        return self._scan()
+
+    def _scan(self) -> list[str]:
+        text = self._text
+        results: list[str] = []
+        start = 0
+        while True:
+            begin_idx = text.find(_RESULT_BEGIN_BYTES, start)
+            if begin_idx == -1:
+                # Keep just enough to match a RESULT_BEGIN split across feeds
+                keep_from = max(start, len(text) - (len(_RESULT_BEGIN_BYTES) - 1))
+                break
+            result_start = begin_idx + len(_RESULT_BEGIN_BYTES)
+            end_idx = text.find(_RESULT_END_BYTES, result_start)
+            if end_idx == -1:
+                keep_from = begin_idx
+                break
+            results.append(text[result_start:end_idx].decode("ascii"))
+            start = end_idx + len(_RESULT_END_BYTES)
+        del text[:keep_from]
+        self.count += len(results)
+        return results
+
+
+# Bytes requested per recv() while reading a reply on a persistent connection
+_RECV_SIZE = 64 * 1024
+
+
+class TunerConnection:
+    """Long-lived TCP connection to the FireTuner debug server.
+
+    Replies are decoded incrementally by a ResponseDecoder, which splits them on the
+    8-byte length/type header instead of waiting for the peer to close. A reply is
+    complete as soon as the decoder has seen the expected number of results; until
+    then the connection waits, up to ``timeout`` seconds in total. If the timeout
+    expires the connection is closed, so a late reply can never be mistaken for the
+    answer to the next command. Any unread data left on the socket is discarded
+    before a command is sent.
+
+    A stale connection is re-opened, once, only when the command could not be sent
+    in full, so a command is never executed twice.
+    """
 
     def __init__(self, host: str = TUNER_HOST, port: int = TUNER_PORT, timeout: float = 5.0):
         self.host = host
         self.port = port
         self.timeout = timeout
+        self._sock: socket.socket | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def connect(self) -> socket.socket:
+        """Open the TCP connection if it is not already open, and return the socket."""
+        if self._sock is not None:
+            return self._sock
+        try:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except ConnectionRefusedError as e:
+            raise TunerConnectionError(f"Cannot connect to FireTuner at {self.host}:{self.port}") from e
+        except TimeoutError as e:
+            raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} timed out") from e
+        except OSError as e:
+            raise TunerConnectionError(f"Cannot connect to FireTuner at {self.host}:{self.port}: {e}") from e
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return self._sock
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def send_command(self, lua_code: str, context: int = 0) -> str:
+        """Send a Lua command over the open connection and return the response."""
+        return parse_response(self.send_raw(lua_code, context))
+
+    def send_raw(self, lua_code: str, context: int = 0, expected_results: int = 1) -> bytes:
+        """Send a Lua command and return the raw reply payloads.
+
+        Waits until the reply holds ``expected_results`` results. Lua that produces no
+        result is answered with whatever arrived before the timeout.
+        """
+        message = build_message(lua_code, context)
+        retry = self._sock is not None
+        while True:
+            sock = self._drain(self.connect())
+            try:
+                sock.sendall(message)
+            except OSError as e:
+                # The server cannot have run a command it did not receive in full
+                self.close()
+                if retry:
+                    retry = False
+                    continue
+                raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} failed: {e}") from e
+            return self._read_reply(sock, expected_results)
+
+    def _drain(self, sock: socket.socket) -> socket.socket:
+        """Discard unread data; reconnect if the server has closed the connection."""
+        try:
+            while select.select([sock], [], [], 0)[0]:
+                if not sock.recv(_RECV_SIZE):
+                    self.close()
+                    return self.connect()
+        except OSError:
+            self.close()
+            return self.connect()
+        return sock
+
+    def _read_reply(self, sock: socket.socket, expected_results: int) -> bytes:
+        decoder = ResponseDecoder(keep_payload=True)
+        deadline = time.monotonic() + self.timeout
+        try:
+            while decoder.count < expected_results:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                sock.settimeout(remaining)
+                chunk = sock.recv(_RECV_SIZE)
+                if not chunk:
+                    raise ConnectionResetError("FireTuner closed the connection")
+                decoder.feed(chunk)
+        except TimeoutError as e:
+            self.close()
+            if decoder.payload:
+                return bytes(decoder.payload)
+            raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} timed out") from e
+        except OSError as e:
+            self.close()
+            raise TunerConnectionError(f"Connection to FireTuner at {self.host}:{self.port} failed: {e}") from e
+        finally:
+            if self._sock is not None:
+                sock.settimeout(self.timeout)
+        return bytes(decoder.payload)
+
+    def __enter__(self) -> TunerConnection:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class TunerConnectionPool:
+    """A fixed-size pool of TunerConnections shared by concurrent callers.
+
+    Connections are opened lazily and kept open between commands.
+    """
+
+    def __init__(self, host: str = TUNER_HOST, port: int = TUNER_PORT, timeout: float = 5.0, size: int = 4):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.size = size
+        self._idle: queue.LifoQueue[TunerConnection] = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._idle.put(TunerConnection(host, port, timeout))
+
+    def send_command(self, lua_code: str, context: int = 0) -> str:
+        """Send a Lua command on the next free connection and return the response."""
+        return parse_response(self.send_raw(lua_code, context))
+
+    def send_raw(self, lua_code: str, context: int = 0, expected_results: int = 1) -> bytes:
+        """Send a Lua command on the next free connection and return the raw reply."""
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty as e:
+            raise TunerConnectionError(f"No free FireTuner connection after {self.timeout}s") from e
+        try:
+            return conn.send_raw(lua_code, context, expected_results)
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close all idle connections. They reconnect lazily if the pool is used again."""
+        for conn in list(self._idle.queue):
+            conn.close()
+
+
+class TunerClient:
+    """TCP client for the Civ6 FireTuner debug server.
+
+    By default every command uses a short-lived connection. With ``pool_size`` > 0
+    commands go through a TunerConnectionPool of persistent connections instead.
+    """
+
+    def __init__(self, host: str = TUNER_HOST, port: int = TUNER_PORT, timeout: float = 5.0, pool_size: int = 0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._pool = TunerConnectionPool(host, port, timeout, size=pool_size) if pool_size > 0 else None
 
     def send_command(self, lua_code: str, context: int = 0) -> str:
         """Send a Lua command and return the response.
 
-        Opens a short-lived TCP connection (connect → send → recv → close).
+        Without a pool, opens a short-lived TCP connection (connect → send → recv → close).
         """
+        try:
+            return parse_response(self.send_raw(lua_code, context))
+        except TunerCommandError:
+            if metrics.METRICS.enabled:
+                metrics.TUNER_COMMAND_ERRORS.inc()
+            raise
+
+    def send_raw(self, lua_code: str, context: int = 0, expected_results: int = 1) -> bytes:
+        """Send a Lua command and return the raw, unparsed response bytes.
+
+        ``expected_results`` tells pooled connections how many results complete the reply;
+        short-lived connections read until the server closes.
+        """
+        if not metrics.METRICS.enabled:
+            return self._send_raw(lua_code, context, expected_results)
+        metrics.TUNER_REQUESTS.inc()
+        start = time.perf_counter()
+        try:
+            data = self._send_raw(lua_code, context, expected_results)
+        except TunerConnectionError:
+            metrics.TUNER_CONNECTION_ERRORS.inc()
+            raise
+        metrics.TUNER_ROUND_TRIP_SECONDS.observe(time.perf_counter() - start)
+        return data
+
+    def _send_raw(self, lua_code: str, context: int, expected_results: int) -> bytes:
+        if self._pool is not None:
+            return self._pool.send_raw(lua_code, context, expected_results)
         message = build_message(lua_code, context)
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
@@ -67,7 +341,7 @@ class TunerClient:
                     if not chunk:
                         break
                     chunks.append(chunk)
-                return parse_response(b"".join(chunks))
+                return b"".join(chunks)
         except ConnectionRefusedError as e:
             raise TunerConnectionError(f"Cannot connect to FireTuner at {self.host}:{self.port}") from e
         except TimeoutError as e:
@@ -82,3 +356,8 @@ class TunerClient:
                 return True
         except (TimeoutError, ConnectionRefusedError, OSError):
             return False
+
+    def close(self) -> None:
+        """Close pooled connections, if any."""
+        if self._pool is not None:
+            self._pool.close()
@@ -0,0 +1,239 @@
+"""Wake-up backends for LogWatcher — inotify on Linux, adaptive polling elsewhere."""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+BACKENDS = ("auto", "inotify", "poll")
+
+
+class WatchBackend(ABC):
+    """Blocks the watch loop until the log may have changed."""
+
+    @abstractmethod
+    def wait(self, expect_frame: bool = False) -> bool:
+        """Block until the log may have changed or a timeout elapses.
+
+        ``expect_frame`` is True while a frame has been started but not finished.
+        Returns True if a change was signalled.
+        """
+
+    async def wait_async(self, expect_frame: bool = False) -> bool:
+        """Asynchronous counterpart of wait(), for AsyncLogWatcher."""
+        return await asyncio.to_thread(self.wait, expect_frame)
+
+    def notify(self, changed: bool) -> None:  # noqa: B027 - optional hook
+        """Tell the backend whether the last read found new data."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release any OS resources held by the backend."""
+
+
+class PollingBackend(WatchBackend):
+    """Sleep-based backend that backs off while the log is idle.
+
+    The interval starts at ``min_interval``, grows by ``backoff`` after every read
+    that finds nothing, up to ``max_interval``, and drops back to ``min_interval``
+    as soon as data arrives or a partially written frame is pending.
+    """
+
+    def __init__(self, min_interval: float = 0.05, max_interval: float = 1.0, backoff: float = 1.5):
+        if min_interval <= 0 or max_interval <= 0:
+            raise ValueError("Polling intervals must be positive")
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = self.min_interval
+
+    def wait(self, expect_frame: bool = False) -> bool:
+        if expect_frame:
+            self.interval = self.min_interval
+        time.sleep(self.interval)
+        return True
+
+    async def wait_async(self, expect_frame: bool = False) -> bool:
+        if expect_frame:
+            self.interval = self.min_interval
+        await asyncio.sleep(self.interval)
+        return True
+
+    def notify(self, changed: bool) -> None:
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatches:
+    """One inotify instance watching any number of directories.
+
+    ``add()`` returns a watch descriptor; read_events() reports which file names
+    changed under which descriptor. Adding the same directory twice returns the
+    same descriptor.
+    """
+
+    def __init__(self) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add(self, directory: Path) -> int:
+        """Watch ``directory`` for writes, renames and new files; return the watch descriptor."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory.resolve()), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}")
+        return wd
+
+    def remove(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self) -> list[tuple[int, bytes]]:
+        """Drain pending events as (watch descriptor, file name) pairs."""
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                events.append((wd, data[offset : offset + name_len].rstrip(b"\0")))
+                offset += name_len
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class InotifyBackend(WatchBackend):
+    """Linux backend that sleeps on inotify events for the log file.
+
+    Watches the log's parent directory so the watch survives the game truncating
+    or recreating Lua.log. ``timeout`` bounds each wait as a safety net for
+    filesystems that do not deliver events.
+    """
+
+    def __init__(self, log_path: Path, timeout: float = 1.0):
+        if timeout <= 0:
+            raise ValueError("inotify wait timeout must be positive")
+        self.timeout = timeout
+        self._name = os.fsencode(log_path.name)
+        self._watches = InotifyWatches()
+        try:
+            self._watches.add(log_path.parent)
+        except OSError:
+            self._watches.close()
+            raise
+        self._fd = self._watches.fileno()
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def wait(self, expect_frame: bool = False) -> bool:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable and self.read_events():
+                return True
+
+    async def wait_async(self, expect_frame: bool = False) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            readable: asyncio.Future[None] = loop.create_future()
+            loop.add_reader(self._fd, _resolve, readable)
+            try:
+                # asyncio.wait never swallows a cancellation, unlike wait_for on 3.10/3.11
+                done, _ = await asyncio.wait({readable}, timeout=remaining)
+            finally:
+                loop.remove_reader(self._fd)
+                readable.cancel()
+            if not done:
+                return False
+            if self.read_events():
+                return True
+
+    def read_events(self) -> bool:
+        """Drain pending events; return True if any concern the log file."""
+        return any(name == self._name for _wd, name in self._watches.read_events())
+
+    def close(self) -> None:
+        self._watches.close()
+        self._fd = -1
+
+
+def create_backend(log_path: Path, poll_interval: float = 1.0, kind: str = "auto") -> WatchBackend:
+    """Build a wake-up backend for ``log_path``.
+
+    ``kind`` is one of "auto" (inotify when available, else polling), "inotify" or "poll".
+    ``poll_interval`` is the longest the watcher sleeps between checks and must be
+    positive; a zero interval would turn the watch loop into a busy spin.
+    """
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown watch backend {kind!r}; expected one of {', '.join(BACKENDS)}")
+    if poll_interval <= 0:
+        raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+    if kind in ("auto", "inotify"):
+        try:
+            return InotifyBackend(log_path, timeout=poll_interval)
+        except OSError:
+            if kind == "inotify":
+                raise
+    return PollingBackend(max_interval=poll_interval)
@@ -0,0 +1,483 @@
+"""Headless runs of the mod's Lua scripts against a scripted mock of the Civ6 Lua API.
+
+Used by tests/test_mod_scripts.py and benchmarks/bench_mod_export.py. Needs lupa
+(part of the ``test`` extra) and reads the scripts from civ6_mod/Scripts in this checkout.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    try:
+        # The game runs a Lua 5.1 dialect; prefer the same language version where lupa ships it
+        from lupa import lua51 as lupa
+    except ImportError:  # pragma: no cover - depends on the lupa build
+        import lupa
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("tests.mod_harness needs lupa; install it with: pip install 'civ6-bridge[test]'") from e
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.log_parser import frame_export, is_delta_frame, parse_frame
+from civ6_bridge.synthetic import BUILDINGS, CIVICS, DISTRICTS, TECHS, UNIT_TYPES, generate_states
+
+MOD_SCRIPTS = Path(__file__).resolve().parents[1] / "civ6_mod" / "Scripts"
+
+# District each synthetic building needs (GameInfo.Buildings.PrereqDistrict)
+BUILDING_DISTRICTS = {
+    "BUILDING_MONUMENT": "DISTRICT_CITY_CENTER",
+    "BUILDING_GRANARY": "DISTRICT_CITY_CENTER",
+    "BUILDING_WATER_MILL": "DISTRICT_CITY_CENTER",
+    "BUILDING_WALLS": "DISTRICT_CITY_CENTER",
+    "BUILDING_CASTLE": "DISTRICT_CITY_CENTER",
+    "BUILDING_LIBRARY": "DISTRICT_CAMPUS",
+    "BUILDING_UNIVERSITY": "DISTRICT_CAMPUS",
+    "BUILDING_RESEARCH_LAB": "DISTRICT_CAMPUS",
+    "BUILDING_MARKET": "DISTRICT_COMMERCIAL_HUB",
+    "BUILDING_BANK": "DISTRICT_COMMERCIAL_HUB",
+    "BUILDING_STOCK_EXCHANGE": "DISTRICT_COMMERCIAL_HUB",
+    "BUILDING_WORKSHOP": "DISTRICT_INDUSTRIAL_ZONE",
+    "BUILDING_FACTORY": "DISTRICT_INDUSTRIAL_ZONE",
+    "BUILDING_POWER_PLANT": "DISTRICT_INDUSTRIAL_ZONE",
+    "BUILDING_SHRINE": "DISTRICT_HOLY_SITE",
+    "BUILDING_TEMPLE": "DISTRICT_HOLY_SITE",
+    "BUILDING_AMPHITHEATER": "DISTRICT_THEATER",
+    "BUILDING_MUSEUM_ART": "DISTRICT_THEATER",
+    "BUILDING_BARRACKS": "DISTRICT_ENCAMPMENT",
+    "BUILDING_ARMORY": "DISTRICT_ENCAMPMENT",
+    "BUILDING_LIGHTHOUSE": "DISTRICT_HARBOR",
+    "BUILDING_SHIPYARD": "DISTRICT_HARBOR",
+}
+# Buildings of the mock catalogue that need no district (world wonders)
+WONDERS = ("BUILDING_PYRAMIDS", "BUILDING_COLOSSEUM")
+
+_RANGED = ("UNIT_ARCHER", "UNIT_CROSSBOWMAN", "UNIT_CANNON", "UNIT_ARTILLERY")
+_CIVILIAN = ("UNIT_BUILDER", "UNIT_SETTLER", "UNIT_TRADER")
+
+
+def _unit_row(index: int, unit_type: str) -> dict:
+    combat = 0 if unit_type in _CIVILIAN else 20 + 5 * index
+    ranged = combat if unit_type in _RANGED else 0
+    return {
+        "UnitType": unit_type,
+        "Name": unit_type.removeprefix("UNIT_").title(),
+        "Combat": combat,
+        "RangedCombat": ranged,
+        "Range": 2 if ranged else 0,
+        "BaseMoves": 2,
+    }
+
+
+# The mock's GameInfo tables, in row index order
+CATALOG = {
+    "Buildings": [
+        {"BuildingType": b, "PrereqDistrict": BUILDING_DISTRICTS.get(b)} for b in sorted({*BUILDINGS, *WONDERS})
+    ],
+    "Districts": [{"DistrictType": d} for d in DISTRICTS],
+    "Units": [_unit_row(i, u) for i, u in enumerate(UNIT_TYPES)],
+    "Technologies": [{"TechnologyType": t} for t in TECHS],
+    "Civics": [{"CivicType": c} for c in CIVICS],
+}
+_UNIT_FIELDS = {
+    row["UnitType"]: {
+        "name": row["Name"],
+        "combat": row["Combat"],
+        "ranged_combat": row["RangedCombat"],
+        "range": row["Range"],
+        "base_moves": row["BaseMoves"],
+    }
+    for row in CATALOG["Units"]
+}
+_BUILDING_ORDER = {row["BuildingType"]: i for i, row in enumerate(CATALOG["Buildings"])}
+
+# The mock API, in Lua so that timings measure the scripts rather than calls back into Python
+_MOCK_API = """
+local load_chunk = loadstring or load
+local loaded = {}
+
+-- Runs a script once; a table it returns becomes a global named after it, as the mod expects
+function include(name)
+    if loaded[name] then
+        return
+    end
+    loaded[name] = true
+    local result = assert(load_chunk(HarnessSource(name), "@" .. name .. ".lua"))()
+    if type(result) == "table" then
+        _G[name] = result
+    end
+end
+
+HarnessPrinted = {}
+HarnessCalls = {}
+
+function print(...)
+    local parts = {}
+    for i = 1, select("#", ...) do
+        parts[i] = tostring((select(i, ...)))
+    end
+    HarnessPrinted[#HarnessPrinted + 1] = table.concat(parts, "\\t")
+end
+
+local function record(...)
+    local parts = {}
+    for i = 1, select("#", ...) do
+        parts[i] = tostring((select(i, ...)))
+    end
+    HarnessCalls[#HarnessCalls + 1] = table.concat(parts, " ")
+end
+
+-- GameInfo tables: callable to iterate the rows, indexable by row index or type name
+local function info_table(rows, column)
+    local info = {}
+    for i, row in ipairs(rows) do
+        row.Index = i - 1
+        info[row.Index] = row
+        info[row[column]] = row
+    end
+    return setmetatable(info, { __call = function()
+        local i = 0
+        return function()
+            i = i + 1
+            return rows[i]
+        end
+    end })
+end
+
+function HarnessSetCatalog(catalog)
+    GameInfo = {
+        Buildings = info_table(catalog.Buildings, "BuildingType"),
+        Districts = info_table(catalog.Districts, "DistrictType"),
+        Units = info_table(catalog.Units, "UnitType"),
+        Technologies = info_table(catalog.Technologies, "TechnologyType"),
+        Civics = info_table(catalog.Civics, "CivicType"),
+        DistrictReplaces = info_table({}, "CivUniqueDistrictType"),
+    }
+end
+
+local function collection(list)
+    local by_id = {}
+    for _, item in ipairs(list) do
+        by_id[item:GetID()] = item
+    end
+    return {
+        Members = function()
+            local i = 0
+            return function()
+                i = i + 1
+                if list[i] ~= nil then
+                    return i, list[i]
+                end
+            end
+        end,
+        FindID = function(_, id)
+            return by_id[id]
+        end,
+    }
+end
+
+local function type_index(info, name)
+    local row = name ~= nil and info[name]
+    return row and row.Index or -1
+end
+
+local function make_unit(u)
+    return {
+        GetID = function() return u.id end,
+        GetType = function() return GameInfo.Units[u.type].Index end,
+        GetX = function() return u.x end,
+        GetY = function() return u.y end,
+        GetMovesRemaining = function() return u.moves_remaining end,
+        GetMaxMoves = function() return u.max_moves end,
+    }
+end
+
+local function make_city(c)
+    local has = {}
+    for _, b in ipairs(c.buildings) do
+        has[GameInfo.Buildings[b].Index] = true
+    end
+    local districts = {}
+    for i, d in ipairs(c.districts) do
+        local index = GameInfo.Districts[d].Index
+        districts[i] = { GetID = function() return i end, GetType = function() return index end }
+    end
+    local buildings = { HasBuilding = function(_, index) return has[index] == true end }
+    local queue = {
+        CreateIncompleteUnit = function(_, index) record("CreateIncompleteUnit", c.id, index) end,
+    }
+    return {
+        GetID = function() return c.id end,
+        GetName = function() return c.name end,
+        GetX = function() return c.x end,
+        GetY = function() return c.y end,
+        GetPopulation = function() return c.population end,
+        GetBuildings = function() return buildings end,
+        GetDistricts = function() return collection(districts) end,
+        GetBuildQueue = function() return queue end,
+    }
+end
+
+local function make_player(p)
+    local cities, units = {}, {}
+    for i, c in ipairs(p.cities) do
+        cities[i] = make_city(c)
+    end
+    for i, u in ipairs(p.units) do
+        units[i] = make_unit(u)
+    end
+    local treasury = {
+        GetGoldBalance = function() return p.treasury.gold_balance end,
+        GetGoldYield = function() return p.treasury.gold_yield end,
+        GetTotalMaintenance = function() return p.treasury.total_maintenance end,
+        ChangeGoldBalance = function(_, delta) p.treasury.gold_balance = p.treasury.gold_balance + delta end,
+    }
+    local culture = {
+        GetProgressingCivic = function() return type_index(GameInfo.Civics, p.culture.progressing_civic) end,
+    }
+    local religion = {
+        GetFaithBalance = function() return p.religion.faith_balance end,
+        GetFaithYield = function() return p.religion.faith_yield end,
+    }
+    local techs = {
+        GetResearchingTech = function() return type_index(GameInfo.Technologies, p.science.progressing_tech) end,
+        GetScienceYield = function() return p.science.science_yield end,
+        SetResearchingTech = function(_, index)
+            p.science.progressing_tech = GameInfo.Technologies[index].TechnologyType
+        end,
+    }
+    return {
+        IsAlive = function() return p.is_alive end,
+        IsHuman = function() return p.is_human end,
+        GetTreasury = function() return treasury end,
+        GetCulture = function() return culture end,
+        GetReligion = function() return religion end,
+        GetTechs = function() return techs end,
+        GetCities = function() return collection(cities) end,
+        GetUnits = function() return collection(units) end,
+    }
+end
+
+function HarnessSetGame(game)
+    Players, PlayerConfigurations = {}, {}
+    local count, local_player = 0, -1
+    for _, p in ipairs(game.players) do
+        Players[p.id] = make_player(p)
+        PlayerConfigurations[p.id] = {
+            GetCivilizationTypeName = function() return p.civilization end,
+            GetLeaderTypeName = function() return p.leader end,
+        }
+        count = math.max(count, p.id + 1)
+        if p.is_human and local_player == -1 then
+            local_player = p.id
+        end
+    end
+    PlayerManager = { GetWasEverAliveCount = function() return count end }
+    Game.GetCurrentGameTurn = function() return game.turn end
+    Game.GetLocalPlayer = function() return local_player end
+end
+
+Game = {}
+UnitManager = {
+    RequestOperation = function(unit, operation, args)
+        record("RequestOperation", unit:GetID(), operation, args.X, args.Y)
+    end,
+    RequestCommand = function(unit, command) record("RequestCommand", unit:GetID(), command) end,
+}
+UnitOperationTypes = { MOVETO = "MOVETO" }
+UnitCommandTypes = { CANCEL = "CANCEL" }
+UI = { RequestAction = function(action) record("RequestAction", action) end }
+ActionTypes = { ACTION_ENDTURN = "ACTION_ENDTURN" }
+
+-- Events.<Name>.Add(handler); HarnessFire(name, ...) calls the handlers
+Events = setmetatable({}, { __index = function(events, name)
+    local event = { handlers = {} }
+    event.Add = function(handler) event.handlers[#event.handlers + 1] = handler end
+    events[name] = event
+    return event
+end })
+
+function HarnessFire(name, ...)
+    for _, handler in ipairs(Events[name].handlers) do
+        handler(...)
+    end
+end
+"""
+
+
+def as_exported(state: dict) -> dict:
+    """A state dict (e.g. from synthetic.generate_states) as the mod exports it from the mock.
+
+    Unit names and stats come from the unit type's catalogue row, buildings are in
+    catalogue order, and a city also gets the districts its buildings need.
+    """
+    players = []
+    for player in state["players"]:
+        cities = []
+        for city in player.get("cities", []):
+            buildings = sorted(city.get("buildings", []), key=_BUILDING_ORDER.__getitem__)
+            districts = list(city.get("districts", []))
+            needed = {BUILDING_DISTRICTS[b] for b in buildings if b in BUILDING_DISTRICTS}
+            districts += [d for d in DISTRICTS if d in needed and d not in districts]
+            cities.append({**city, "buildings": buildings, "districts": districts})
+        units = [{**unit, **_UNIT_FIELDS[unit["type"]]} for unit in player.get("units", [])]
+        players.append({**player, "cities": cities, "units": units})
+    return {**state, "players": players}
+
+
+class ModHarness:
+    """The mod's scripts loaded into a Lua runtime, with the game replaced by a scripted mock.
+
+    Usage:
+        harness = ModHarness()
+        harness.load_game(next(generate_states(players=8, cities=15, units=60)))
+        raw = harness.export()  # the JSON ExportGameState printed
+        state = from_dict(parse_frame(raw))
+
+        harness.run("Game.AgentSetGold(0, 500)")  # ["CIV6BRIDGE_RESULT:OK:set_gold:CIV6BRIDGE_END"]
+        harness.fire("PlayerTurnStarted", 0)  # the mod's event hooks export a frame
+        harness.calls  # game actions the commands requested, e.g. "RequestAction ACTION_ENDTURN"
+
+    Loading event_hooks.lua includes the other scripts (json, utils, game_state,
+    agent_commands), as in the game. The mock implements the parts of Players,
+    PlayerConfigurations, PlayerManager, GameInfo, Game, Events, UnitManager and
+    UI that the scripts use; its GameInfo holds CATALOG, the types of the synthetic
+    games. ``keyframe_interval`` sets CIV6BRIDGE_KEYFRAME_INTERVAL.
+    """
+
+    def __init__(self, scripts: Path = MOD_SCRIPTS, keyframe_interval: int = 1):
+        if not (scripts / "game_state.lua").is_file():
+            raise FileNotFoundError(f"Mod scripts not found in {scripts}")
+        self.scripts = scripts
+        self.lua = lupa.LuaRuntime()
+        g = self.lua.globals()
+        g.HarnessSource = self._source
+        self.lua.execute(_MOCK_API)
+        g.HarnessSetCatalog(self._table(CATALOG))
+        g.CIV6BRIDGE_KEYFRAME_INTERVAL = keyframe_interval
+        self.lua.execute('include("event_hooks")')
+        self._take_printed()
+
+    def _source(self, name: str) -> str:
+        return (self.scripts / f"{name}.lua").read_text(encoding="utf-8")
+
+    def _table(self, value: object) -> object:
+        # None values would end Lua arrays early; leave those keys out
+        if isinstance(value, dict):
+            return self.lua.table_from({k: self._table(v) for k, v in value.items() if v is not None})
+        if isinstance(value, list | tuple):
+            return self.lua.table_from([self._table(v) for v in value])
+        return value
+
+    def _take_printed(self) -> list[str]:
+        g = self.lua.globals()
+        printed = list(g.HarnessPrinted.values())
+        g.HarnessPrinted = self.lua.table()
+        return printed
+
+    def load_game(self, state: dict) -> dict:
+        """Make the mock game hold ``state``; return it as the mod should export it (see as_exported)."""
+        exported = as_exported(state)
+        self.lua.globals().HarnessSetGame(self._table(exported))
+        return exported
+
+    def export(self) -> str:
+        """Run ExportGameState() and return the frame payload it printed."""
+        self._take_printed()
+        self.lua.globals().ExportGameState()
+        return _payload(self._take_printed())
+
+    def run(self, lua: str) -> list[str]:
+        """Run Lua code, such as a FireTuner command, and return the lines it printed."""
+        self._take_printed()
+        self.lua.execute(lua)
+        return self._take_printed()
+
+    def fire(self, event: str, *args: object) -> list[str]:
+        """Fire a game event (e.g. "PlayerTurnStarted") and return the lines the handlers printed."""
+        self._take_printed()
+        self.lua.globals().HarnessFire(event, *args)
+        return self._take_printed()
+
+    @property
+    def calls(self) -> list[str]:
+        """Game actions requested so far (unit operations and commands, UI actions, production)."""
+        return list(self.lua.globals().HarnessCalls.values())
+
+
+def _payload(lines: list[str]) -> str:
+    for i, line in enumerate(lines[:-2]):
+        if line == SENTINEL_BEGIN and lines[i + 2] == SENTINEL_END:
+            return lines[i + 1]
+    raise ValueError("ExportGameState printed no frame")
+
+
+class ExportMeasurement(NamedTuple):
+    """Export cost of one game size; see measure_export()."""
+
+    players: int
+    cities: int  # per player
+    units: int  # per player
+    exports: int
+    seconds: tuple[float, ...]  # per export, timed around ExportGameState()
+    frame_bytes: tuple[int, ...]  # per export
+    mismatched: tuple[int, ...]  # turns whose frame did not decode to the mock's state
+
+    @property
+    def mean_seconds(self) -> float:
+        return statistics.fmean(self.seconds)
+
+    @property
+    def max_seconds(self) -> float:
+        return max(self.seconds)
+
+    @property
+    def mean_frame_bytes(self) -> float:
+        return statistics.fmean(self.frame_bytes)
+
+
+def measure_export(
+    players: int = 8,
+    cities: int = 15,
+    units: int = 60,
+    turns: int = 10,
+    keyframe_interval: int = 1,
+    seed: int = 0,
+    check: bool = True,
+    scripts: Path = MOD_SCRIPTS,
+) -> ExportMeasurement:
+    """Export ``turns`` turns of a synthetic game of the given size and time each export.
+
+    With ``check``, every frame is decoded with parse_frame and from_dict (delta
+    frames on their keyframe) and compared with the state loaded into the mock.
+    """
+    harness = ModHarness(scripts, keyframe_interval)
+    seconds: list[float] = []
+    sizes: list[int] = []
+    mismatched: list[int] = []
+    keyframe: dict | None = None
+    for state in generate_states(players, cities, units, turns, seed):
+        expected = harness.load_game(state)
+        start = time.perf_counter()
+        raw = harness.export()
+        seconds.append(time.perf_counter() - start)
+        sizes.append(len(raw.encode()))
+        if check and not _round_trips(raw, expected, keyframe):
+            mismatched.append(state["turn"])
+        data = parse_frame(raw)
+        if not is_delta_frame(data):
+            keyframe = data
+    return ExportMeasurement(players, cities, units, turns, tuple(seconds), tuple(sizes), tuple(mismatched))
+
+
+def _round_trips(raw: str, expected: dict, keyframe: dict | None) -> bool:
+    if frame_export(raw) is None:
+        return False
+    data = parse_frame(raw)
+    base = keyframe if is_delta_frame(data) else None
+    # Through JSON, as the log does, so both sides hold the same number types
+    return from_dict(data, base=base) == from_dict(json.loads(json.dumps(expected)))
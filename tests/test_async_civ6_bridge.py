@@ -0,0 +1,64 @@
+"""Tests for the AsyncCiv6Bridge facade."""
+
+import asyncio
+from pathlib import Path
+
+from civ6_bridge.async_civ6_bridge import AsyncCiv6Bridge
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.diff import PlayerAdded
+
+
+def test_get_current_state_from_fixture():
+    log_path = Path(__file__).parent / "fixtures" / "sample_lua_log.txt"
+    state = asyncio.run(AsyncCiv6Bridge(log_path=log_path).get_current_state())
+    assert state is not None
+    assert state.turn == 2
+
+
+def test_on_turn_with_async_callback(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text("")
+
+    async def scenario() -> list[int]:
+        bridge = AsyncCiv6Bridge(log_path=log)
+        seen: list[int] = []
+        done = asyncio.Event()
+
+        async def callback(state):
+            seen.append(state.turn)
+            done.set()
+
+        bridge.on_turn(callback, poll_interval=0.02)
+        await asyncio.sleep(0.05)
+        log.write_text(f'{SENTINEL_BEGIN}\n{{"version":1,"turn":7,"players":[]}}\n{SENTINEL_END}\n')
+        await asyncio.wait_for(done.wait(), 5)
+        await asyncio.wait_for(bridge.stop(), 5)
+        return seen
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 10)) == [7]
+
+
+def test_on_change_with_async_callback(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text(f'{SENTINEL_BEGIN}\n{{"version":1,"turn":1,"players":[]}}\n{SENTINEL_END}\n')
+
+    async def scenario() -> list:
+        bridge = AsyncCiv6Bridge(log_path=log)
+        received = []
+        done = asyncio.Event()
+
+        async def callback(changes, state):
+            received.append((state.turn, changes))
+            done.set()
+
+        bridge.on_change(callback, poll_interval=0.02)
+        await asyncio.sleep(0.05)
+        with open(log, "a") as f:
+            f.write(f'{SENTINEL_BEGIN}\n{{"version":1,"turn":2,"players":[{{"id":3}}]}}\n{SENTINEL_END}\n')
+        await asyncio.wait_for(done.wait(), 5)
+        await asyncio.wait_for(bridge.stop(), 5)
+        return received
+
+    ((turn, changes),) = asyncio.run(asyncio.wait_for(scenario(), 10))
+    assert turn == 2
+    assert [type(c) for c in changes] == [PlayerAdded]
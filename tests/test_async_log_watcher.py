@@ -0,0 +1,66 @@
+"""Tests for civ6_bridge.async_log_watcher."""
+
+import asyncio
+from pathlib import Path
+
+from civ6_bridge.async_log_watcher import AsyncLogWatcher
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.watch_backend import PollingBackend
+
+
+def _frame(turn: int) -> str:
+    return f'{SENTINEL_BEGIN}\n{{"version":1,"turn":{turn},"players":[]}}\n{SENTINEL_END}\n'
+
+
+def test_read_latest():
+    log_path = Path(__file__).parent / "fixtures" / "sample_lua_log.txt"
+    state = asyncio.run(AsyncLogWatcher(log_path).read_latest())
+    assert state is not None
+    assert state.turn == 2
+
+
+def test_watch_yields_appended_frames(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text(_frame(1))
+
+    async def scenario() -> list[int]:
+        watcher = AsyncLogWatcher(log)
+        turns: list[int] = []
+
+        async def consume() -> None:
+            async for state in watcher.watch(backend=PollingBackend(min_interval=0.01, max_interval=0.01)):
+                turns.append(state.turn)
+                if len(turns) == 2:
+                    return
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(_frame(2))
+        await asyncio.sleep(0.05)
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(_frame(3))
+        await asyncio.wait_for(task, 5)
+        return turns
+
+    assert asyncio.run(scenario()) == [2, 3]
+
+
+def test_many_watchers_share_one_loop(tmp_path):
+    logs = [tmp_path / f"Lua{i}.log" for i in range(20)]
+    for log in logs:
+        log.write_text("")
+
+    async def first_turn(log: Path) -> int:
+        async for state in AsyncLogWatcher(log).watch(poll_interval=0.02, backend="auto"):
+            return state.turn
+        raise AssertionError("watch() ended")
+
+    async def scenario() -> list[int]:
+        tasks = [asyncio.create_task(first_turn(log)) for log in logs]
+        await asyncio.sleep(0.05)
+        for turn, log in enumerate(logs):
+            log.write_text(_frame(turn))
+        return await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+    assert asyncio.run(scenario()) == list(range(20))
@@ -0,0 +1,73 @@
+"""Tests for the asyncio FireTuner client."""
+
+import asyncio
+
+import pytest
+
+from civ6_bridge.async_tuner_client import AsyncTunerClient
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.tuner_client import build_message
+
+
+async def _serve_once(reply: bytes, received: list[bytes]) -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        header = await reader.readexactly(8)
+        length = int.from_bytes(header[:4], "little")
+        received.append(header + await reader.readexactly(length))
+        writer.write(reply)
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _run_against(reply: bytes, lua: str) -> tuple[str, list[bytes]]:
+    received: list[bytes] = []
+
+    async def scenario() -> str:
+        server = await _serve_once(reply, received)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await AsyncTunerClient(port=port).send_command(lua)
+
+    return asyncio.run(scenario()), received
+
+
+def test_send_command():
+    result, received = _run_against(b"\x00\x01CIV6BRIDGE_RESULT:PONG:CIV6BRIDGE_END", "Game.AgentPing()")
+    assert result == "PONG"
+    assert received == [build_message("Game.AgentPing()")]
+
+
+def test_command_error():
+    with pytest.raises(TunerCommandError, match="unit not found"):
+        _run_against(b"CIV6BRIDGE_RESULT:ERR:unit not found 3:CIV6BRIDGE_END", "x()")
+
+
+def test_connection_refused(unused_tcp_port):
+    client = AsyncTunerClient(port=unused_tcp_port)
+    with pytest.raises(TunerConnectionError, match="Cannot connect"):
+        asyncio.run(client.send_command("x()"))
+
+
+def test_connection_reset():
+    async def reset(message: bytes) -> bytes:
+        raise ConnectionResetError("reset by peer")
+
+    client = AsyncTunerClient()
+    client._exchange = reset
+    with pytest.raises(TunerConnectionError, match="failed: reset by peer"):
+        asyncio.run(client.send_command("x()"))
+
+
+def test_is_connected(unused_tcp_port):
+    assert asyncio.run(AsyncTunerClient(port=unused_tcp_port).is_connected()) is False
+
+
+@pytest.fixture
+def unused_tcp_port():
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
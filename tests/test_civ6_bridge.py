@@ -1,8 +1,13 @@
 """Tests for the Civ6Bridge facade class."""
 
+import json
+import threading
+import time
 from pathlib import Path
 
 from civ6_bridge.civ6_bridge import Civ6Bridge
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.diff import UnitMoved
 
 
 def test_get_current_state_from_fixture():
@@ -22,3 +27,99 @@ def test_get_current_state_empty(tmp_path):
     bridge = Civ6Bridge(log_path=empty_log)
     state = bridge.get_current_state()
     assert state is None
+
+
+def test_on_change_reports_diffs_against_the_baseline(tmp_path):
+    log = tmp_path / "Lua.log"
+
+    def frame(turn, x):
+        unit = {"id": 1, "type": "UNIT_WARRIOR", "x": x, "y": 0, "moves_remaining": 2}
+        data = {"version": 1, "turn": turn, "players": [{"id": 0, "units": [unit]}]}
+        return f"{SENTINEL_BEGIN}\n{json.dumps(data)}\n{SENTINEL_END}\n"
+
+    log.write_text(frame(1, 0))
+    bridge = Civ6Bridge(log_path=log)
+    received = []
+    done = threading.Event()
+
+    def callback(changes, state):
+        received.append((state.turn, changes))
+        done.set()
+
+    bridge.on_change(callback, poll_interval=0.02, backend="poll")
+    try:
+        time.sleep(0.1)
+        with open(log, "a") as f:
+            f.write(frame(2, 0) + frame(3, 4))
+        assert done.wait(5)
+        time.sleep(0.1)
+    finally:
+        bridge.stop()
+    assert [turn for turn, _ in received] == [3]
+    (change,) = received[0][1]
+    assert isinstance(change, UnitMoved)
+    assert (change.before.x, change.after.x) == (0, 4)
+
+
+def test_subscribers_share_one_reader(tmp_path):
+    log = tmp_path / "Lua.log"
+
+    def frame(turn):
+        return f"{SENTINEL_BEGIN}\n{json.dumps({'version': 1, 'turn': turn, 'players': []})}\n{SENTINEL_END}\n"
+
+    log.write_text(frame(1))
+    bridge = Civ6Bridge(log_path=log)
+    fast, slow = [], []
+    gate = threading.Event()
+
+    def slow_callback(state):
+        gate.wait(5)
+        slow.append(state)
+
+    bridge.subscribe(fast.append, poll_interval=0.02, backend="poll")
+    bridge.subscribe(slow_callback, maxsize=1, policy="keep_latest", name="slow")
+    try:
+        with open(log, "a") as f:
+            f.write(frame(2) + frame(3) + frame(4))
+        deadline = time.monotonic() + 5
+        while len(fast) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [state.turn for state in fast] == [2, 3, 4]
+        gate.set()
+        assert bridge._bus.join(5)
+        assert slow[0] is fast[0]  # parsed once, shared
+        assert slow[-1].turn == 4
+        stats = {s.name: s for s in bridge.subscription_stats()}
+        assert stats["slow"].delivered + stats["slow"].dropped == 3
+    finally:
+        bridge.close()
+    assert bridge.subscription_stats() == []
+
+
+def test_reader_stops_with_the_last_subscriber(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text("")
+    bridge = Civ6Bridge(log_path=log)
+    try:
+        first = bridge.subscribe(lambda state: None, poll_interval=0.02, backend="poll")
+        second = bridge.subscribe(lambda state: None)
+        reader = bridge._watch_thread
+        assert reader is not None
+        first.cancel()
+        time.sleep(0.1)
+        assert reader.is_alive()
+        second.cancel()
+        reader.join(5)
+        assert not reader.is_alive()
+        assert bridge._watch_thread is None
+
+        received = []
+        bridge.subscribe(received.append, poll_interval=0.02, backend="poll")
+        with open(log, "a") as f:
+            f.write(f"{SENTINEL_BEGIN}\n{json.dumps({'version': 1, 'turn': 5, 'players': []})}\n{SENTINEL_END}\n")
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [state.turn for state in received] == [5]
+    finally:
+        bridge.close()
@@ -1,9 +1,12 @@
 """Tests for the GameCommands high-level API."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
-from civ6_bridge.commands import GameCommands
-from civ6_bridge.exceptions import TunerConnectionError
+import pytest
+
+from civ6_bridge.commands import AsyncGameCommands, GameCommands
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
 
 
 class TestGameCommands:
@@ -47,3 +50,106 @@ class TestGameCommands:
     def test_ping_no_pong(self):
         self.mock_client.send_command.return_value = "something else"
         assert self.commands.ping() is False
+
+
+class TestCommandBatch:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.commands = GameCommands(self.mock_client)
+
+    def test_builds_single_chunk(self):
+        batch = self.commands.batch()
+        batch.move_unit(0, 1, 10, 20)
+        batch.research_tech(0, "TECH_POTTERY")
+        batch.produce_unit(1, 0, "UNIT_WARRIOR")
+        assert batch.to_lua() == (
+            "Game.AgentCall(1, Game.AgentMoveUnit, 0, 1, 10, 20)\n"
+            'Game.AgentCall(2, Game.AgentResearchTech, 0, "TECH_POTTERY")\n'
+            'Game.AgentCall(3, Game.AgentProduceUnit, 1, 0, "UNIT_WARRIOR")'
+        )
+
+    def test_one_round_trip_with_per_call_results(self):
+        self.mock_client.send_raw.return_value = (
+            b"\x00CIV6BRIDGE_RESULT:#1:OK:move_unit:CIV6BRIDGE_END"
+            b"\x00CIV6BRIDGE_RESULT:#2:ERR:unknown tech TECH_NOPE:CIV6BRIDGE_END"
+            b"\x00CIV6BRIDGE_RESULT:#3:OK:produce_unit:CIV6BRIDGE_END"
+        )
+        with self.commands.batch() as batch:
+            move = batch.move_unit(0, 1, 10, 20)
+            tech = batch.research_tech(0, "TECH_NOPE")
+            produce = batch.produce_unit(1, 0, "UNIT_WARRIOR")
+
+        self.mock_client.send_raw.assert_called_once_with(batch.to_lua(), expected_results=3)
+        self.mock_client.send_command.assert_not_called()
+        assert move.value == "OK:move_unit"
+        assert produce.value == "OK:produce_unit"
+        assert not tech.ok
+        with pytest.raises(TunerCommandError, match="unknown tech TECH_NOPE"):
+            _ = tech.value
+
+    def test_results_matched_by_id_not_order(self):
+        self.mock_client.send_raw.return_value = (
+            b"CIV6BRIDGE_RESULT:#2:OK:add_gold:CIV6BRIDGE_END CIV6BRIDGE_RESULT:#1:OK:set_gold:CIV6BRIDGE_END"
+        )
+        with self.commands.batch() as batch:
+            first = batch.set_gold(0, 10)
+            second = batch.add_gold(0, 5)
+        assert (first.value, second.value) == ("OK:set_gold", "OK:add_gold")
+
+    def test_missing_result(self):
+        self.mock_client.send_raw.return_value = b""
+        with self.commands.batch() as batch:
+            call = batch.end_turn()
+        with pytest.raises(TunerCommandError, match="No result for batched call #1"):
+            _ = call.value
+
+    def test_not_sent_when_block_raises(self):
+        with pytest.raises(RuntimeError), self.commands.batch() as batch:
+            batch.end_turn()
+            raise RuntimeError("abort")
+        self.mock_client.send_raw.assert_not_called()
+
+    def test_empty_batch_sends_nothing(self):
+        with self.commands.batch():
+            pass
+        self.mock_client.send_raw.assert_not_called()
+
+
+class TestAsyncGameCommands:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.mock_client.send_command = AsyncMock(return_value="OK:move_unit")
+        self.commands = AsyncGameCommands(self.mock_client)
+
+    def test_move_unit(self):
+        assert asyncio.run(self.commands.move_unit(0, 1, 10, 20)) == "OK:move_unit"
+        self.mock_client.send_command.assert_awaited_once_with("Game.AgentMoveUnit(0, 1, 10, 20)")
+
+    def test_produce_unit(self):
+        asyncio.run(self.commands.produce_unit(1, 0, "UNIT_WARRIOR"))
+        self.mock_client.send_command.assert_awaited_once_with('Game.AgentProduceUnit(1, 0, "UNIT_WARRIOR")')
+
+    def test_ping_success(self):
+        self.mock_client.send_command.return_value = "PONG"
+        assert asyncio.run(self.commands.ping()) is True
+
+    def test_ping_connection_error(self):
+        self.mock_client.send_command.side_effect = TunerConnectionError("fail")
+        assert asyncio.run(self.commands.ping()) is False
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("move_unit", (0, 1, 10, 20)),
+            ("end_turn", ()),
+            ("set_gold", (0, 500)),
+            ("add_gold", (1, -100)),
+            ("research_tech", (0, "TECH_POTTERY")),
+            ("produce_unit", (1, 0, "UNIT_WARRIOR")),
+        ],
+    )
+    def test_same_lua_as_sync_commands(self, method, args):
+        sync_client = MagicMock()
+        getattr(GameCommands(sync_client), method)(*args)
+        asyncio.run(getattr(self.commands, method)(*args))
+        assert self.mock_client.send_command.await_args == sync_client.send_command.call_args
@@ -0,0 +1,176 @@
+"""Tests for civ6_bridge.decoder — the single-pass frame decoder."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from civ6_bridge.decoder import decode_frame
+from civ6_bridge.delta import make_delta
+from civ6_bridge.exceptions import ParseError, SchemaVersionError
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.log_parser import parse_frame
+from civ6_bridge.models import City, Treasury, Unit
+
+
+@pytest.fixture
+def sample_data():
+    fixture = Path(__file__).parent / "fixtures" / "sample_game_state.json"
+    return json.loads(fixture.read_text())
+
+
+def _late_game(players: int = 8, cities: int = 12, units: int = 40) -> dict:
+    return {
+        "version": 1,
+        "turn": 250,
+        "players": [
+            {
+                "id": pid,
+                "is_alive": True,
+                "is_human": pid == 0,
+                "civilization": f"CIVILIZATION_{pid}",
+                "leader": f"LEADER_{pid}",
+                "treasury": {"gold_balance": 1200, "gold_yield": 45.5, "total_maintenance": 30},
+                "culture": {"progressing_civic": "CIVIC_GLOBALIZATION"},
+                "religion": {"faith_balance": 300, "faith_yield": 12},
+                "science": {"progressing_tech": "TECH_ROBOTICS", "science_yield": 150.5},
+                "cities": [
+                    {
+                        "id": c,
+                        "name": f"City {c}",
+                        "x": c,
+                        "y": pid,
+                        "population": 14,
+                        "owner_id": pid,
+                        "buildings": ["BUILDING_MONUMENT", "BUILDING_LIBRARY"],
+                        "districts": ["DISTRICT_CITY_CENTER", "DISTRICT_CAMPUS"],
+                    }
+                    for c in range(cities)
+                ],
+                "units": [
+                    {
+                        "id": u,
+                        "type": "UNIT_INFANTRY",
+                        "name": "Infantry",
+                        "x": u,
+                        "y": pid,
+                        "owner_id": pid,
+                        "moves_remaining": 2,
+                        "max_moves": 2,
+                        "combat": 70,
+                        "ranged_combat": 0,
+                        "range": 0,
+                        "base_moves": 2,
+                    }
+                    for u in range(units)
+                ],
+            }
+            for pid in range(players)
+        ],
+    }
+
+
+class TestDecodeFrame:
+    def test_matches_from_dict(self, sample_data):
+        raw = json.dumps(sample_data)
+        assert decode_frame(raw) == from_dict(parse_frame(raw))
+
+    def test_matches_from_dict_on_large_frame(self):
+        raw = json.dumps(_late_game(), separators=(",", ":"))
+        state = decode_frame(raw)
+        assert state == from_dict(parse_frame(raw))
+        assert len(state.players) == 8
+        assert len(state.players[3].units) == 40
+
+    def test_builds_model_types(self, sample_data):
+        player = decode_frame(json.dumps(sample_data)).players[0]
+        assert type(player.cities[0]) is City
+        assert type(player.units[0]) is Unit
+        assert player.cities[0].buildings == ("BUILDING_MONUMENT",)
+        assert isinstance(player.cities[0].districts, tuple)
+        hash(player.units[0])
+
+    def test_integral_floats_are_coerced(self):
+        # The mod's JSON encoder writes whole numbers without a decimal point
+        state = decode_frame(json.dumps(_late_game(players=1, cities=0, units=0)))
+        treasury = state.players[0].treasury
+        assert treasury == Treasury(gold_balance=1200.0, gold_yield=45.5, total_maintenance=30.0)
+        assert type(treasury.gold_balance) is float
+
+    def test_non_int_values_are_coerced_like_from_dict(self):
+        unit = {
+            "id": 7,
+            "type": "UNIT_SCOUT",
+            "name": "Scout",
+            "x": "3",
+            "y": 4.0,
+            "owner_id": 0,
+            "moves_remaining": 1.5,
+            "max_moves": True,
+            "combat": 10,
+            "ranged_combat": 0,
+            "range": 0,
+            "base_moves": 2,
+        }
+        city = {
+            "id": "1",
+            "name": "Rome",
+            "x": 1,
+            "y": 2,
+            "population": 3.0,
+            "owner_id": 0,
+            "buildings": [],
+            "districts": [],
+        }
+        raw = json.dumps({"version": 1, "turn": 3, "players": [{"id": 0, "cities": [city], "units": [unit]}]})
+        state = decode_frame(raw)
+        assert state == from_dict(parse_frame(raw))
+        decoded = state.players[0].units[0]
+        assert (decoded.x, decoded.y, decoded.moves_remaining, decoded.max_moves) == (3, 4, 1, 1)
+        assert [type(v) for v in (decoded.x, decoded.y, decoded.moves_remaining, decoded.max_moves)] == [int] * 4
+        assert type(state.players[0].cities[0].population) is int
+
+    def test_missing_fields_use_defaults(self):
+        raw = json.dumps(
+            {
+                "version": 1,
+                "turn": 3,
+                "players": [
+                    {
+                        "id": 2,
+                        "treasury": {"gold_balance": 5},
+                        "cities": [{"id": 1, "population": 2}],
+                        "units": [{"id": 7, "type": "UNIT_SCOUT", "moves_remaining": 3}],
+                    }
+                ],
+            }
+        )
+        state = decode_frame(raw)
+        assert state == from_dict(parse_frame(raw))
+        assert state.players[0].units[0].base_moves == 2
+        assert state.players[0].cities[0].buildings == ()
+
+    def test_empty_objects_encoded_as_lists(self):
+        # json.lua encodes an empty table as []
+        raw = json.dumps({"version": 1, "turn": 1, "players": [{"id": 0, "treasury": [], "cities": [], "units": []}]})
+        player = decode_frame(raw).players[0]
+        assert player.treasury == Treasury()
+        assert player.cities == ()
+
+    def test_rejects_delta_frames(self, sample_data):
+        cur = dict(sample_data, turn=43)
+        delta = dict(make_delta(sample_data, cur), kind="delta", base_turn=42)
+        with pytest.raises(ParseError, match="keyframe"):
+            decode_frame(json.dumps(delta))
+
+    def test_invalid_json(self):
+        with pytest.raises(ParseError):
+            decode_frame("{not json")
+
+    def test_not_an_object(self):
+        with pytest.raises(ParseError):
+            decode_frame("[1, 2]")
+
+    def test_schema_version(self, sample_data):
+        with pytest.raises(SchemaVersionError):
+            decode_frame(json.dumps(dict(sample_data, version=99)))
@@ -0,0 +1,92 @@
+"""Tests for civ6_bridge.delta — entity deltas between state dicts."""
+
+import json
+
+import pytest
+
+from civ6_bridge.delta import apply_delta, make_delta
+from civ6_bridge.exceptions import ParseError
+
+
+def _unit(uid: int, x: int = 0) -> dict:
+    return {"id": uid, "type": "UNIT_WARRIOR", "x": x, "y": 0}
+
+
+def _player(pid: int, gold: float = 0.0, units=(), cities=()) -> dict:
+    return {
+        "id": pid,
+        "is_alive": True,
+        "treasury": {"gold_balance": gold},
+        "units": list(units),
+        "cities": list(cities),
+    }
+
+
+def _state(turn: int, players) -> dict:
+    return {"players": list(players), "turn": turn, "version": 1}
+
+
+CASES = {
+    "unchanged": (
+        _state(1, [_player(0, units=[_unit(1)])]),
+        _state(2, [_player(0, units=[_unit(1)])]),
+    ),
+    "unit_moved": (
+        _state(1, [_player(0, units=[_unit(1), _unit(2)])]),
+        _state(2, [_player(0, units=[_unit(1), _unit(2, x=5)])]),
+    ),
+    "unit_added_and_removed": (
+        _state(1, [_player(0, units=[_unit(1), _unit(2)])]),
+        _state(2, [_player(0, units=[_unit(2), _unit(3)])]),
+    ),
+    "player_joined_and_left": (
+        _state(1, [_player(0), _player(1)]),
+        _state(2, [_player(0), _player(2, gold=5)]),
+    ),
+    "reordered": (
+        _state(1, [_player(0, units=[_unit(1), _unit(2), _unit(3)])]),
+        _state(2, [_player(0, units=[_unit(3), _unit(1), _unit(2)])]),
+    ),
+    "nested_field_changed": (
+        _state(1, [_player(0, gold=10)]),
+        _state(2, [_player(0, gold=12)]),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_round_trip(name):
+    prev, cur = CASES[name]
+    delta = json.loads(json.dumps(make_delta(prev, cur)))
+    assert apply_delta(prev, delta) == cur
+
+
+def test_delta_only_carries_changes():
+    prev, cur = CASES["unit_moved"]
+    delta = make_delta(prev, cur)
+    assert delta["players"] == {"upsert": [{"id": 0, "units": {"upsert": [_unit(2, x=5)]}}]}
+
+
+def test_unchanged_state_has_empty_player_delta():
+    prev, cur = CASES["unchanged"]
+    assert make_delta(prev, cur) == {"players": {}, "turn": 2, "version": 1}
+
+
+def test_list_replaces_collection():
+    base = _state(1, [_player(0, units=[_unit(1)])])
+    delta = {"turn": 2, "version": 1, "players": {"upsert": [{"id": 0, "units": [_unit(9)]}]}}
+    assert apply_delta(base, delta)["players"][0]["units"] == [_unit(9)]
+
+
+def test_base_is_not_modified():
+    prev, cur = CASES["unit_added_and_removed"]
+    snapshot = json.loads(json.dumps(prev))
+    apply_delta(prev, make_delta(prev, cur))
+    assert prev == snapshot
+
+
+def test_order_with_unknown_id_is_a_parse_error():
+    prev = _state(1, [_player(0, units=[_unit(1)])])
+    delta = {"turn": 2, "version": 1, "players": {"upsert": [{"id": 0, "units": {"order": [1, 9]}}]}}
+    with pytest.raises(ParseError, match="turn 2.*id 9"):
+        apply_delta(prev, delta)
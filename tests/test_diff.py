@@ -0,0 +1,102 @@
+"""Tests for civ6_bridge.diff — change events between consecutive states."""
+
+import dataclasses
+
+from civ6_bridge.diff import (
+    BuildingCompleted,
+    CityAdded,
+    CityPopulationChanged,
+    CityRemoved,
+    DistrictCompleted,
+    PlayerAdded,
+    PlayerRemoved,
+    PlayerStatChanged,
+    UnitAdded,
+    UnitMoved,
+    UnitRemoved,
+    UnitUpdated,
+    diff,
+)
+from civ6_bridge.models import City, GameState, Player, ScienceState, Treasury, Unit
+
+WARRIOR = Unit(id=1, type="UNIT_WARRIOR", x=5, y=5, owner_id=0, moves_remaining=2)
+SETTLER = Unit(id=2, type="UNIT_SETTLER", x=6, y=5, owner_id=0, moves_remaining=2)
+ROME = City(id=1, name="Rome", x=10, y=10, population=3, owner_id=0, buildings=("BUILDING_MONUMENT",))
+
+
+def _state(turn: int, **player_fields) -> GameState:
+    fields = {"id": 0, "cities": (ROME,), "units": (WARRIOR, SETTLER)}
+    fields.update(player_fields)
+    return GameState(turn=turn, players=(Player(**fields),))
+
+
+def test_no_changes():
+    assert diff(_state(1), _state(2)) == []
+    state = _state(1)
+    assert diff(state, dataclasses.replace(state, turn=2)) == []
+
+
+def test_units():
+    moved = dataclasses.replace(WARRIOR, x=6, moves_remaining=1)
+    fortified = dataclasses.replace(SETTLER, moves_remaining=0)
+    scout = Unit(id=3, type="UNIT_SCOUT", owner_id=0)
+    changes = diff(_state(1), _state(2, units=(moved, scout)))
+    assert changes == [UnitMoved(0, WARRIOR, moved), UnitAdded(0, scout), UnitRemoved(0, SETTLER)]
+    assert diff(_state(1), _state(2, units=(WARRIOR, fortified))) == [UnitUpdated(0, SETTLER, fortified)]
+
+
+def test_cities():
+    grown = dataclasses.replace(
+        ROME,
+        population=4,
+        buildings=("BUILDING_MONUMENT", "BUILDING_GRANARY"),
+        districts=("DISTRICT_CAMPUS",),
+    )
+    antium = City(id=2, name="Antium", owner_id=0)
+    changes = diff(_state(1), _state(2, cities=(grown, antium)))
+    assert changes == [
+        CityPopulationChanged(0, 1, 3, 4),
+        BuildingCompleted(0, 1, "BUILDING_GRANARY"),
+        DistrictCompleted(0, 1, "DISTRICT_CAMPUS"),
+        CityAdded(0, antium),
+    ]
+    assert diff(_state(1), _state(2, cities=())) == [CityRemoved(0, ROME)]
+
+
+def test_player_stats():
+    changes = diff(
+        _state(1),
+        _state(
+            2,
+            treasury=Treasury(gold_balance=25.0),
+            science=ScienceState(progressing_tech="TECH_WRITING", science_yield=2.0),
+            is_alive=False,
+        ),
+    )
+    assert changes == [
+        PlayerStatChanged(0, "is_alive", True, False),
+        PlayerStatChanged(0, "gold_balance", 0.0, 25.0),
+        PlayerStatChanged(0, "science_yield", 0.0, 2.0),
+        PlayerStatChanged(0, "progressing_tech", "", "TECH_WRITING"),
+    ]
+
+
+def test_players_added_and_removed():
+    prev = _state(1)
+    egypt = Player(id=1, units=(Unit(id=1, owner_id=1),))
+    curr = GameState(turn=2, players=(egypt,))
+    assert diff(prev, curr) == [PlayerAdded(1, egypt), UnitAdded(1, egypt.units[0]), PlayerRemoved(0, prev.players[0])]
+
+
+def test_first_state_is_all_added():
+    changes = diff(None, _state(1))
+    assert [type(c) for c in changes] == [PlayerAdded, CityAdded, UnitAdded, UnitAdded]
+
+
+def test_ids_are_matched_per_player():
+    # Both players have a unit 1; moving one must not affect the other
+    egypt = Player(id=1, units=(Unit(id=1, x=40, y=40, owner_id=1),))
+    prev = GameState(players=(Player(id=0, units=(WARRIOR,)), egypt))
+    moved = dataclasses.replace(WARRIOR, x=7)
+    curr = GameState(players=(Player(id=0, units=(moved,)), egypt))
+    assert diff(prev, curr) == [UnitMoved(0, WARRIOR, moved)]
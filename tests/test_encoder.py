@@ -0,0 +1,115 @@
+"""Tests for civ6_bridge.encoder — NumPy observations and the vocabulary."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from civ6_bridge.encoder import PLAYER_FEATURES, ObservationEncoder, Vocabulary  # noqa: E402
+from civ6_bridge.models import (  # noqa: E402
+    City,
+    CultureState,
+    GameState,
+    Player,
+    ScienceState,
+    Treasury,
+    Unit,
+)
+
+
+def _state(turn: int = 10) -> GameState:
+    rome = Player(
+        id=0,
+        is_human=True,
+        civilization="CIVILIZATION_ROME",
+        treasury=Treasury(gold_balance=120.5, gold_yield=8.0),
+        science=ScienceState(progressing_tech="TECH_POTTERY", science_yield=3.5),
+        culture=CultureState(progressing_civic="CIVIC_CODE_OF_LAWS"),
+        cities=(City(id=1, x=10, y=11, population=4, owner_id=0, buildings=("BUILDING_MONUMENT", "BUILDING_GRANARY")),),
+        units=(
+            Unit(id=1, type="UNIT_WARRIOR", x=10, y=11, owner_id=0, moves_remaining=2, max_moves=2, combat=20),
+            Unit(id=2, type="UNIT_ARCHER", x=12, y=9, owner_id=0, moves_remaining=1, ranged_combat=25, range=2),
+        ),
+    )
+    egypt = Player(
+        id=3,
+        civilization="CIVILIZATION_EGYPT",
+        units=(Unit(id=1, type="UNIT_WARRIOR", x=30, y=3, owner_id=3),),
+    )
+    return GameState(turn=turn, players=(rome, egypt))
+
+
+def test_layout_and_values():
+    obs = ObservationEncoder(max_units=4, max_cities=2, max_players=3).encode(_state())
+    assert obs.unit_x.shape == (1, 4)
+    assert obs.unit_mask.tolist() == [[True, True, True, False]]
+    assert obs.unit_owner.tolist() == [[0, 0, 3, 0]]
+    assert obs.unit_x.tolist() == [[10, 12, 30, 0]]
+    assert obs.unit_moves.tolist() == [[2, 1, 0, 0]]
+    assert obs.unit_range.tolist() == [[0, 2, 0, 0]]
+    assert obs.unit_type.tolist() == [[1, 2, 1, 0]]
+    assert obs.city_population.tolist() == [[4, 0]]
+    assert obs.player_id.tolist() == [[0, 3, 0]]
+    assert obs.player_mask.tolist() == [[True, True, False]]
+    assert obs.turn.tolist() == [10]
+    for array in (obs.unit_x, obs.city_owner, obs.player_civilization):
+        assert array.flags.c_contiguous
+
+
+def test_player_features():
+    obs = ObservationEncoder().encode(_state())
+    features = dict(zip(PLAYER_FEATURES, obs.player_features[0, 0].tolist(), strict=True))
+    assert features["is_human"] == 1.0
+    assert features["gold_balance"] == 120.5
+    assert features["science_yield"] == 3.5
+    assert features["num_units"] == 2.0
+    assert obs.player_features.dtype == np.float32
+
+
+def test_building_bitmask():
+    encoder = ObservationEncoder()
+    obs = encoder.encode(_state())
+    monument = encoder.vocab.id("buildings", "BUILDING_MONUMENT")
+    granary = encoder.vocab.id("buildings", "BUILDING_GRANARY")
+    assert obs.city_buildings.shape == (1, 64, 4)
+    assert int(obs.city_buildings[0, 0, 0]) == (1 << monument) | (1 << granary)
+    assert not obs.city_buildings[0, 1].any()
+
+
+def test_building_capacity_is_checked():
+    vocab = Vocabulary({"buildings": [f"BUILDING_{i}" for i in range(70)]})
+    with pytest.raises(ValueError, match="building_capacity"):
+        ObservationEncoder(building_capacity=64, vocab=vocab).encode(
+            GameState(players=(Player(cities=(City(buildings=("BUILDING_69",)),)),))
+        )
+    with pytest.raises(ValueError):
+        ObservationEncoder(building_capacity=100)
+
+
+def test_batch_and_truncation():
+    encoder = ObservationEncoder(max_units=2)
+    obs = encoder.encode_batch([_state(1), _state(2), GameState(turn=3)])
+    assert obs.unit_x.shape == (3, 2)
+    assert obs.turn.tolist() == [1, 2, 3]
+    assert obs.unit_mask.tolist() == [[True, True], [True, True], [False, False]]
+    single = encoder.encode(_state(2))
+    for name, array in single._asdict().items():
+        np.testing.assert_array_equal(array[0], getattr(obs, name)[1], err_msg=name)
+
+
+def test_vocabulary_round_trip(tmp_path):
+    vocab = Vocabulary()
+    ObservationEncoder(vocab=vocab).encode(_state())
+    path = tmp_path / "vocab.json"
+    vocab.save(path)
+    loaded = Vocabulary.load(path, frozen=True)
+    assert loaded.tokens("unit_types") == ["UNIT_WARRIOR", "UNIT_ARCHER"]
+    assert loaded.id("buildings", "BUILDING_GRANARY") == vocab.id("buildings", "BUILDING_GRANARY")
+    assert loaded.id("unit_types", "UNIT_TANK") == 0
+    assert len(loaded) == len(vocab)
+    assert vocab.id("unit_types", "UNIT_TANK") == 3
+
+
+def test_vocabulary_rejects_unknown_category():
+    with pytest.raises(ValueError):
+        Vocabulary().id("wonders", "BUILDING_PYRAMIDS")
+    assert Vocabulary().id("techs", "") == 0
@@ -0,0 +1,129 @@
+"""Tests for the EventBus."""
+
+import threading
+import time
+
+import pytest
+
+from civ6_bridge.event_bus import BLOCK, DROP_OLDEST, KEEP_LATEST, EventBus
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus(max_workers=4)
+    yield bus
+    bus.close()
+
+
+def test_every_subscriber_gets_every_item_in_order(bus):
+    a, b = [], []
+    bus.subscribe(a.append, maxsize=100)
+    bus.subscribe(b.append, maxsize=100)
+    for i in range(50):
+        bus.publish(i)
+    assert bus.join(5)
+    assert a == b == list(range(50))
+
+
+def test_slow_subscriber_does_not_hold_up_the_others(bus):
+    gate = threading.Event()
+    fast = []
+    slow = bus.subscribe(lambda item: gate.wait(5), maxsize=2, policy=DROP_OLDEST)
+    bus.subscribe(fast.append, maxsize=100)
+    for i in range(10):
+        bus.publish(i)
+    bus.subscriptions[1]._wait_idle(5)
+    assert fast == list(range(10))
+    assert slow.stats().pending == 2
+    gate.set()
+    assert bus.join(5)
+
+
+def _blocked(bus, policy, maxsize):
+    gate = threading.Event()
+    got = []
+
+    def callback(item):
+        gate.wait(5)
+        got.append(item)
+
+    subscription = bus.subscribe(callback, maxsize=maxsize, policy=policy)
+    bus.publish(0)
+    while subscription.stats().pending:  # wait until item 0 is being handled
+        time.sleep(0.001)
+    return subscription, gate, got
+
+
+def test_drop_oldest(bus):
+    subscription, gate, got = _blocked(bus, DROP_OLDEST, 2)
+    for i in range(1, 6):
+        bus.publish(i)
+    gate.set()
+    assert bus.join(5)
+    assert got == [0, 4, 5]
+    stats = subscription.stats()
+    assert (stats.delivered, stats.dropped, stats.max_pending) == (3, 3, 2)
+
+
+def test_keep_latest(bus):
+    subscription, gate, got = _blocked(bus, KEEP_LATEST, 3)
+    for i in range(1, 8):
+        bus.publish(i)
+    gate.set()
+    assert bus.join(5)
+    assert got[0] == 0 and got[-1] == 7
+    assert subscription.stats().dropped == 7 - (len(got) - 1)
+
+
+def test_block_makes_publish_wait(bus):
+    subscription, gate, got = _blocked(bus, BLOCK, 1)
+    bus.publish(1)
+    publisher = threading.Thread(target=bus.publish, args=(2,))
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()
+    gate.set()
+    publisher.join(5)
+    assert bus.join(5)
+    assert got == [0, 1, 2]
+    assert subscription.stats().dropped == 0
+
+
+def test_callback_errors_are_counted(bus):
+    got = []
+
+    def callback(item):
+        if item == 1:
+            raise ValueError("boom")
+        got.append(item)
+
+    subscription = bus.subscribe(callback)
+    for i in range(3):
+        bus.publish(i)
+    assert bus.join(5)
+    assert got == [0, 2]
+    assert subscription.stats().errors == 1
+    assert isinstance(subscription.last_error, ValueError)
+
+
+def test_cancel_stops_delivery(bus):
+    got = []
+    subscription = bus.subscribe(got.append, name="recorder")
+    bus.publish(1)
+    assert bus.join(5)
+    subscription.cancel()
+    bus.publish(2)
+    assert got == [1]
+    assert not subscription.active
+    assert subscription.stats().name == "recorder"
+    assert bus.subscriptions == []
+
+
+def test_bad_arguments(bus):
+    with pytest.raises(ValueError):
+        bus.subscribe(print, maxsize=0)
+    with pytest.raises(ValueError):
+        bus.subscribe(print, policy="newest")
+    bus.close()
+    with pytest.raises(RuntimeError):
+        bus.subscribe(print)
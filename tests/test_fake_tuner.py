@@ -0,0 +1,102 @@
+"""Tests for the stand-in FireTuner server."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from civ6_bridge.commands import GameCommands
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.fake_tuner import FakeTunerServer
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.tuner_client import TunerClient
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample_game_state.json"
+
+
+@pytest.fixture
+def fake():
+    servers = []
+
+    def start(**kwargs):
+        server = FakeTunerServer(port=0, **kwargs).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_answers_agent_calls_like_the_mod(fake):
+    server = fake()
+    game = GameCommands(TunerClient(port=server.port, pool_size=1))
+    assert game.ping()
+    assert game.move_unit(0, 1, 10, 20) == "OK:move_unit"
+    assert game.set_gold(1, 100) == "OK:set_gold"
+    assert game.add_gold(1, -30) == "OK:add_gold"
+    assert server.gold[1] == 70
+    assert game.end_turn() == "OK:end_turn"
+    with pytest.raises(TunerCommandError, match="invalid player 42"):
+        game.move_unit(42, 1, 0, 0)
+    with pytest.raises(TunerCommandError, match="unknown tech"):
+        game.research_tech(0, "POTTERY")
+    assert server.stats.calls == 7
+
+
+def test_batches_are_tagged_per_call(fake):
+    server = fake()
+    game = GameCommands(TunerClient(port=server.port, pool_size=1))
+    with game.batch() as batch:
+        move = batch.move_unit(0, 1, 2, 3)
+        bad = batch.produce_unit(0, 99, "UNIT_WARRIOR")
+        tech = batch.research_tech(0, "TECH_POTTERY")
+    assert (move.value, tech.value) == ("OK:move_unit", "OK:research_tech")
+    assert bad.error == "invalid player 99"
+    assert server.stats.messages == 1
+
+
+def test_checks_ids_against_a_state(fake):
+    state = from_dict(json.loads(FIXTURE.read_text()))
+    player = state.players[0]
+    server = fake(state=state)
+    game = GameCommands(TunerClient(port=server.port, pool_size=1))
+    assert game.move_unit(player.id, player.units[0].id, 1, 1) == "OK:move_unit"
+    with pytest.raises(TunerCommandError, match="unit not found"):
+        game.move_unit(player.id, 999_999, 1, 1)
+    assert server.gold[player.id] == player.treasury.gold_balance
+
+
+def test_short_lived_client_needs_the_connection_closed(fake):
+    server = fake(keep_alive=False)
+    assert GameCommands(TunerClient(port=server.port)).move_unit(0, 1, 2, 3) == "OK:move_unit"
+    assert server.stats.connections == 1
+
+
+def test_injected_failures_and_drops(fake):
+    failing = GameCommands(TunerClient(port=fake(failure_rate=1.0).port, pool_size=1))
+    with pytest.raises(TunerCommandError, match="injected failure"):
+        failing.end_turn()
+    dropping = fake(drop_rate=1.0)
+    with pytest.raises(TunerConnectionError):
+        GameCommands(TunerClient(port=dropping.port, timeout=1.0, pool_size=1)).end_turn()
+    assert dropping.stats.dropped == 1
+
+
+def test_latency(fake):
+    server = fake(latency=0.05)
+    client = TunerClient(port=server.port, pool_size=1)
+    client.send_command("Game.AgentPing()")  # connect first
+    start = time.perf_counter()
+    client.send_command("Game.AgentPing()")
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_bad_options_and_busy_port(fake):
+    with pytest.raises(ValueError):
+        FakeTunerServer(failure_rate=2)
+    with pytest.raises(ValueError):
+        FakeTunerServer(latency=-1)
+    with pytest.raises(OSError):
+        FakeTunerServer(port=fake().port).start()
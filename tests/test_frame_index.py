@@ -0,0 +1,114 @@
+"""Tests for civ6_bridge.frame_index — the turn → offset sidecar index."""
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.frame_index import INDEX_SUFFIX, FrameIndex, IndexEntry
+
+
+def _frame(turn: int) -> str:
+    return f'{SENTINEL_BEGIN}\n{{"players":[],"turn":{turn},"version":1}}\n{SENTINEL_END}\n'
+
+
+def _write_log(path, turns):
+    text = "noise\n" + "".join(_frame(t) for t in turns)
+    path.write_text(text)
+    return text
+
+
+class TestFrameIndex:
+    def test_update_indexes_every_frame(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        text = _write_log(log, [1, 2, 3])
+        index = FrameIndex(log, persist=False)
+        index.update()
+        assert index.turns() == [1, 2, 3]
+        entry = index.get(2)
+        assert entry == IndexEntry(2, text.index(_frame(2)), len(_frame(2)) - 1)
+        assert index.indexed_to >= text.rindex(SENTINEL_END) + len(SENTINEL_END)
+
+    def test_later_frame_for_same_turn_wins(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        text = _write_log(log, [4, 4])
+        index = FrameIndex(log, persist=False)
+        index.update()
+        assert index.get(4).offset == text.rindex(SENTINEL_BEGIN)
+
+    def test_update_scans_only_appended_bytes(self, tmp_path, monkeypatch):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1])
+        index = FrameIndex(log, persist=False)
+        index.update()
+        with open(log, "a") as f:
+            f.write(_frame(2))
+        seen = []
+        monkeypatch.setattr("civ6_bridge.frame_index.frame_turn", lambda raw: seen.append(raw) or 2)
+        index.update()
+        assert len(seen) == 1
+        assert index.turns() == [1, 2]
+
+    def test_partial_frame_is_picked_up_later(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        frame = _frame(7)
+        log.write_text(_frame(6) + frame[:20])
+        index = FrameIndex(log, persist=False)
+        index.update()
+        assert index.turns() == [6]
+        with open(log, "a") as f:
+            f.write(frame[20:])
+        index.update()
+        assert index.turns() == [6, 7]
+
+    def test_persist_false_writes_no_sidecar(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1])
+        FrameIndex(log, persist=False).update()
+        assert not (tmp_path / ("Lua.log" + INDEX_SUFFIX)).exists()
+
+    def test_sidecar_reload(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1, 2])
+        first = FrameIndex(log)
+        first.update()
+        first.close()
+
+        second = FrameIndex(log)
+        assert second.turns() == [1, 2]
+        assert second.indexed_to == first.indexed_to
+        assert second.get(2) == first.get(2)
+
+    def test_truncated_log_invalidates_sidecar(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1, 2, 3])
+        index = FrameIndex(log)
+        index.update()
+        index.close()
+
+        _write_log(log, [9])
+        reloaded = FrameIndex(log)
+        assert len(reloaded) == 0
+        reloaded.update()
+        assert reloaded.turns() == [9]
+
+    def test_replaced_log_invalidates_sidecar(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1, 2])
+        index = FrameIndex(log)
+        index.update()
+        index.close()
+
+        replacement = tmp_path / "new.log"
+        replacement.write_text("other\n" + _frame(5) + _frame(6) + _frame(7))
+        replacement.replace(log)
+        reloaded = FrameIndex(log)
+        assert not reloaded.is_valid()
+        reloaded.update()
+        assert reloaded.turns() == [5, 6, 7]
+
+    def test_torn_sidecar_line_is_ignored(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        _write_log(log, [1, 2])
+        index = FrameIndex(log)
+        index.update()
+        index.close()
+        with open(index.index_path, "a") as f:
+            f.write("F 3 12")
+        assert FrameIndex(log).turns() == [1, 2]
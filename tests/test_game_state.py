@@ -5,8 +5,10 @@ from pathlib import Path
 
 import pytest
 
-from civ6_bridge.game_state import from_dict, get_human_player, get_player_by_id
-from civ6_bridge.models import GameState
+from civ6_bridge.delta import make_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import from_dict, get_human_player, get_player_by_id, to_dict
+from civ6_bridge.models import GameState, ScienceState, Treasury
 
 
 @pytest.fixture
@@ -91,6 +93,41 @@ class TestFromDict:
         assert player.cities == ()
         assert player.units == ()
 
+    def test_empty_objects_encoded_as_lists(self):
+        # json.lua encodes an empty table as []
+        data = {"version": 1, "turn": 1, "players": [{"id": 0, "treasury": [], "science": []}]}
+        player = from_dict(data).players[0]
+        assert player.treasury == Treasury()
+        assert player.science == ScienceState()
+
+
+class TestToDict:
+    def test_inverse_of_from_dict(self, sample_data):
+        state = from_dict(sample_data)
+        assert from_dict(json.loads(json.dumps(to_dict(state)))) == state
+
+
+class TestDeltaFrames:
+    def _delta(self, base, cur):
+        return json.loads(json.dumps({**make_delta(base, cur), "kind": "delta", "base_turn": base["turn"]}))
+
+    def test_applies_delta_to_keyframe(self, sample_data):
+        cur = json.loads(json.dumps(sample_data))
+        cur["turn"] = 43
+        cur["players"][0]["treasury"]["gold_balance"] = 999
+        state = from_dict(self._delta(sample_data, cur), base=sample_data)
+        assert state == from_dict(cur)
+
+    def test_delta_without_base(self, sample_data):
+        delta = self._delta(sample_data, {**sample_data, "turn": 43})
+        with pytest.raises(ParseError, match="keyframe for turn 42"):
+            from_dict(delta)
+
+    def test_delta_with_wrong_base(self, sample_data):
+        delta = self._delta(sample_data, {**sample_data, "turn": 43})
+        with pytest.raises(ParseError):
+            from_dict(delta, base={**sample_data, "turn": 41})
+
 
 class TestQueryHelpers:
     def test_get_human_player(self, sample_data):
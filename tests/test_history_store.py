@@ -0,0 +1,152 @@
+"""Tests for civ6_bridge.history_store — the compressed GameState history."""
+
+import json
+import random
+
+import pytest
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import from_dict, to_dict
+from civ6_bridge.history_store import HistoryStore
+from civ6_bridge.log_watcher import LogWatcher
+
+
+def _game(turns: int, seed: int = 0) -> list[dict]:
+    """A small game where a few units move each turn and gold grows."""
+    rng = random.Random(seed)
+    players = [
+        {
+            "id": pid,
+            "civilization": f"CIVILIZATION_{pid}",
+            "leader": f"LEADER_{pid}",
+            "is_alive": True,
+            "is_human": pid == 0,
+            "treasury": {"gold_balance": 10.0, "gold_yield": 5.0, "total_maintenance": 1.0},
+            "science": {"progressing_tech": "TECH_POTTERY", "science_yield": 2.5},
+            "culture": {"progressing_civic": "CIVIC_CODE_OF_LAWS"},
+            "religion": {"faith_balance": 0.0, "faith_yield": 1.0},
+            "cities": [
+                {"id": c, "name": f"City {c}", "x": c, "y": pid, "population": 3, "owner_id": pid, "buildings": []}
+                for c in range(4)
+            ],
+            "units": [
+                {"id": u, "type": "UNIT_WARRIOR", "name": "Warrior", "x": u, "y": u, "owner_id": pid, "combat": 20}
+                for u in range(12)
+            ],
+        }
+        for pid in range(4)
+    ]
+    states = []
+    for turn in range(1, turns + 1):
+        for player in players:
+            player["treasury"] = dict(player["treasury"], gold_balance=player["treasury"]["gold_balance"] + 5)
+            for _ in range(3):
+                i = rng.randrange(len(player["units"]))
+                unit = player["units"][i]
+                player["units"][i] = dict(unit, x=unit["x"] + 1)
+        state = to_dict(from_dict({"players": players, "turn": turn, "version": 1}))
+        states.append(state)
+    return states
+
+
+def _frame_text(data: dict) -> str:
+    return f"{SENTINEL_BEGIN}\n{json.dumps(data)}\n{SENTINEL_END}\n"
+
+
+@pytest.fixture
+def states():
+    return [from_dict(d) for d in _game(40)]
+
+
+def test_round_trip(tmp_path, states):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=16) as store:
+        store.extend(states)
+    reopened = HistoryStore(path)
+    assert list(reopened) == states
+    assert len(reopened) == 40
+    assert reopened.turns() == list(range(1, 41))
+
+
+def test_read_range_and_get(tmp_path, states):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=8) as store:
+        store.extend(states)
+    store = HistoryStore(path)
+    assert [s.turn for s in store.read_range(10, 20)] == list(range(10, 20))
+    assert store.get(33) == states[32]
+    assert store.get(99) is None
+
+
+def test_range_query_reads_only_overlapping_chunks(tmp_path, states, monkeypatch):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=8) as store:
+        store.extend(states)
+    store = HistoryStore(path)
+    decoded = []
+    real = store._decode_chunk
+    monkeypatch.setattr(store, "_decode_chunk", lambda f, chunk: decoded.append(chunk) or real(f, chunk))
+    list(store.read_range(10, 12))
+    assert len(decoded) == 1
+
+
+def test_iteration_shares_unchanged_objects(tmp_path, states):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=8) as store:
+        store.extend(states)
+    loaded = list(HistoryStore(path))
+    # Turns 8 and 9 sit in different chunks; sharing carries across chunk boundaries
+    for prev, cur in ((loaded[3], loaded[4]), (loaded[7], loaded[8])):
+        shared = [u for u in cur.players[1].units if any(u is v for v in prev.players[1].units)]
+        assert len(shared) >= len(cur.players[1].units) - 3
+        assert cur.players[2].cities is prev.players[2].cities
+
+
+def test_pending_states_are_readable_before_flush(tmp_path, states):
+    store = HistoryStore(tmp_path / "game.c6bh", chunk_size=100)
+    store.extend(states[:5])
+    assert store.get(3) == states[2]
+    assert [s.turn for s in store.read_range(0, 100)] == [1, 2, 3, 4, 5]
+    assert len(HistoryStore(tmp_path / "game.c6bh")) == 0
+
+
+def test_append_after_reopen(tmp_path, states):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=8) as store:
+        store.extend(states[:20])
+    with HistoryStore(path, chunk_size=8) as store:
+        store.extend(states[20:])
+    assert list(HistoryStore(path)) == states
+
+
+def test_torn_chunk_is_dropped_and_overwritten(tmp_path, states):
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path, chunk_size=10) as store:
+        store.extend(states[:20])
+    size = path.stat().st_size
+    with open(path, "r+b") as f:
+        f.truncate(size - 7)
+    store = HistoryStore(path, chunk_size=10)
+    assert store.turns() == list(range(1, 11))
+    store.extend(states[10:20])
+    store.close()
+    assert list(HistoryStore(path)) == states[:20]
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "game.c6bh"
+    path.write_bytes(b"not a history file")
+    with pytest.raises(ParseError):
+        HistoryStore(path)
+
+
+def test_much_smaller_than_the_log(tmp_path):
+    game = _game(60)
+    log = tmp_path / "Lua.log"
+    log.write_text("".join(_frame_text(d) for d in game))
+    path = tmp_path / "game.c6bh"
+    with HistoryStore(path) as store:
+        store.extend(LogWatcher(log).iter_turns(0, 1000))
+    assert path.stat().st_size * 5 < log.stat().st_size
+    assert [to_dict(s) for s in HistoryStore(path)] == game
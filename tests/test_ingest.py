@@ -0,0 +1,126 @@
+"""Tests for bulk ingestion of archived logs."""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.delta import make_delta
+from civ6_bridge.game_state import from_dict, to_dict
+from civ6_bridge.history_store import HistoryStore
+from civ6_bridge.ingest import (
+    CallbackSink,
+    HistorySink,
+    JsonlSink,
+    _InlineExecutor,
+    decode_batch,
+    ingest,
+    split_frames,
+)
+
+
+def _state(turn):
+    unit = {"id": 1, "type": "UNIT_SCOUT", "x": turn, "y": 0, "owner_id": 0}
+    city = {"id": 1, "name": "Rome", "population": 1 + turn // 3, "buildings": ["BUILDING_MONUMENT"]}
+    return {"version": 1, "turn": turn, "players": [{"id": 0, "cities": [city], "units": [unit]}]}
+
+
+def _log_text(turns, keyframe_interval=3):
+    """A log with a keyframe every ``keyframe_interval`` turns and deltas in between."""
+    lines = []
+    base = None
+    for turn in turns:
+        cur = _state(turn)
+        if base is None or turn % keyframe_interval == 0:
+            frame, base = cur, cur
+        else:
+            frame = {**make_delta(base, cur), "kind": "delta", "base_turn": base["turn"]}
+        lines += ["Lua: turn noise", SENTINEL_BEGIN, json.dumps(frame, sort_keys=True), SENTINEL_END]
+    return "\n".join(lines) + "\n"
+
+
+def _expected(turns):
+    return [to_dict(from_dict(_state(turn))) for turn in turns]
+
+
+def test_split_frames_cuts_only_before_keyframes():
+    f = io.BytesIO(_log_text(range(12)).encode())
+    batches = list(split_frames(f, batch_bytes=1))
+    assert [len(batch) for batch in batches] == [3, 3, 3, 3]
+    assert all('"kind"' not in batch[0] for batch in batches)
+
+
+def test_decode_batch_rebuilds_deltas_and_counts_bad_frames():
+    payloads = list(split_frames(io.BytesIO(_log_text(range(1, 6)).encode())))[0]
+    states, skipped = decode_batch(["{broken", *payloads[1:]])
+    assert skipped == 2  # the broken frame, and the delta for turn 2 without its keyframe
+    assert [to_dict(s) for s in states] == _expected(range(3, 6))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_plain_and_gzip_logs_in_order(tmp_path, workers):
+    plain, packed = tmp_path / "a.log", tmp_path / "b.log.gz"
+    plain.write_text(_log_text(range(10)))
+    with gzip.open(packed, "wt") as f:
+        f.write(_log_text(range(20, 30)))
+    got = []
+    stats = ingest([plain, packed], CallbackSink(lambda src, s: got.append((src.name, s))), workers, batch_bytes=200)
+    assert [(name, to_dict(s)) for name, s in got] == [
+        *(("a.log", d) for d in _expected(range(10))),
+        *(("b.log.gz", d) for d in _expected(range(20, 30))),
+    ]
+    assert (stats.files_done, stats.states, stats.frames, stats.skipped) == (2, 20, 20, 0)
+    assert stats.bytes_read == plain.stat().st_size + len(_log_text(range(20, 30)))
+
+
+def test_files_count_as_done_once_their_states_are_written(tmp_path):
+    plain, packed = tmp_path / "a.log", tmp_path / "b.log"
+    plain.write_text(_log_text(range(10)))
+    packed.write_text(_log_text(range(20, 30)))
+    written = []
+    reports = []
+    sink = CallbackSink(lambda src, s: written.append(src))
+    ingest([plain, packed], sink, 1, batch_bytes=200, progress=lambda st: reports.append((st.files_done, len(written))))
+    assert reports[0] == (0, 3)
+    assert all(written_states >= 10 * done for done, written_states in reports)
+    assert reports[-1] == (2, 20)
+
+
+def test_inline_executor_keeps_errors_in_the_future():
+    future = _InlineExecutor().submit(int, "not a number")
+    assert isinstance(future.exception(), ValueError)
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_jsonl_sink(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text(_log_text(range(4)))
+    out = tmp_path / "states.jsonl.gz"
+    ingest([log], JsonlSink(out), workers=1)
+    with gzip.open(out, "rt") as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["source"] for row in rows] == [str(log)] * 4
+    assert [from_dict(row["state"]) for row in rows] == [from_dict(d) for d in _expected(range(4))]
+
+
+def test_history_sink_one_store_per_log(tmp_path):
+    for name in ("run1.log", "run2.log"):
+        (tmp_path / name).write_text(_log_text(range(5)))
+    out = tmp_path / "out"
+    ingest(sorted(tmp_path.glob("*.log")), HistorySink(out), workers=1)
+    assert sorted(p.name for p in out.iterdir()) == ["run1.c6bh", "run2.c6bh"]
+    assert [to_dict(s) for s in HistoryStore(out / "run2.c6bh")] == _expected(range(5))
+
+
+def test_unreadable_file_is_reported_and_skipped(tmp_path):
+    good, bad = tmp_path / "good.log", tmp_path / "bad.log.gz"
+    good.write_text(_log_text(range(3)))
+    bad.write_bytes(b"\x1f\x8bnot really gzip")
+    reports = []
+    stats = ingest([bad, tmp_path / "missing.log", good], CallbackSink(lambda src, s: None), 1, progress=reports.append)
+    assert [path for path, _ in stats.failed] == [bad, tmp_path / "missing.log"]
+    assert stats.states == 3
+    assert reports and reports[-1] is stats
@@ -0,0 +1,77 @@
+"""Tests for civ6_bridge.lazy_state — GameStates built on first access."""
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from civ6_bridge.delta import make_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import from_dict, get_human_player, get_player_by_id, to_dict
+from civ6_bridge.lazy_state import LazyGameState, lazy_from_dict
+from civ6_bridge.models import GameState, Player, Treasury
+
+
+@pytest.fixture
+def sample_data():
+    fixture = Path(__file__).parent / "fixtures" / "sample_game_state.json"
+    return json.loads(fixture.read_text())
+
+
+def test_equal_to_eager_state(sample_data):
+    lazy = lazy_from_dict(sample_data)
+    eager = from_dict(sample_data)
+    assert lazy == eager
+    assert eager == lazy
+    assert lazy.players[1] == eager.players[1]
+    assert hash(lazy) == hash(eager)
+
+
+def test_turn_builds_nothing(sample_data):
+    lazy = lazy_from_dict(sample_data)
+    assert lazy.turn == 42
+    assert lazy.version == 1
+    assert "players" not in vars(lazy)
+
+
+def test_nested_objects_are_built_once(sample_data):
+    lazy = lazy_from_dict(sample_data)
+    player = get_human_player(lazy)
+    assert player.civilization == "CIVILIZATION_AMERICA"
+    assert player.treasury == Treasury(gold_balance=150.0, gold_yield=12.5, total_maintenance=8.0)
+    assert "units" not in vars(player)
+    assert player.units is player.units
+    assert get_player_by_id(lazy, 1).cities[0].name == "Rome"
+
+
+def test_materialize(sample_data):
+    state = lazy_from_dict(sample_data).materialize()
+    assert type(state) is GameState
+    assert type(state.players[0]) is Player
+    assert state == from_dict(sample_data)
+    assert to_dict(lazy_from_dict(sample_data)) == to_dict(state)
+
+
+def test_cannot_be_modified(sample_data):
+    lazy = lazy_from_dict(sample_data)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        lazy.turn = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        lazy.players[0].units = ()
+
+
+def test_delta_frames(sample_data):
+    cur = json.loads(json.dumps(sample_data))
+    cur["turn"] = 43
+    cur["players"][0]["units"][0]["x"] = 99
+    delta = {**make_delta(sample_data, cur), "kind": "delta", "base_turn": 42}
+    assert lazy_from_dict(delta, base=sample_data) == from_dict(cur)
+    with pytest.raises(ParseError):
+        lazy_from_dict(delta)
+
+
+def test_not_a_gamestate_subclass(sample_data):
+    # A different class with the same attributes, not a subclass of the frozen model
+    assert isinstance(lazy_from_dict(sample_data), LazyGameState)
+    assert not isinstance(lazy_from_dict(sample_data), GameState)
@@ -0,0 +1,38 @@
+"""Tests for the FireTuner command load test."""
+
+import pytest
+
+from civ6_bridge.fake_tuner import FakeTunerServer
+from civ6_bridge.loadtest import LoadTestResult, run_loadtest
+
+
+@pytest.mark.parametrize("mode", ["short", "pooled", "batched"])
+def test_every_command_is_answered(mode):
+    with FakeTunerServer(port=0, keep_alive=mode != "short") as server:
+        result = run_loadtest(mode, port=server.port, commands=45, concurrency=3, batch_size=10)
+    assert (result.commands, result.failed, result.lost) == (45, 0, 0)
+    assert result.requests == (5 if mode == "batched" else 45)
+    assert server.stats.calls == 45
+    assert result.commands_per_second > 0
+    assert 0 < result.p50 <= result.p99
+
+
+def test_failures_and_drops_are_counted():
+    with FakeTunerServer(port=0, failure_rate=1.0) as server:
+        result = run_loadtest("pooled", port=server.port, commands=10, concurrency=2)
+    assert (result.commands, result.failed) == (10, 10)
+    with FakeTunerServer(port=0, keep_alive=False, drop_rate=1.0) as server:
+        result = run_loadtest("short", port=server.port, commands=5, concurrency=1)
+    assert (result.commands, result.lost) == (0, 5)
+
+
+def test_percentiles():
+    result = LoadTestResult("pooled", latencies=[i / 100 for i in range(1, 101)])
+    assert result.p50 == pytest.approx(0.505)
+    assert result.p99 == pytest.approx(0.9901)
+    assert LoadTestResult("short").p99 == 0.0
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        run_loadtest("pipelined")
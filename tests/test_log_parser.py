@@ -1,12 +1,21 @@
 """Tests for civ6_bridge.log_parser — frame extraction, validation."""
 
 import json
+import random
 
 import pytest
 
 from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
 from civ6_bridge.exceptions import ParseError, SchemaVersionError
-from civ6_bridge.log_parser import extract_frames, parse_frame
+from civ6_bridge.log_parser import (
+    FrameScanner,
+    extract_frames,
+    frame_export,
+    frame_turn,
+    iter_frames_reverse,
+    may_be_delta,
+    parse_frame,
+)
 
 
 class TestExtractFrames:
@@ -47,6 +56,138 @@ class TestExtractFrames:
             assert data["version"] == 1
 
 
+class TestIterFramesReverse:
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 65536])
+    def test_matches_extract_frames(self, tmp_path, sample_lua_log, block_size):
+        log = tmp_path / "Lua.log"
+        log.write_text(sample_lua_log)
+        frames = list(iter_frames_reverse(log, block_size=block_size))
+        assert frames == list(reversed(extract_frames(sample_lua_log)))
+
+    def test_empty_file(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_bytes(b"")
+        assert list(iter_frames_reverse(log)) == []
+
+    def test_skips_truncated_trailing_frame(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(f'{SENTINEL_BEGIN}\n{{"turn":1}}\n{SENTINEL_END}\n{SENTINEL_BEGIN}\n{{"tu')
+        assert list(iter_frames_reverse(log, block_size=4)) == ['{"turn":1}']
+
+    def test_orphan_end_does_not_hide_previous_frame(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(f'{SENTINEL_BEGIN}\n{{"turn":1}}\n{SENTINEL_END}\n"turn":2}}\n{SENTINEL_END}\n')
+        assert list(iter_frames_reverse(log, block_size=5)) == ['{"turn":1}']
+
+    def test_stray_end_does_not_buffer_the_log(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(f'{SENTINEL_BEGIN}\n{{"turn":1}}\n{SENTINEL_END}\n' + "x" * 5000 + f"\n{SENTINEL_END}\n")
+        assert list(iter_frames_reverse(log, block_size=64, max_frame_size=1000)) == ['{"turn":1}']
+
+    def test_skips_frames_over_max_size(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        big = '{"turn":2,"pad":"' + "y" * 500 + '"}'
+        log.write_text(f'{SENTINEL_BEGIN}\n{{"turn":1}}\n{SENTINEL_END}\n{SENTINEL_BEGIN}\n{big}\n{SENTINEL_END}\n')
+        for block_size in (16, 4096):
+            frames = list(iter_frames_reverse(log, block_size=block_size, max_frame_size=200))
+            assert frames == ['{"turn":1}']
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_block_size_does_not_change_result(self, tmp_path, seed):
+        rng = random.Random(seed)
+        pieces = [SENTINEL_BEGIN, SENTINEL_END, "\n", '{"turn":1}', "noise", "x" * 40]
+        log = tmp_path / "Lua.log"
+        log.write_text("".join(rng.choice(pieces) for _ in range(60)))
+        whole = list(iter_frames_reverse(log, block_size=1 << 20))
+        assert list(iter_frames_reverse(log, block_size=rng.randint(1, 50))) == whole
+
+    def test_reads_only_the_tail(self, tmp_path, monkeypatch):
+        log = tmp_path / "Lua.log"
+        noise = "x" * 1_000_000
+        log.write_text(f'{noise}\n{SENTINEL_BEGIN}\n{{"turn":7}}\n{SENTINEL_END}\ntrailing line\n')
+        read_sizes: list[int] = []
+        real_open = open
+
+        class _SpyFile:
+            def __init__(self, f):
+                self._f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def seek(self, *args):
+                return self._f.seek(*args)
+
+            def read(self, size):
+                read_sizes.append(size)
+                return self._f.read(size)
+
+        monkeypatch.setattr("builtins.open", lambda *a, **kw: _SpyFile(real_open(*a, **kw)))
+        frames = iter_frames_reverse(log, block_size=16)
+        assert next(frames) == '{"turn":7}'
+        assert sum(read_sizes) < 200
+
+
+class TestFrameScanner:
+    def test_whole_log_in_one_chunk(self, sample_lua_log):
+        scanner = FrameScanner()
+        frames = scanner.feed(sample_lua_log.encode())
+        assert [f.payload for f in frames] == extract_frames(sample_lua_log)
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 100])
+    def test_frames_split_across_chunks(self, sample_lua_log, chunk_size):
+        data = sample_lua_log.encode()
+        scanner = FrameScanner()
+        frames = []
+        for i in range(0, len(data), chunk_size):
+            frames.extend(scanner.feed(data[i : i + chunk_size]))
+        assert [f.payload for f in frames] == extract_frames(sample_lua_log)
+
+    def test_offsets_point_at_frames(self, sample_lua_log):
+        data = sample_lua_log.encode()
+        for frame in FrameScanner().feed(data):
+            chunk = data[frame.offset : frame.offset + frame.length]
+            assert chunk.startswith(SENTINEL_BEGIN.encode())
+            assert chunk.endswith(SENTINEL_END.encode())
+
+    def test_start_offset(self):
+        scanner = FrameScanner(offset=100)
+        (frame,) = scanner.feed(f"ab{SENTINEL_BEGIN}{{}}{SENTINEL_END}".encode())
+        assert frame.offset == 102
+        assert scanner.offset == 100 + frame.length + 2
+
+    def test_pending_frame(self):
+        scanner = FrameScanner()
+        assert scanner.feed(f'noise\n{SENTINEL_BEGIN}\n{{"turn"'.encode()) == []
+        assert scanner.pending
+        (frame,) = scanner.feed(f":1}}\n{SENTINEL_END}\n".encode())
+        assert frame.payload == '{"turn":1}'
+        assert not scanner.pending
+
+    def test_noise_is_not_buffered(self):
+        scanner = FrameScanner()
+        for _ in range(100):
+            scanner.feed(b"x" * 1000)
+        assert len(scanner._buf) < len(SENTINEL_BEGIN)
+
+    def test_oversized_frame_dropped(self):
+        scanner = FrameScanner(max_frame_size=64)
+        scanner.feed(f"{SENTINEL_BEGIN}{'x' * 100}".encode())
+        assert scanner.dropped == 1
+        assert not scanner.pending
+        frames = scanner.feed(f"{'x' * 100}{SENTINEL_END}{SENTINEL_BEGIN}{{}}{SENTINEL_END}".encode())
+        assert [f.payload for f in frames] == ["{}"]
+
+    def test_decodes_utf8_payload(self):
+        scanner = FrameScanner()
+        data = f'{SENTINEL_BEGIN}{{"name":"Zürich"}}{SENTINEL_END}'.encode()
+        frames = [f for i in range(len(data)) for f in scanner.feed(data[i : i + 1])]
+        assert frames[0].payload == '{"name":"Zürich"}'
+
+
 class TestParseFrame:
     def test_valid_frame(self):
         raw = '{"version":1,"turn":42,"players":[]}'
@@ -81,3 +222,41 @@ def sample_lua_log():
 
     fixture = Path(__file__).parent / "fixtures" / "sample_lua_log.txt"
     return fixture.read_text()
+
+
+class TestFrameTurn:
+    def test_reads_turn(self):
+        assert frame_turn('{"players":[{"id":0}],"turn":42,"version":1}') == 42
+
+    def test_missing_turn(self):
+        assert frame_turn('{"players":[],"version":1}') is None
+        assert frame_turn('{"turn":"x"}') is None
+
+
+class TestMayBeDelta:
+    def test_delta_frame(self):
+        assert may_be_delta('{"base_turn":4,"kind":"delta","players":{},"turn":5,"version":1}')
+
+    def test_keyframe(self):
+        assert not may_be_delta('{"players":[],"turn":5,"version":1}')
+
+    def test_escaped_quotes_in_values(self):
+        frame = json.dumps({"players": [{"leader": 'the "kind" one'}], "turn": 5, "version": 1})
+        assert not may_be_delta(frame)
+
+
+class TestFrameExport:
+    def test_reads_trailing_export(self):
+        raw = '{"players":[],"turn":3,"version":1,"export":{"finished":10.5,"started":10}}'
+        assert frame_export(raw) == {"finished": 10.5, "started": 10}
+        assert frame_turn(raw) == 3
+
+    def test_frame_without_export(self):
+        assert frame_export('{"players":[],"turn":3,"version":1}') is None
+
+    def test_export_far_from_the_end_is_ignored(self):
+        raw = '{"export":{"started":1},"players":[' + '"x",' * 500 + '"x"],"version":1}'
+        assert frame_export(raw) is None
+
+    def test_broken_export(self):
+        assert frame_export('{"version":1,"export":{"started":}') is None
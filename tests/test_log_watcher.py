@@ -0,0 +1,279 @@
+"""Tests for civ6_bridge.log_watcher — one-shot reads and tailing."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.delta import make_delta
+from civ6_bridge.exceptions import LogNotFoundError
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.lazy_state import LazyGameState
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.watch_backend import WatchBackend
+
+
+def _frame(turn: int) -> str:
+    return f'{SENTINEL_BEGIN}\n{{"version":1,"turn":{turn},"players":[]}}\n{SENTINEL_END}\n'
+
+
+class _AppendingBackend(WatchBackend):
+    """Backend that writes the next piece to the log instead of sleeping."""
+
+    def __init__(self, log: Path, pieces: list[str], mode: str = "a"):
+        self.log = log
+        self.pieces = list(pieces)
+        self.mode = mode
+        self.expect_flags: list[bool] = []
+        self.changed_flags: list[bool] = []
+
+    def wait(self, expect_frame: bool = False) -> bool:
+        if not self.pieces:
+            raise AssertionError("watch() kept waiting after all pieces were written")
+        self.expect_flags.append(expect_frame)
+        with open(self.log, self.mode, encoding="utf-8") as f:
+            f.write(self.pieces.pop(0))
+        return True
+
+    def notify(self, changed: bool) -> None:
+        self.changed_flags.append(changed)
+
+
+def _watch_turns(watcher: LogWatcher, backend: WatchBackend, count: int) -> list[int]:
+    turns = []
+    for state in watcher.watch(poll_interval=0, backend=backend):
+        turns.append(state.turn)
+        if len(turns) == count:
+            break
+    return turns
+
+
+def test_missing_log(tmp_path):
+    with pytest.raises(LogNotFoundError):
+        LogWatcher(tmp_path / "missing.log")
+
+
+def test_read_latest_skips_invalid_frames(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text(_frame(3) + f"{SENTINEL_BEGIN}\n{{broken\n{SENTINEL_END}\n")
+    state = LogWatcher(log).read_latest()
+    assert state is not None
+    assert state.turn == 3
+
+
+class TestWatch:
+    def test_ignores_existing_frames(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_frame(1))
+        assert _watch_turns(LogWatcher(log), _AppendingBackend(log, [_frame(2)]), count=1) == [2]
+
+    def test_frame_split_across_polls(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        frame = _frame(5)
+        backend = _AppendingBackend(log, [frame[:10], frame[10:40], frame[40:]])
+        assert _watch_turns(LogWatcher(log), backend, count=1) == [5]
+        assert backend.expect_flags == [False, False, True]
+        assert backend.changed_flags == [False, True, True]
+
+    def test_burst_larger_than_read_chunk(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("civ6_bridge.log_watcher.READ_CHUNK_SIZE", 16)
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        burst = "".join(_frame(t) for t in range(1, 6))
+        assert _watch_turns(LogWatcher(log), _AppendingBackend(log, [burst]), count=5) == [1, 2, 3, 4, 5]
+
+    def test_truncation_restarts_from_beginning(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("x" * 500)
+        backend = _AppendingBackend(log, [_frame(9)], mode="w")
+        assert _watch_turns(LogWatcher(log), backend, count=1) == [9]
+
+    def test_named_backend(self, tmp_path, monkeypatch):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        monkeypatch.setattr("civ6_bridge.watch_backend.time.sleep", lambda _s: log.write_text(_frame(4)))
+        state = next(LogWatcher(log).watch(poll_interval=0.01, backend="poll"))
+        assert state.turn == 4
+
+
+class TestStepApi:
+    def test_read_new_after_start_tail(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_frame(1))
+        watcher = LogWatcher(log)
+        watcher.start_tail()
+        assert watcher.read_new() == []
+        frame = _frame(2)
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(frame[:30])
+        assert watcher.read_new() == []
+        assert watcher.pending
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(frame[30:])
+        assert [s.turn for s in watcher.read_new()] == [2]
+        assert not watcher.pending
+        assert watcher.position == log.stat().st_size
+
+
+class TestRandomAccess:
+    def test_read_turn(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("".join(_frame(t) for t in (1, 2, 3)))
+        watcher = LogWatcher(log)
+        assert watcher.read_turn(2).turn == 2
+        assert watcher.read_turn(8) is None
+
+    def test_read_turn_skips_invalid_frame(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_frame(1) + f'{SENTINEL_BEGIN}\n{{"turn":2,broken\n{SENTINEL_END}\n')
+        assert LogWatcher(log).read_turn(2) is None
+
+    def test_iter_turns(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("".join(_frame(t) for t in (3, 1, 2, 5)))
+        assert [s.turn for s in LogWatcher(log).iter_turns(2, 5)] == [2, 3]
+
+    def test_sidecar_is_opt_in(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_frame(1))
+        LogWatcher(log).read_turn(1)
+        assert [p.name for p in tmp_path.iterdir()] == ["Lua.log"]
+        LogWatcher(log, persist_index=True).read_turn(1)
+        assert (tmp_path / "Lua.log.c6bidx").exists()
+
+    def test_watch_keeps_index_current(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        watcher = LogWatcher(log)
+        assert _watch_turns(watcher, _AppendingBackend(log, [_frame(1) + _frame(2)]), count=2) == [1, 2]
+        assert watcher.index.turns() == [1, 2]
+        assert watcher.read_turn(1).turn == 1
+
+
+def _state_dict(turn: int) -> dict:
+    units = [{"id": u, "x": turn if u == 1 else 0, "y": 0} for u in (1, 2)]
+    if turn >= 5:
+        units = [units[0], {"id": 9, "x": 1, "y": 1}]
+    player = {"id": 0, "treasury": {"gold_balance": turn * 10}, "units": units, "cities": []}
+    return {"players": [player], "turn": turn, "version": 1}
+
+
+def _keyframe_log(turns: range, interval: int) -> str:
+    """Log text as the mod writes it with CIV6BRIDGE_KEYFRAME_INTERVAL = interval."""
+    text = ""
+    base = None
+    for turn in turns:
+        cur = _state_dict(turn)
+        if base is None or turn - base["turn"] >= interval:
+            base = frame = cur
+        else:
+            frame = {**make_delta(base, cur), "kind": "delta", "base_turn": base["turn"]}
+        text += f"{SENTINEL_BEGIN}\n{json.dumps(frame)}\n{SENTINEL_END}\n"
+    return text
+
+
+class TestDeltaFrames:
+    def _expected(self, turn):
+        return from_dict(_state_dict(turn))
+
+    def test_read_latest_rebuilds_delta(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_keyframe_log(range(1, 7), interval=4))
+        assert LogWatcher(log).read_latest() == self._expected(6)
+
+    def test_random_access(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_keyframe_log(range(1, 10), interval=3))
+        watcher = LogWatcher(log)
+        assert watcher.read_turn(5) == self._expected(5)
+        assert list(watcher.iter_turns(1, 10)) == [self._expected(t) for t in range(1, 10)]
+
+    def test_watch_rebuilds_deltas_after_existing_keyframe(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        text = _keyframe_log(range(1, 7), interval=4)
+        split = text.index(SENTINEL_BEGIN, text.index(SENTINEL_BEGIN) + 1)
+        log.write_text(text[:split])
+        states = []
+        for state in LogWatcher(log).watch(backend=_AppendingBackend(log, [text[split:]])):
+            states.append(state)
+            if len(states) == 5:
+                break
+        assert states == [self._expected(t) for t in range(2, 7)]
+
+    def test_delta_without_keyframe_is_skipped(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        text = _keyframe_log(range(1, 4), interval=4)
+        log.write_text(text[text.index(SENTINEL_BEGIN, 1) :])
+        watcher = LogWatcher(log)
+        assert watcher.read_latest() is None
+        assert list(watcher.iter_turns(0, 10)) == []
+
+    def test_watch_skips_delta_that_does_not_fit_its_keyframe(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        bad = {"turn": 2, "version": 1, "kind": "delta", "base_turn": 1, "players": {"order": [0, 7]}}
+        text = _keyframe_log(range(1, 2), interval=4) + f"{SENTINEL_BEGIN}\n{json.dumps(bad)}\n{SENTINEL_END}\n"
+        text += _keyframe_log(range(3, 4), interval=4)
+        assert _watch_turns(LogWatcher(log), _AppendingBackend(log, [text]), count=2) == [1, 3]
+
+
+class TestLazyStates:
+    def test_read_latest_and_random_access(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text(_keyframe_log(range(1, 8), interval=3))
+        watcher = LogWatcher(log, lazy=True)
+        latest = watcher.read_latest()
+        assert isinstance(latest, LazyGameState)
+        assert latest == from_dict(_state_dict(7))
+        assert watcher.read_turn(5) == from_dict(_state_dict(5))
+        assert list(watcher.iter_turns(1, 8)) == [from_dict(_state_dict(t)) for t in range(1, 8)]
+
+    def test_watch(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        text = _keyframe_log(range(1, 6), interval=2)
+        log.write_text("")
+        states = []
+        for state in LogWatcher(log, lazy=True).watch(backend=_AppendingBackend(log, [text])):
+            states.append(state)
+            if len(states) == 5:
+                break
+        assert all(isinstance(state, LazyGameState) for state in states)
+        assert [state.turn for state in states] == [1, 2, 3, 4, 5]
+        assert states[-1].players[0].units == from_dict(_state_dict(5)).players[0].units
+
+
+def _timed_frame(turn: int, started: float, finished: float) -> str:
+    export = f'"export":{{"build_seconds":0.25,"finished":{finished},"serialize_seconds":0.125,"started":{started}}}'
+    return f'{SENTINEL_BEGIN}\n{{"players":[],"turn":{turn},"version":1,{export}}}\n{SENTINEL_END}\n'
+
+
+class TestFrameMeta:
+    def test_read_new_with_meta(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        watcher = LogWatcher(log)
+        watcher.start_tail()
+        now = time.time()
+        log.write_text(_frame(1) + _timed_frame(2, now - 1.5, now - 1.0))
+        before = time.time()
+        (state1, meta1), (state2, meta2) = watcher.read_new_with_meta()
+        assert (state1.turn, meta1.turn, meta1.offset) == (1, 1, 0)
+        assert meta1.export_started is None and meta1.visibility_lag is None
+        assert (state2.turn, meta2.turn, meta2.offset) == (2, 2, len(_frame(1)))
+        assert meta2.export_seconds == pytest.approx(0.5)
+        assert (meta2.build_seconds, meta2.serialize_seconds) == (0.25, 0.125)
+        assert before <= meta2.read_at <= meta2.parsed_at <= time.time()
+        assert meta2.visibility_lag >= 1.0
+        assert watcher.last_meta == meta2
+
+    def test_watch_with_meta(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        watcher = LogWatcher(log)
+        backend = _AppendingBackend(log, [_timed_frame(7, 1.0, 2.0)])
+        state, meta = next(watcher.watch_with_meta(backend=backend))
+        assert state.turn == meta.turn == 7
+        assert meta.export_seconds == 1.0
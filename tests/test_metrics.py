@@ -0,0 +1,148 @@
+"""Tests for civ6_bridge.metrics and the instrumented pipelines."""
+
+import math
+import threading
+import urllib.request
+
+import pytest
+
+from civ6_bridge import metrics
+from civ6_bridge.civ6_bridge import Civ6Bridge
+from civ6_bridge.commands import GameCommands
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
+from civ6_bridge.fake_tuner import FakeTunerServer
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.metrics import HistogramSnapshot, Metrics, start_http_server
+from civ6_bridge.synthetic import generate_log
+from civ6_bridge.tuner_client import TunerClient
+
+
+@pytest.fixture
+def enabled():
+    metrics.METRICS.reset()
+    metrics.METRICS.enable()
+    yield metrics.METRICS
+    metrics.METRICS.disable()
+    metrics.METRICS.reset()
+
+
+def _snapshot() -> dict:
+    return metrics.METRICS.snapshot()
+
+
+def test_counter_and_histogram():
+    registry = Metrics()
+    counter = registry.counter("requests_total", "Requests", kind="a")
+    assert registry.counter("requests_total", "Requests", kind="a") is counter
+    counter.inc()
+    counter.inc(2)
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value)
+    snap = registry.snapshot()
+    assert snap['requests_total{kind="a"}'] == 3
+    assert snap["latency_seconds"] == HistogramSnapshot(4, 4.05, ((0.1, 1), (1.0, 3), (math.inf, 4)))
+    assert snap["latency_seconds"].mean == pytest.approx(1.0125)
+    assert snap["latency_seconds"].p50 == pytest.approx(0.55)  # halfway through the 0.1–1.0 bucket
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests", kind="a")
+    registry.reset()
+    assert registry.snapshot()["latency_seconds"].count == 0
+
+
+def test_prometheus_text():
+    registry = Metrics()
+    registry.counter("errors_total", "Errors", error="a").inc()
+    registry.counter("errors_total", "Errors", error="b")
+    registry.histogram("rtt_seconds", "RTT", buckets=(0.5,)).observe(0.25)
+    assert registry.to_prometheus().splitlines() == [
+        "# HELP errors_total Errors",
+        "# TYPE errors_total counter",
+        'errors_total{error="a"} 1',
+        'errors_total{error="b"} 0',
+        "# HELP rtt_seconds RTT",
+        "# TYPE rtt_seconds histogram",
+        'rtt_seconds_bucket{le="0.5"} 1',
+        'rtt_seconds_bucket{le="+Inf"} 1',
+        "rtt_seconds_sum 0.25",
+        "rtt_seconds_count 1",
+    ]
+
+
+def test_http_exporter():
+    registry = Metrics()
+    registry.counter("hits_total", "Hits").inc()
+    server = start_http_server(0, metrics=registry)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "hits_total 1" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_log_watcher_metrics(tmp_path, enabled):
+    log = tmp_path / "Lua.log"
+    size = generate_log(log, players=2, cities=2, units=3, turns=6, keyframe_interval=3)
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(f"{SENTINEL_BEGIN}\n{{not json\n{SENTINEL_END}\n")
+        f.write(f'{SENTINEL_BEGIN}\n{{"version":99,"turn":7,"players":[]}}\n{SENTINEL_END}\n')
+    watcher = LogWatcher(log)
+    assert len(watcher.read_new()) == 6
+    snap = _snapshot()
+    assert snap["civ6bridge_log_bytes_read_total"] == log.stat().st_size > size
+    assert snap["civ6bridge_frames_found_total"] == 8
+    assert snap['civ6bridge_frames_skipped_total{error="ParseError"}'] == 1
+    assert snap['civ6bridge_frames_skipped_total{error="SchemaVersionError"}'] == 1
+    assert snap["civ6bridge_decode_frame_seconds"].count == 2  # keyframes
+    assert snap["civ6bridge_from_dict_seconds"].count == 4  # deltas
+    assert snap["civ6bridge_parse_frame_seconds"].count == 4
+    assert snap["civ6bridge_tail_lag_seconds"].count == 1
+
+
+def test_nothing_is_recorded_while_disabled(tmp_path):
+    metrics.METRICS.reset()
+    log = tmp_path / "Lua.log"
+    generate_log(log, players=1, cities=1, units=1, turns=3)
+    LogWatcher(log).read_new()
+    assert all(value == 0 or getattr(value, "count", 1) == 0 for value in _snapshot().values())
+
+
+def test_tuner_metrics(enabled):
+    with FakeTunerServer(port=0) as server:
+        game = GameCommands(TunerClient(port=server.port, pool_size=1))
+        game.end_turn()
+        with pytest.raises(TunerCommandError):
+            game.move_unit(42, 1, 0, 0)
+        with game.batch() as batch:
+            batch.end_turn()
+            batch.set_gold(42, 1)
+    with pytest.raises(TunerConnectionError):
+        TunerClient(port=server.port, timeout=0.5).send_command("Game.AgentPing()")
+    snap = _snapshot()
+    assert snap["civ6bridge_tuner_requests_total"] == 4
+    assert snap["civ6bridge_tuner_round_trip_seconds"].count == 3
+    assert snap['civ6bridge_tuner_errors_total{error="command"}'] == 2
+    assert snap['civ6bridge_tuner_errors_total{error="connection"}'] == 1
+
+
+def test_bridge_stats(tmp_path):
+    log = tmp_path / "Lua.log"
+    log.write_text("")
+    metrics.METRICS.reset()
+    bridge = Civ6Bridge(log_path=log, metrics=True)
+    received = threading.Event()
+    try:
+        bridge.on_turn(lambda state: received.set(), poll_interval=0.05, backend="poll")
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(f'{SENTINEL_BEGIN}\n{{"version":1,"turn":1,"players":[]}}\n{SENTINEL_END}\n')
+        assert received.wait(5)
+        stats = bridge.stats()
+        assert stats["civ6bridge_frames_found_total"] == 1
+        assert stats["civ6bridge_tail_lag_seconds"].count == 1
+    finally:
+        bridge.close()
+        metrics.METRICS.disable()
+        metrics.METRICS.reset()
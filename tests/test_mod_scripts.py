@@ -0,0 +1,156 @@
+"""Tests for the mod's Lua helpers (civ6_mod/Scripts), run under lupa."""
+
+from pathlib import Path
+
+import pytest
+
+lupa = pytest.importorskip("lupa")
+
+SCRIPTS = Path(__file__).parent.parent / "civ6_mod" / "Scripts"
+
+# GameInfo tables are callable (iterate rows) and indexable by row index; "walks" counts iterations
+_MOCK = """
+function make_info(rows)
+    local info = { walks = 0 }
+    for _, row in ipairs(rows) do
+        info[row.Index] = row
+    end
+    return setmetatable(info, { __call = function(self)
+        self.walks = self.walks + 1
+        local i = 0
+        return function()
+            i = i + 1
+            return rows[i]
+        end
+    end })
+end
+
+GameInfo = {
+    Technologies = make_info({
+        { Index = 0, TechnologyType = "TECH_POTTERY" },
+        { Index = 1, TechnologyType = "TECH_WRITING" },
+    }),
+    Units = make_info({ { Index = 0, UnitType = "UNIT_SETTLER" }, { Index = 1, UnitType = "UNIT_WARRIOR" } }),
+    Civics = make_info({ { Index = 0, Type = "CIVIC_CODE_OF_LAWS" } }),
+}
+"""
+
+
+@pytest.fixture
+def lua():
+    runtime = lupa.LuaRuntime()
+    runtime.execute("include = function(name) end; printed = {}; print = function(s) printed[#printed + 1] = s end")
+    runtime.execute("utils = (function() " + (SCRIPTS / "utils.lua").read_text() + " end)()")
+    runtime.execute(_MOCK)
+    return runtime
+
+
+def test_safe_get(lua):
+    lua.execute("obj = { Get = function(self) return 42 end, Fail = function(self) error('boom') end }")
+    assert lua.eval("utils.safe_get(obj, 'Get')") == 42
+    assert lua.eval("utils.safe_get(obj, 'Fail')") is None
+    assert lua.eval("utils.safe_get(obj, 'Missing')") is None
+    assert lua.eval("utils.safe_get(nil, 'Get')") is None
+
+
+def test_type_lookups_walk_each_table_once(lua):
+    assert lua.eval("utils.get_type_name(GameInfo.Technologies, 1, 'TechnologyType')") == "TECH_WRITING"
+    assert lua.eval("utils.get_type_index(GameInfo.Technologies, 'TECH_POTTERY', 'TechnologyType')") == 0
+    assert lua.eval("utils.get_type_name(GameInfo.Technologies, 7, 'TechnologyType')") == "UNKNOWN"
+    assert lua.eval("utils.get_type_index(GameInfo.Technologies, 'TECH_NOPE', 'TechnologyType')") is None
+    assert lua.eval("GameInfo.Technologies.walks") == 1
+    # Rows without the column fall back to row.Type
+    assert lua.eval("utils.get_type_name(GameInfo.Civics, 0, 'CivicType')") == "CIVIC_CODE_OF_LAWS"
+
+
+def test_commands_use_the_lookup_tables(lua):
+    lua.execute("""
+        Game = {}
+        researching, queued = nil, nil
+        local city = { GetBuildQueue = function(self)
+            return { CreateIncompleteUnit = function(_, index) queued = index end }
+        end }
+        Players = { [0] = {
+            GetTechs = function(self) return { SetResearchingTech = function(_, index) researching = index end } end,
+            GetCities = function(self) return { FindID = function(_, id) return id == 5 and city or nil end } end,
+        } }
+    """)
+    lua.execute((SCRIPTS / "agent_commands.lua").read_text())
+    lua.execute("AgentResearchTech(0, 'TECH_WRITING'); AgentResearchTech(0, 'TECH_POTTERY')")
+    lua.execute("AgentProduceUnit(5, 0, 'UNIT_WARRIOR'); AgentResearchTech(0, 'TECH_NOPE')")
+    assert (lua.eval("researching"), lua.eval("queued")) == (0, 1)
+    assert lua.eval("GameInfo.Technologies.walks") == lua.eval("GameInfo.Units.walks") == 1
+    printed = list(lua.eval("printed").values())
+    assert printed[-1] == "CIV6BRIDGE_RESULT:ERR:unknown tech TECH_NOPE:CIV6BRIDGE_END"
+
+
+# -- the headless harness (tests/mod_harness.py) --
+
+
+@pytest.fixture
+def harness():
+    from tests.mod_harness import ModHarness
+
+    return ModHarness()
+
+
+def _game(players=2, cities=3, units=4):
+    from civ6_bridge.synthetic import generate_states
+
+    return next(generate_states(players, cities, units, turns=1, seed=1))
+
+
+def test_harness_export_round_trips(harness):
+    from civ6_bridge.game_state import from_dict
+    from civ6_bridge.log_parser import frame_export, parse_frame
+
+    expected = harness.load_game(_game())
+    raw = harness.export()
+    assert from_dict(parse_frame(raw)) == from_dict(expected)
+    export = frame_export(raw)
+    assert export is not None and export["finished"] >= export["started"]
+
+
+def test_harness_exports_only_buildings_of_the_city_districts(harness):
+    from civ6_bridge.log_parser import parse_frame
+
+    game = _game(players=1, cities=1, units=0)
+    city = game["players"][0]["cities"][0]
+    city["buildings"], city["districts"] = ["BUILDING_LIBRARY", "BUILDING_MONUMENT"], ["DISTRICT_CITY_CENTER"]
+    expected = harness.load_game(game)
+    exported = parse_frame(harness.export())["players"][0]["cities"][0]
+    # The library brings its campus along; buildings come back in catalogue order
+    assert exported["districts"] == ["DISTRICT_CITY_CENTER", "DISTRICT_CAMPUS"]
+    assert exported["buildings"] == ["BUILDING_LIBRARY", "BUILDING_MONUMENT"]
+    assert expected["players"][0]["cities"][0]["districts"] == exported["districts"]
+
+
+def test_harness_commands_change_the_next_export(harness):
+    from civ6_bridge.log_parser import parse_frame
+
+    harness.load_game(_game())
+    assert harness.run("Game.AgentSetGold(0, 500)") == ["CIV6BRIDGE_RESULT:OK:set_gold:CIV6BRIDGE_END"]
+    assert parse_frame(harness.export())["players"][0]["treasury"]["gold_balance"] == 500
+    harness.run("Game.AgentResearchTech(0, 'TECH_ROBOTICS'); Game.AgentEndTurn()")
+    assert parse_frame(harness.export())["players"][0]["science"]["progressing_tech"] == "TECH_ROBOTICS"
+    assert harness.calls[-1] == "RequestAction ACTION_ENDTURN"
+    assert harness.run("Game.AgentSetGold(99, 1)") == ["CIV6BRIDGE_RESULT:ERR:invalid player 99:CIV6BRIDGE_END"]
+
+
+def test_harness_event_hooks_export(harness):
+    from civ6_bridge.constants import SENTINEL_BEGIN
+
+    harness.load_game(_game())
+    assert SENTINEL_BEGIN in harness.fire("PlayerTurnStarted", 0)
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 3])
+def test_measure_export_round_trips_keyframes_and_deltas(keyframe_interval):
+    from tests.mod_harness import measure_export
+
+    m = measure_export(players=3, cities=4, units=8, turns=6, keyframe_interval=keyframe_interval)
+    assert m.mismatched == ()
+    assert len(m.seconds) == len(m.frame_bytes) == 6
+    if keyframe_interval > 1:
+        # Delta frames between keyframes are smaller
+        assert m.frame_bytes[1] < m.frame_bytes[0]
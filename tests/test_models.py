@@ -2,7 +2,17 @@
 
 import pytest
 
-from civ6_bridge.models import City, CultureState, GameState, Player, ReligionState, ScienceState, Treasury, Unit
+from civ6_bridge.models import (
+    City,
+    CultureState,
+    FrameMeta,
+    GameState,
+    Player,
+    ReligionState,
+    ScienceState,
+    Treasury,
+    Unit,
+)
 
 
 class TestTreasury:
@@ -92,3 +102,17 @@ class TestGameState:
         gs = GameState()
         with pytest.raises(AttributeError):
             gs.turn = 99
+
+
+class TestFrameMeta:
+    def test_breakdown(self):
+        meta = FrameMeta(turn=5, read_at=102.0, parsed_at=102.25, export_started=100.0, export_finished=100.5)
+        assert meta.export_seconds == 0.5
+        assert meta.visibility_lag == 1.5
+        assert meta.processing_seconds == 0.25
+        assert meta.total_latency == 2.25
+
+    def test_without_export_timings(self):
+        meta = FrameMeta(turn=5, read_at=1.0, parsed_at=1.5)
+        assert (meta.export_seconds, meta.visibility_lag, meta.total_latency) == (None, None, None)
+        assert meta.processing_seconds == 0.5
@@ -0,0 +1,127 @@
+"""Tests for MultiLogWatcher."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from civ6_bridge.constants import SENTINEL_BEGIN, SENTINEL_END
+from civ6_bridge.exceptions import LogNotFoundError
+from civ6_bridge.multi_log_watcher import MultiLogWatcher
+from civ6_bridge.watch_backend import _load_libc
+
+BACKENDS = ["poll", pytest.param("inotify", marks=pytest.mark.skipif(_load_libc() is None, reason="no inotify"))]
+
+
+def _frame(turn):
+    data = {"version": 1, "turn": turn, "players": []}
+    return f"{SENTINEL_BEGIN}\n{json.dumps(data)}\n{SENTINEL_END}\n"
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def _log(tmp_path, name, turn=0):
+    directory = tmp_path / name
+    directory.mkdir()
+    path = directory / "Lua.log"
+    path.write_text(_frame(turn))
+    return path
+
+
+def _collect(watcher, count, timeout=5.0):
+    """Run watch() on a thread until ``count`` states arrived."""
+    got = []
+    done = threading.Event()
+
+    def run():
+        for item in watcher.watch():
+            got.append(item)
+            if len(got) >= count:
+                done.set()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return got, done, thread
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_yields_states_tagged_with_their_game(tmp_path, backend):
+    a, b = _log(tmp_path, "a"), _log(tmp_path, "b")
+    watcher = MultiLogWatcher({"a": a, "b": b}, poll_interval=0.05, backend=backend)
+    got, done, thread = _collect(watcher, 3)
+    _append(a, _frame(1))
+    _append(b, _frame(7))
+    _append(a, _frame(2))
+    assert done.wait(5)
+    watcher.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert sorted((game, state.turn) for game, state in got) == [("a", 1), ("a", 2), ("b", 7)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_and_remove_while_watching(tmp_path, backend):
+    a, b = _log(tmp_path, "a"), _log(tmp_path, "b")
+    watcher = MultiLogWatcher({"a": a}, poll_interval=5.0, backend=backend)
+    got, done, thread = _collect(watcher, 2)
+    time.sleep(0.05)
+    watcher.add("b", b)
+    watcher.remove("a")
+    assert watcher.games == {"b": b}
+    _append(a, _frame(1))
+    _append(b, _frame(2) + _frame(3))
+    assert done.wait(5)
+    watcher.close()
+    thread.join(5)
+    assert [(game, state.turn) for game, state in got] == [("b", 2), ("b", 3)]
+
+
+def test_only_changed_logs_are_read(tmp_path, monkeypatch):
+    if _load_libc() is None:
+        pytest.skip("no inotify")
+    logs = {i: _log(tmp_path, str(i)) for i in range(20)}
+    watcher = MultiLogWatcher(logs, poll_interval=5.0, backend="inotify")
+    watcher.read_new()
+    reads = []
+    for game_id, log_watcher in watcher._games.items():
+        original = log_watcher.read_new
+        monkeypatch.setattr(log_watcher, "read_new", lambda g=game_id, f=original: reads.append(g) or f())
+    _append(logs[3], _frame(1))
+    watcher.wait()
+    assert [(game, state.turn) for game, state in watcher.read_new()] == [(3, 1)]
+    assert reads == [3]
+    watcher.close()
+
+
+def test_thread_count_does_not_grow(tmp_path):
+    before = threading.active_count()
+    watcher = MultiLogWatcher({i: _log(tmp_path, str(i)) for i in range(30)}, backend="poll")
+    watcher.read_new()
+    assert threading.active_count() == before
+    watcher.close()
+
+
+def test_bad_games(tmp_path):
+    a = _log(tmp_path, "a")
+    watcher = MultiLogWatcher({"a": a}, backend="poll")
+    with pytest.raises(ValueError, match="already watched"):
+        watcher.add("a", a)
+    with pytest.raises(LogNotFoundError):
+        watcher.add("b", tmp_path / "missing.log")
+    with pytest.raises(KeyError):
+        watcher.remove("b")
+    watcher.close()
+    with pytest.raises(RuntimeError):
+        watcher.add("c", a)
+    assert list(watcher.watch()) == []
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        MultiLogWatcher(backend="kqueue")
+    with pytest.raises(ValueError):
+        MultiLogWatcher(poll_interval=0)
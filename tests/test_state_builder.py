@@ -0,0 +1,85 @@
+"""Tests for civ6_bridge.state_builder — structural sharing between consecutive states."""
+
+import json
+
+import pytest
+
+from civ6_bridge.delta import make_delta
+from civ6_bridge.exceptions import ParseError
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.state_builder import StateBuilder
+
+
+def _state(turn: int, gold: float = 10.0, unit_x: int = 0) -> dict:
+    player = {
+        "id": 0,
+        "civilization": "CIVILIZATION_ROME",
+        "treasury": {"gold_balance": gold},
+        "cities": [{"id": 1, "name": "Rome", "population": 3, "buildings": ["BUILDING_MONUMENT"]}],
+        "units": [
+            {"id": 1, "type": "UNIT_WARRIOR", "x": unit_x, "moves_remaining": 2},
+            {"id": 2, "type": "UNIT_SETTLER", "x": 5, "moves_remaining": 2},
+        ],
+    }
+    other = {"id": 1, "civilization": "CIVILIZATION_EGYPT", "units": [{"id": 1, "type": "UNIT_WARRIOR"}]}
+    # Round-trip through JSON so every frame has its own string and dict objects
+    return json.loads(json.dumps({"players": [player, other], "turn": turn, "version": 1}))
+
+
+def test_matches_from_dict():
+    builder = StateBuilder()
+    for data in [_state(1), _state(2, unit_x=1), _state(3, gold=20.0)]:
+        assert builder.build(data) == from_dict(data)
+
+
+def test_coerces_like_from_dict():
+    data = _state(1)
+    data["players"][0]["units"][0].update(x="3", moves_remaining=1.5)
+    data["players"][0]["cities"][0]["population"] = 4.0
+    data["players"][1]["treasury"] = []  # json.lua's empty table
+    state = StateBuilder().build(data)
+    assert state == from_dict(data)
+    assert state.players[0].units[0].x == 3
+    assert type(state.players[0].units[0].moves_remaining) is int
+
+
+def test_unchanged_objects_are_reused():
+    builder = StateBuilder()
+    first = builder.build(_state(1))
+    second = builder.build(_state(2, unit_x=1))
+    p1, p2 = first.players[0], second.players[0]
+    assert p2 is not p1
+    assert p2.units[0] is not p1.units[0]
+    assert p2.units[1] is p1.units[1]
+    assert p2.cities is p1.cities
+    assert p2.treasury is p1.treasury
+    # Nothing about player 1 changed, so the whole Player is shared
+    assert second.players[1] is first.players[1]
+
+
+def test_only_previous_build_is_remembered():
+    builder = StateBuilder()
+    first = builder.build(_state(1))
+    builder.build(_state(2, gold=99.0))
+    third = builder.build(_state(3))
+    assert third.players[0].treasury == first.players[0].treasury
+    assert third.players[0].treasury is not first.players[0].treasury
+    assert third.players[0].units[0] is first.players[0].units[0]
+
+
+def test_strings_are_interned():
+    builder = StateBuilder()
+    a = builder.build(_state(1)).players[0]
+    b = builder.build(_state(2, gold=1.0, unit_x=7)).players[0]
+    assert a.units[0].type is b.units[0].type
+    assert a.civilization is b.civilization
+    assert builder.build(_state(3)).players[1].units[0].type is a.units[0].type
+
+
+def test_delta_frames():
+    base, cur = _state(1), _state(2, unit_x=4)
+    delta = {**make_delta(base, cur), "kind": "delta", "base_turn": 1}
+    builder = StateBuilder()
+    assert builder.build(delta, base=base) == from_dict(cur)
+    with pytest.raises(ParseError):
+        builder.build(delta)
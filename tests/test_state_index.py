@@ -0,0 +1,73 @@
+"""Tests for civ6_bridge.state_index — id and tile lookups."""
+
+import pytest
+
+from civ6_bridge.models import City, GameState, Player, Unit
+from civ6_bridge.state_index import GameStateIndex
+
+
+@pytest.fixture
+def state():
+    rome = Player(
+        id=0,
+        is_human=True,
+        cities=(City(id=1, name="Rome", x=10, y=10, owner_id=0), City(id=2, name="Antium", x=14, y=9, owner_id=0)),
+        units=(
+            Unit(id=1, type="UNIT_WARRIOR", x=10, y=10, owner_id=0),
+            Unit(id=2, type="UNIT_BUILDER", x=10, y=10, owner_id=0),
+            Unit(id=3, type="UNIT_SCOUT", x=20, y=5, owner_id=0),
+        ),
+    )
+    egypt = Player(
+        id=1,
+        cities=(City(id=1, name="Thebes", x=30, y=30, owner_id=1),),
+        units=(Unit(id=1, type="UNIT_ARCHER", x=20, y=5, owner_id=1),),
+    )
+    return GameState(turn=12, players=(rome, egypt))
+
+
+def test_players(state):
+    index = GameStateIndex(state)
+    assert index.player(1) is state.players[1]
+    assert index.player(7) is None
+    assert index.human_player() is state.players[0]
+
+
+def test_ids_are_per_owner(state):
+    index = GameStateIndex(state)
+    assert index.unit(0, 1).type == "UNIT_WARRIOR"
+    assert index.unit(1, 1).type == "UNIT_ARCHER"
+    assert index.city(1, 1).name == "Thebes"
+    assert index.unit(0, 99) is None
+    assert index.city(5, 1) is None
+
+
+def test_tiles(state):
+    index = GameStateIndex(state)
+    assert [u.type for u in index.units_at(10, 10)] == ["UNIT_WARRIOR", "UNIT_BUILDER"]
+    assert [u.owner_id for u in index.units_at(20, 5)] == [0, 1]
+    assert index.units_at(0, 0) == ()
+    assert index.city_at(14, 9).name == "Antium"
+    assert index.city_at(0, 0) is None
+
+
+def test_owner_views(state):
+    index = GameStateIndex(state)
+    egypt = index.of(1)
+    assert egypt.player is state.players[1]
+    assert [u.type for u in egypt.units_at(20, 5)] == ["UNIT_ARCHER"]
+    assert egypt.city_at(10, 10) is None
+    assert egypt.units == state.players[1].units
+    assert index.of(1) is egypt
+    missing = index.of(9)
+    assert missing.player is None
+    assert missing.unit(1) is None
+    assert missing.units_at(10, 10) == ()
+
+
+def test_maps_are_built_on_first_use(state):
+    index = GameStateIndex(state)
+    index.unit(0, 1)
+    assert "_units_by_tile" not in vars(index)
+    index.units_at(10, 10)
+    assert "_units_by_tile" in vars(index)
@@ -0,0 +1,55 @@
+"""Tests for the synthetic log generator."""
+
+import pytest
+
+from civ6_bridge.diff import diff
+from civ6_bridge.game_state import from_dict
+from civ6_bridge.log_parser import extract_frames, parse_frame
+from civ6_bridge.log_watcher import LogWatcher
+from civ6_bridge.synthetic import generate_log, generate_states
+
+
+def test_states_have_the_requested_size():
+    states = list(generate_states(players=3, cities=4, units=10, turns=5, start_turn=50))
+    assert [s["turn"] for s in states] == [50, 51, 52, 53, 54]
+    for data in states:
+        state = from_dict(data)
+        assert len(state.players) == 3
+        assert all(len(p.cities) == 4 and len(p.units) == 10 for p in state.players)
+
+
+def test_consecutive_states_change_a_little():
+    first, second = (from_dict(d) for d in generate_states(players=4, cities=5, units=30, turns=2))
+    changes = diff(first, second)
+    assert changes
+    assert len(changes) < 4 * (5 + 30)
+
+
+def test_same_seed_same_game():
+    assert list(generate_states(turns=3, seed=7)) == list(generate_states(turns=3, seed=7))
+    assert list(generate_states(turns=3, seed=7)) != list(generate_states(turns=3, seed=8))
+
+
+def test_log_with_noise(tmp_path):
+    log = tmp_path / "Lua.log"
+    size = generate_log(log, players=2, cities=2, units=3, turns=4, noise_lines=5)
+    assert size == log.stat().st_size
+    text = log.read_text()
+    frames = extract_frames(text)
+    assert len(frames) == 4
+    assert len(text.splitlines()) == 4 * (5 + 3)
+    assert [parse_frame(f)["turn"] for f in frames] == [1, 2, 3, 4]
+
+
+def test_keyframe_interval_writes_deltas_that_rebuild_the_game(tmp_path):
+    full, packed = tmp_path / "full.log", tmp_path / "delta.log"
+    generate_log(full, players=2, cities=3, units=8, turns=7)
+    generate_log(packed, players=2, cities=3, units=8, turns=7, keyframe_interval=3)
+    assert sum('"kind"' in f for f in extract_frames(packed.read_text())) == 4
+    assert packed.stat().st_size < full.stat().st_size
+    assert list(LogWatcher(packed).iter_turns(0, 10)) == list(LogWatcher(full).iter_turns(0, 10))
+
+
+def test_bad_keyframe_interval(tmp_path):
+    with pytest.raises(ValueError):
+        generate_log(tmp_path / "Lua.log", keyframe_interval=0)
@@ -1,13 +1,25 @@
 """Tests for the FireTuner TCP client."""
 
+import socket
 import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from civ6_bridge.constants import TUNER_MSG_TYPE
 from civ6_bridge.exceptions import TunerCommandError, TunerConnectionError
-from civ6_bridge.tuner_client import TunerClient, build_message, parse_response
+from civ6_bridge.tuner_client import (
+    ResponseDecoder,
+    TunerClient,
+    TunerConnection,
+    TunerConnectionPool,
+    build_message,
+    parse_response,
+    parse_results,
+)
 
 
 class TestBuildMessage:
@@ -72,6 +84,58 @@ class TestParseResponse:
         assert parse_response(b"") == ""
 
 
+class TestParseResults:
+    def test_all_results_in_order(self):
+        data = b"CIV6BRIDGE_RESULT:#1:OK:a:CIV6BRIDGE_END\x00\x01CIV6BRIDGE_RESULT:#2:ERR:b:CIV6BRIDGE_END"
+        assert parse_results(data) == ["#1:OK:a", "#2:ERR:b"]
+
+    def test_ignores_truncated_result(self):
+        assert parse_results(b"CIV6BRIDGE_RESULT:PONG:CIV6BRIDGE_END CIV6BRIDGE_RESULT:PO") == ["PONG"]
+
+    def test_no_results(self):
+        assert parse_results(b"plain text") == []
+
+
+def _framed(payload: bytes) -> bytes:
+    return struct.pack("<II", len(payload), 1) + payload
+
+
+class TestResponseDecoder:
+    def test_yields_every_result(self):
+        data = _framed(b"CIV6BRIDGE_RESULT:#1:OK:a:CIV6BRIDGE_END\nCIV6BRIDGE_RESULT:#2:OK:b:CIV6BRIDGE_END")
+        assert ResponseDecoder().feed(data) == ["#1:OK:a", "#2:OK:b"]
+
+    @pytest.mark.parametrize("step", [1, 5, 13])
+    def test_incremental_feeds(self, step):
+        data = b"".join(_framed(b"\x01CIV6BRIDGE_RESULT:#%d:OK:CIV6BRIDGE_END\x00" % i) for i in range(1, 6))
+        decoder = ResponseDecoder()
+        results = [r for i in range(0, len(data), step) for r in decoder.feed(data[i : i + step])]
+        assert results == [f"#{i}:OK" for i in range(1, 6)]
+        assert decoder.count == 5
+
+    def test_result_split_across_messages(self):
+        decoder = ResponseDecoder()
+        assert decoder.feed(_framed(b"CIV6BRIDGE_RESULT:PO")) == []
+        assert decoder.feed(_framed(b"NG:CIV6BRIDGE_END")) == ["PONG"]
+
+    def test_headers_do_not_leak_into_results(self):
+        # A length of 0x41 would read as "A" if headers were treated as text
+        payload = b"CIV6BRIDGE_RESULT:" + b"x" * 38 + b":CIV6BRIDGE_END"
+        decoder = ResponseDecoder()
+        assert decoder.feed(_framed(payload[:10]) + _framed(payload[10:])) == ["x" * 38]
+
+    def test_keep_payload_strips_headers(self):
+        decoder = ResponseDecoder(keep_payload=True)
+        decoder.feed(_framed(b"\x01CIV6BRIDGE_RESULT:OK") + _framed(b":CIV6BRIDGE_END")[:5])
+        assert decoder.payload == b"\x01CIV6BRIDGE_RESULT:OK"
+        assert decoder.count == 0
+
+    def test_unframed_stream(self):
+        decoder = ResponseDecoder(framed=False)
+        assert decoder.feed(b"junk CIV6BRIDGE_RESULT:O") == []
+        assert decoder.feed(b"K:CIV6BRIDGE_END tail") == ["OK"]
+
+
 class TestSendCommand:
     @patch("civ6_bridge.tuner_client.socket.socket")
     def test_send_command_flow(self, mock_socket_class):
@@ -118,3 +182,219 @@ class TestIsConnected:
 
         client = TunerClient()
         assert client.is_connected() is False
+
+
+def _recv_exactly(sock, size):
+    buf = b""
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionResetError("client closed the connection")
+        buf += chunk
+    return buf
+
+
+def _read_message(sock):
+    """Payload of one length-prefixed FireTuner message."""
+    length, _msg_type = struct.unpack("<II", _recv_exactly(sock, 8))
+    return _recv_exactly(sock, length)
+
+
+class _FramedServer:
+    """Minimal keep-alive server replying with framed messages per command.
+
+    ``reply`` returns the reply body, a list of bodies sent as separate messages
+    ``pause`` seconds apart, or None to close the connection without replying.
+    """
+
+    def __init__(
+        self,
+        reply=lambda lua: b"CIV6BRIDGE_RESULT:OK:" + lua + b":CIV6BRIDGE_END",
+        close_after=None,
+        pause=0.0,
+    ):
+        self.reply = reply
+        self.close_after = close_after
+        self.pause = pause
+        self.connections = 0
+        self.commands: list[bytes] = []
+        self.disconnected = threading.Semaphore(0)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            self._serve_commands(conn)
+        finally:
+            conn.close()
+            self.disconnected.release()
+
+    def _serve_commands(self, conn):
+        served = 0
+        while True:
+            try:
+                payload = _read_message(conn)
+            except OSError:
+                return
+            with self._lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            lua = payload.rstrip(b"\x00").split(b":", 2)[2]
+            self.commands.append(lua)
+            body = self.reply(lua)
+            if body is None:
+                return
+            for i, part in enumerate(body if isinstance(body, list) else [body]):
+                if i:
+                    time.sleep(self.pause)
+                try:
+                    conn.sendall(struct.pack("<II", len(part), 1) + part)
+                except OSError:
+                    return
+            with self._lock:
+                self.active -= 1
+            served += 1
+            if self.close_after is not None and served >= self.close_after:
+                return
+
+    def close(self):
+        self._listener.close()
+
+
+@pytest.fixture
+def framed_server():
+    servers = []
+
+    def start(**kwargs):
+        server = _FramedServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+class TestTunerConnection:
+    def test_reuses_socket(self, framed_server):
+        server = framed_server()
+        with TunerConnection(port=server.port) as conn:
+            assert [conn.send_command(f"f({i})") for i in range(20)] == [f"OK:f({i})" for i in range(20)]
+        assert server.connections == 1
+
+    def test_reconnects_after_server_close(self, framed_server):
+        server = framed_server(close_after=1)
+        with TunerConnection(port=server.port) as conn:
+            assert conn.send_command("a()") == "OK:a()"
+            assert server.disconnected.acquire(timeout=5)
+            assert conn.send_command("b()") == "OK:b()"
+        assert server.connections == 2
+
+    def test_waits_for_result_split_across_messages(self, framed_server):
+        server = framed_server(reply=lambda lua: [b"CIV6BRIDGE_RESULT:PO", b"NG:CIV6BRIDGE_END"], pause=0.2)
+        with TunerConnection(port=server.port) as conn:
+            assert conn.send_command("x()") == "PONG"
+            assert conn.send_command("y()") == "PONG"
+        assert server.connections == 1
+
+    def test_late_reply_does_not_leak_into_next_command(self, framed_server):
+        def reply(lua):
+            if lua == b"slow()":
+                return [b"", b"CIV6BRIDGE_RESULT:OK:slow:CIV6BRIDGE_END"]
+            return b"CIV6BRIDGE_RESULT:OK:" + lua + b":CIV6BRIDGE_END"
+
+        server = framed_server(reply=reply, pause=0.3)
+        with TunerConnection(port=server.port, timeout=0.1) as conn:
+            with pytest.raises(TunerConnectionError, match="timed out"):
+                conn.send_command("slow()")
+            assert not conn.connected
+            time.sleep(0.3)
+            assert conn.send_command("fast()") == "OK:fast()"
+
+    def test_stale_reply_is_discarded_before_sending(self, framed_server):
+        server = framed_server(reply=lambda lua: [b"CIV6BRIDGE_RESULT:OK:" + lua + b":CIV6BRIDGE_END", b"junk"])
+        with TunerConnection(port=server.port) as conn:
+            assert conn.send_command("a()") == "OK:a()"
+            time.sleep(0.05)
+            assert conn.send_command("b()") == "OK:b()"
+        assert server.connections == 1
+
+    def test_reply_without_result_returns_what_arrived(self, framed_server):
+        server = framed_server(reply=lambda lua: b"CIV6BRIDGE_RESULT:PO")
+        with TunerConnection(port=server.port, timeout=0.1) as conn:
+            assert conn.send_command("x()") == "CIV6BRIDGE_RESULT:PO"
+            assert not conn.connected
+
+    def test_no_resend_after_command_was_sent(self, framed_server):
+        server = framed_server(reply=lambda lua: None if lua == b"b()" else b"CIV6BRIDGE_RESULT:OK:CIV6BRIDGE_END")
+        with TunerConnection(port=server.port) as conn:
+            conn.send_command("a()")
+            with pytest.raises(TunerConnectionError):
+                conn.send_command("b()")
+        assert server.commands.count(b"b()") == 1
+
+    def test_command_error_keeps_connection(self, framed_server):
+        server = framed_server(reply=lambda lua: b"CIV6BRIDGE_RESULT:ERR:nope:CIV6BRIDGE_END")
+        with TunerConnection(port=server.port) as conn:
+            for _ in range(2):
+                with pytest.raises(TunerCommandError, match="nope"):
+                    conn.send_command("x()")
+        assert server.connections == 1
+
+    def test_send_raw_waits_for_expected_results(self, framed_server):
+        def reply(lua):
+            return b"".join(b"CIV6BRIDGE_RESULT:#%d:OK:CIV6BRIDGE_END" % i for i in range(1, 4))
+
+        server = framed_server(reply=reply)
+        with TunerConnection(port=server.port) as conn:
+            raw = conn.send_raw("batch()", expected_results=3)
+        assert len(parse_results(raw)) == 3
+
+    def test_reply_is_complete_without_waiting_for_more_data(self, framed_server):
+        server = framed_server(reply=lambda lua: b"CIV6BRIDGE_RESULT:OK:CIV6BRIDGE_END")
+        with TunerConnection(port=server.port, timeout=5.0) as conn:
+            start = time.monotonic()
+            for _ in range(10):
+                assert conn.send_command("x()") == "OK"
+            assert time.monotonic() - start < 1.0
+
+    def test_connection_refused(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with pytest.raises(TunerConnectionError, match="Cannot connect"):
+            TunerConnection(port=port).send_command("x()")
+
+
+class TestTunerConnectionPool:
+    def test_concurrent_callers_share_bounded_connections(self, framed_server):
+        server = framed_server()
+        pool = TunerConnectionPool(port=server.port, size=3)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: pool.send_command(f"f({i})"), range(100)))
+        pool.close()
+        assert results == [f"OK:f({i})" for i in range(100)]
+        assert server.connections <= 3
+        assert server.max_active <= 3
+
+    def test_client_uses_pool(self, framed_server):
+        server = framed_server()
+        client = TunerClient(port=server.port, pool_size=2)
+        for _ in range(10):
+            assert client.send_command("Game.AgentPing()") == "OK:Game.AgentPing()"
+        client.close()
+        assert server.connections == 1
@@ -0,0 +1,145 @@
+"""Tests for civ6_bridge.watch_backend — adaptive polling and inotify wake-ups."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from civ6_bridge.watch_backend import InotifyBackend, PollingBackend, WatchBackend, _load_libc, create_backend
+
+requires_inotify = pytest.mark.skipif(_load_libc() is None, reason="inotify not available")
+
+
+class TestPollingBackend:
+    def test_backs_off_while_idle(self):
+        backend = PollingBackend(min_interval=0.1, max_interval=1.0, backoff=2.0)
+        intervals = []
+        for _ in range(6):
+            backend.notify(changed=False)
+            intervals.append(backend.interval)
+        assert intervals == [0.2, 0.4, 0.8, 1.0, 1.0, 1.0]
+
+    def test_resets_on_change(self):
+        backend = PollingBackend(min_interval=0.1, max_interval=1.0, backoff=2.0)
+        backend.interval = 1.0
+        backend.notify(changed=True)
+        assert backend.interval == 0.1
+
+    def test_tightens_when_frame_expected(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr("civ6_bridge.watch_backend.time.sleep", slept.append)
+        backend = PollingBackend(min_interval=0.1, max_interval=1.0)
+        backend.interval = 1.0
+        backend.wait(expect_frame=True)
+        assert slept == [0.1]
+
+    def test_min_interval_capped_by_max(self):
+        assert PollingBackend(min_interval=0.5, max_interval=0.2).interval == 0.2
+
+    def test_rejects_zero_interval(self):
+        with pytest.raises(ValueError):
+            PollingBackend(max_interval=0)
+
+
+def test_backend_must_implement_wait():
+    class _NoWait(WatchBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        _NoWait()
+
+
+class TestCreateBackend:
+    def test_poll(self, tmp_path):
+        backend = create_backend(tmp_path / "Lua.log", poll_interval=2.0, kind="poll")
+        assert isinstance(backend, PollingBackend)
+        assert backend.max_interval == 2.0
+
+    def test_unknown_kind(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown watch backend"):
+            create_backend(tmp_path / "Lua.log", kind="kqueue")
+
+    def test_auto_falls_back_to_polling(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("civ6_bridge.watch_backend._load_libc", lambda: None)
+        assert isinstance(create_backend(tmp_path / "Lua.log"), PollingBackend)
+
+    @pytest.mark.parametrize("kind", ["auto", "inotify", "poll"])
+    def test_rejects_zero_interval(self, tmp_path, kind):
+        with pytest.raises(ValueError, match="poll_interval must be positive"):
+            create_backend(tmp_path / "Lua.log", poll_interval=0, kind=kind)
+
+    def test_inotify_required(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("civ6_bridge.watch_backend._load_libc", lambda: None)
+        with pytest.raises(OSError):
+            create_backend(tmp_path / "Lua.log", kind="inotify")
+
+
+@requires_inotify
+class TestInotifyBackend:
+    def test_wakes_on_append(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        backend = InotifyBackend(log, timeout=5.0)
+        try:
+            timer = threading.Timer(0.05, lambda: log.write_text("hello"))
+            timer.start()
+            start = time.monotonic()
+            assert backend.wait() is True
+            assert time.monotonic() - start < 2.0
+            timer.join()
+        finally:
+            backend.close()
+
+    def test_ignores_other_files(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        backend = InotifyBackend(log, timeout=0.2)
+        try:
+            (tmp_path / "Other.log").write_text("noise")
+            assert backend.wait() is False
+        finally:
+            backend.close()
+
+    def test_survives_recreated_log(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("old")
+        backend = InotifyBackend(log, timeout=0.5)
+        try:
+            log.unlink()
+            backend.read_events()
+            log.write_text("new")
+            assert backend.wait() is True
+        finally:
+            backend.close()
+
+    def test_wait_async_is_cancellable(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        backend = InotifyBackend(log, timeout=30.0)
+
+        async def scenario() -> None:
+            task = asyncio.create_task(backend.wait_async())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(task, 5)
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            backend.close()
+
+    def test_wait_async_wakes_on_append(self, tmp_path):
+        log = tmp_path / "Lua.log"
+        log.write_text("")
+        backend = InotifyBackend(log, timeout=5.0)
+
+        async def scenario() -> bool:
+            asyncio.get_running_loop().call_later(0.05, log.write_text, "hello")
+            return await asyncio.wait_for(backend.wait_async(), 5)
+
+        try:
+            assert asyncio.run(scenario()) is True
+        finally:
+            backend.close()